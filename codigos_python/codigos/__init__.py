@@ -1,3 +1,16 @@
-from .syllable import word2syllables, stressed_syllable
+from .syllable import word2syllables, stressed_syllable, cache_info, cache_clear, set_cache_maxsize
 
-__all__ = ["word2syllables", "stressed_syllable"]
+__all__ = ["word2syllables", "stressed_syllable", "cache_info", "cache_clear", "set_cache_maxsize",
+           "analyze_many"]
+
+
+def __getattr__(name):
+    # analyze_many pulls in numpy and the process pool; load it only when asked for
+    if name == "analyze_many":
+        from .lote import analyze_many
+        return analyze_many
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | {"analyze_many"})
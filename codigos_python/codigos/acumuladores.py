@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Acumuladores de uma passada para as estatísticas do corpus.
+
+Acumulador guarda a contagem e as somas exatas dos valores e dos quadrados,
+como razões inteiras agrupadas por denominador (a mesma representação de
+statistics._ss): memória limitada pelo número de expoentes distintos,
+atualização O(1) por documento. A média e o desvio padrão saem dessas somas
+com um arredondamento só, bit a bit os de statistics.mean e statistics.stdev,
+e estados parciais (de workers ou de partes do corpus) se combinam com
+``combinar`` em qualquer ordem.
+
+A correlação de statistics.correlation não é exata (centra os valores na
+média já arredondada), então AcumuladorCorrelacao guarda os pares em arrays
+de double (16 bytes por documento) e aplica a própria função no fim.
+"""
+from __future__ import annotations
+
+import math
+import statistics
+import sys
+from array import array
+from collections import defaultdict
+from fractions import Fraction
+from typing import Dict
+
+
+# o _sqrt_bit_width de statistics: mantissa dobrada e três bits de guarda
+_BITS_RAIZ = 2 * sys.float_info.mant_dig + 3
+
+
+def _raiz_de_fracao(n: int, m: int) -> float:
+    """Raiz quadrada de n/m corretamente arredondada (como statistics.stdev)."""
+    # raiz inteira com arredondamento para ímpar e bits de sobra; a divisão final arredonda uma vez
+    q = (n.bit_length() - m.bit_length() - _BITS_RAIZ) // 2
+    if q >= 0:
+        return float(_raiz_inteira_impar(n, m << 2 * q) << q)
+    return _raiz_inteira_impar(n << -2 * q, m) / (1 << -q)
+
+
+def _raiz_inteira_impar(n: int, m: int) -> int:
+    a = math.isqrt(n // m)
+    return a | (a * a * m != n)
+
+
+class Acumulador:
+    """Contagem, média e variância amostral de uma sequência de valores."""
+
+    __slots__ = ("n", "_soma", "_soma_quadrados", "_especial")
+
+    def __init__(self):
+        self.n = 0
+        # denominador (potência de 2) -> soma dos numeradores
+        self._soma: Dict[int, int] = defaultdict(int)
+        self._soma_quadrados: Dict[int, int] = defaultdict(int)
+        self._especial = None  # soma dos inf/nan, que não têm razão inteira
+
+    def adicionar(self, x: float) -> None:
+        self.n += 1
+        if not math.isfinite(x):
+            self._especial = x if self._especial is None else self._especial + x
+            return
+        numerador, denominador = x.as_integer_ratio()
+        self._soma[denominador] += numerador
+        self._soma_quadrados[denominador] += numerador * numerador
+
+    def combinar(self, outro: "Acumulador") -> "Acumulador":
+        """Incorpora ``outro`` a este acumulador (in-place) e devolve ``self``."""
+        self.n += outro.n
+        for denominador, numerador in outro._soma.items():
+            self._soma[denominador] += numerador
+        for denominador, numerador in outro._soma_quadrados.items():
+            self._soma_quadrados[denominador] += numerador
+        if outro._especial is not None:
+            self._especial = outro._especial if self._especial is None else self._especial + outro._especial
+        return self
+
+    def _total(self) -> Fraction:
+        return sum((Fraction(n, d) for d, n in self._soma.items()), Fraction(0))
+
+    @property
+    def media(self) -> float:
+        """Soma exata / n, arredondada uma vez só (como statistics.mean)."""
+        if self.n == 0:
+            return 0.0
+        if self._especial is not None:
+            return self._especial / self.n
+        return float(self._total() / self.n)
+
+    def _quadrados_medios(self) -> Fraction:
+        """Soma exata dos quadrados dos desvios / (n - 1), como em statistics._ss."""
+        total = self._total()
+        quadrados = sum((Fraction(n, d * d) for d, n in self._soma_quadrados.items()), Fraction(0))
+        return (self.n * quadrados - total * total) / self.n / (self.n - 1)
+
+    @property
+    def variancia(self) -> float:
+        if self.n < 2:
+            return 0
+        if self._especial is not None:
+            return math.nan
+        return float(self._quadrados_medios())
+
+    @property
+    def desvio_padrao(self) -> float:
+        if self.n < 2:
+            return 0
+        if self._especial is not None:
+            return math.nan
+        quadrados_medios = self._quadrados_medios()
+        return _raiz_de_fracao(quadrados_medios.numerator, quadrados_medios.denominator)
+
+    def resumo(self):
+        """``(media, desvio_padrao, n)`` como em calcular_estatisticas; zeros se vazio."""
+        if self.n == 0:
+            return 0, 0, 0
+        return self.media, self.desvio_padrao, self.n
+
+
+class AcumuladorPositivos(Acumulador):
+    """Acumulador que ignora valores <= 0 (o filtro usado nos relatórios)."""
+
+    __slots__ = ()
+
+    def adicionar(self, x: float) -> None:
+        if x > 0:
+            Acumulador.adicionar(self, x)
+
+
+class AcumuladorCorrelacao:
+    """Pares ``(x, y)`` para a correlação de Pearson de statistics.correlation."""
+
+    __slots__ = ("x", "y")
+
+    def __init__(self):
+        self.x = array("d")
+        self.y = array("d")
+
+    @property
+    def n(self) -> int:
+        return len(self.x)
+
+    def adicionar(self, x: float, y: float) -> None:
+        self.x.append(x)
+        self.y.append(y)
+
+    def combinar(self, outro: "AcumuladorCorrelacao") -> "AcumuladorCorrelacao":
+        # statistics.correlation só usa fsum e termos independentes: a ordem dos pares não importa
+        self.x.extend(outro.x)
+        self.y.extend(outro.y)
+        return self
+
+    def correlacao(self) -> float:
+        """Pearson; 0 com menos de dois pares ou se uma das séries for constante."""
+        if self.n < 2:
+            return 0
+        try:
+            return statistics.correlation(self.x, self.y)
+        except statistics.StatisticsError:
+            return 0
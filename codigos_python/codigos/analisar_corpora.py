@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+Driver único dos corpora: analisa um ou mais corpora no mesmo processo e
+grava os relatórios de cada um.
+
+    python analisar_corpora.py --xml C:/IC/data --json C:/IC/ChatgptTurbo \\
+        --saida C:/IC/Resultados --workers 4
+
+Cada corpus é lido por um Adaptador (subpastas com prompt.xml, pasta de
+.json ou pasta de .txt). Os corpora são analisados em sequência, no mesmo
+processo e, com workers, no mesmo pool: o cache de silabação aquecido por
+um corpus serve aos seguintes, e o vocabulário de ids (vocabulario.py) é
+um só para todos. Os relatórios de cada corpus vão para
+``SAIDA/<nome da pasta do corpus>``; com ``--formato csv|jsonl|parquet`` vai
+junto ``documentos.<formato>``, uma linha por documento (saida_documentos.py).
+
+Com ``--empacotar`` cada corpus é antes tokenizado para ``SAIDA/<nome>.pack``
+(pacote.py) e analisado a partir dele; ``--pacote SAIDA/<nome>.pack`` refaz a
+análise depois sem abrir os arquivos originais, com os mesmos relatórios.
+
+Codigo_IC_Original.py e Codigo_IC_sintetico.py são este driver com o
+adaptador e os caminhos de cada corpus fixos.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from contextlib import ExitStack
+from dataclasses import dataclass, replace
+from functools import partial
+from typing import Callable, Iterator, List, Optional
+
+try:
+    from .checkpoint import abrir_checkpoint
+    from .corpus import analisar_corpus
+    from .fontes import Documento, fonte_pacote, fonte_pasta_json, fonte_pasta_texto, fonte_pastas_xml
+    from .lexicon import lexicon_enabled
+    from .pacote import Pacote, empacotar
+    from .paralelo import CHUNKSIZE_PADRAO, abrir_pool
+    from .perfil import LENTOS_PADRAO, abrir_perfil
+    from .relatorio import (RelatorioIndividual, Rotulos, gravar_resultado_dataset, gravar_resultados_individuais,
+                            imprimir_estatisticas)
+    from . import saida_documentos
+    from .saida_documentos import FORMATOS, abrir_saida_documentos
+    from .vocabulario import Vocabulario
+except ImportError:
+    from checkpoint import abrir_checkpoint
+    from corpus import analisar_corpus
+    from fontes import Documento, fonte_pacote, fonte_pasta_json, fonte_pasta_texto, fonte_pastas_xml
+    from lexicon import lexicon_enabled
+    from pacote import Pacote, empacotar
+    from paralelo import CHUNKSIZE_PADRAO, abrir_pool
+    from perfil import LENTOS_PADRAO, abrir_perfil
+    from relatorio import (RelatorioIndividual, Rotulos, gravar_resultado_dataset, gravar_resultados_individuais,
+                           imprimir_estatisticas)
+    import saida_documentos
+    from saida_documentos import FORMATOS, abrir_saida_documentos
+    from vocabulario import Vocabulario
+
+
+@dataclass(frozen=True)
+class Adaptador:
+    """Como ler um tipo de corpus e como chamar os seus relatórios."""
+    nome: str
+    fonte: Callable[..., Iterator[Documento]]  # fonte(pasta, checkpoint=None, leitores=0)
+    rotulos: Rotulos
+    arquivo_individuais: str
+    arquivo_dataset: str
+
+
+ADAPTADORES = {
+    "xml": Adaptador("xml", fonte_pastas_xml,
+                     Rotulos("DATASET - PASTA DATA", "DATASET DATA", "pastas", "processadas", "Pastas Válidas"),
+                     "resultados_individuais.txt", "resultado_dataset.txt"),
+    "json": Adaptador("json", fonte_pasta_json,
+                      Rotulos("COMANDOS TEMÁTICOS - IA", "COMANDOS TEMÁTICOS (IA)", "arquivos", "processados",
+                              "Arquivos Válidos"),
+                      "Resultados_Separados.txt", "Resultado_dataSet.txt"),
+    "txt": Adaptador("txt", fonte_pasta_texto,
+                     Rotulos("TEXTOS", "TEXTOS", "arquivos", "processados", "Arquivos Válidos"),
+                     "resultados_individuais.txt", "resultado_dataset.txt"),
+}
+
+
+def analisar(adaptador: Adaptador, pasta, workers: Optional[int] = 1, caminho_checkpoint=None,
+             erro_diversidade: Optional[float] = None, caminho_perfil=None, lentos: int = LENTOS_PADRAO,
+             chunksize: int = CHUNKSIZE_PADRAO, executor=None, caminho_documentos=None,
+             leitores: int = 0, vocabulario: Optional[Vocabulario] = None, pasta_relatorios=None,
+             guardar_resultados: bool = True) -> dict:
+    """Analisa o corpus em ``pasta`` e imprime as estatísticas gerais; devolve o dicionário de analisar_corpus.
+
+    Com ``caminho_documentos`` (.csv, .jsonl ou .parquet) grava também uma linha por documento;
+    ``leitores`` threads leem os arquivos antecipadamente (ver fontes.fonte_arquivos);
+    ``vocabulario`` é dividido com os outros corpora da mesma execução (ver vocabulario.py).
+    Com ``pasta_relatorios`` os relatórios em texto são gravados nela, os resultados individuais
+    durante a análise; sem ``guardar_resultados`` as linhas dos documentos não ficam em memória.
+    """
+    with abrir_checkpoint(caminho_checkpoint) as checkpoint, abrir_perfil(caminho_perfil, lentos), \
+            abrir_saida_documentos(caminho_documentos) as saida, ExitStack() as pilha:
+        saidas = [] if saida is None else [saida]
+        individual = None
+        if pasta_relatorios is not None:
+            os.makedirs(pasta_relatorios, exist_ok=True)
+            individual = pilha.enter_context(
+                RelatorioIndividual(os.path.join(pasta_relatorios, adaptador.arquivo_individuais)))
+            saidas.append(individual)
+        fonte = adaptador.fonte(pasta, checkpoint=checkpoint, leitores=leitores)
+        corpus = analisar_corpus(fonte, workers, chunksize, checkpoint=checkpoint, erro_diversidade=erro_diversidade,
+                                 executor=executor, saida_documentos=saidas, vocabulario=vocabulario,
+                                 guardar_resultados=guardar_resultados)
+        if individual is not None:
+            individual.finalizar(corpus)
+    imprimir_estatisticas(corpus, adaptador.rotulos)
+    if pasta_relatorios is not None:
+        gravar_resultado_dataset(os.path.join(pasta_relatorios, adaptador.arquivo_dataset), corpus, adaptador.rotulos)
+    return corpus
+
+
+def como_tupla(corpus: dict) -> tuple:
+    """Os resultados na tupla devolvida por buscar_pasta/buscar_pastas_data."""
+    return (corpus['resultados_individual'], corpus['diversidade_geral'], corpus['media_lexica'],
+            corpus['desvio_lexica'], corpus['arquivos_validos_lexica'], corpus['media_complexidade'],
+            corpus['media_prop_longas'], corpus['media_silabica'], corpus['media_silabas_palavra'],
+            corpus['media_complexas'], corpus['complexidade_dataset'], corpus['correlacao_div_comp'])
+
+
+def gravar_relatorios(corpus: dict, adaptador: Adaptador, pasta_saida) -> None:
+    os.makedirs(pasta_saida, exist_ok=True)
+    gravar_resultados_individuais(os.path.join(pasta_saida, adaptador.arquivo_individuais), corpus)
+    gravar_resultado_dataset(os.path.join(pasta_saida, adaptador.arquivo_dataset), corpus, adaptador.rotulos)
+
+
+def adaptador_do_pacote(caminho, adaptadores=ADAPTADORES) -> Adaptador:
+    """O adaptador do corpus que gerou o pacote, lendo do pacote."""
+    with Pacote(caminho) as pacote:
+        tipo = pacote.meta.get("tipo")
+    if tipo not in adaptadores:
+        raise ValueError(f"{caminho}: tipo de corpus desconhecido ({tipo!r})")
+    return replace(adaptadores[tipo], fonte=fonte_pacote)
+
+
+def nomes_de_saida(pastas: List[str]) -> List[str]:
+    """Nome da subpasta de relatórios de cada corpus: o nome da pasta, sem repetir."""
+    nomes, vistos = [], {}
+    for pasta in pastas:
+        nome = os.path.basename(os.path.normpath(pasta)) or "corpus"
+        vistos[nome] = vistos.get(nome, 0) + 1
+        nomes.append(nome if vistos[nome] == 1 else f"{nome}_{vistos[nome]}")
+    return nomes
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Diversidade e complexidade léxica de um ou mais corpora")
+    parser.add_argument("--xml", dest="corpora", action="append", type=lambda p: ("xml", p), default=[],
+                        metavar="PASTA", help="pasta com subpastas contendo prompt.xml")
+    parser.add_argument("--json", dest="corpora", action="append", type=lambda p: ("json", p),
+                        metavar="PASTA", help="pasta com arquivos .json")
+    parser.add_argument("--txt", dest="corpora", action="append", type=lambda p: ("txt", p),
+                        metavar="PASTA", help="pasta com arquivos .txt")
+    parser.add_argument("--pacote", dest="corpora", action="append", type=lambda p: ("pacote", p),
+                        metavar="ARQUIVO", help="corpus empacotado (.pack) por --empacotar")
+    parser.add_argument("--campo", default="comando_tematico", help="campo lido dos .json (ex.: a.b)")
+    parser.add_argument("--saida", default="resultados", help="pasta dos relatórios (uma subpasta por corpus)")
+    parser.add_argument("--formato", choices=sorted(set(FORMATOS.values())),
+                        help="grava também documentos.<formato>, uma linha por documento")
+    parser.add_argument("--texto", action=argparse.BooleanOptionalAction, default=True,
+                        help="relatórios em texto (--no-texto para só a saída tabular)")
+    parser.add_argument("--workers", type=int, default=1, help="processos de análise (0: todos os núcleos)")
+    parser.add_argument("--chunksize", type=int, default=CHUNKSIZE_PADRAO)
+    parser.add_argument("--leitores", type=int, default=0,
+                        help="threads que leem os arquivos à frente da análise (útil em disco de rede)")
+    parser.add_argument("--empacotar", action="store_true",
+                        help="grava SAIDA/<corpus>.pack com os tokens e analisa a partir dele")
+    parser.add_argument("--checkpoint", action="store_true",
+                        help="retoma execuções interrompidas (checkpoint.sqlite na pasta do corpus)")
+    parser.add_argument("--erro-diversidade", type=float,
+                        help="estima a diversidade geral por HyperLogLog com este erro (ex.: 0.01)")
+    parser.add_argument("--perfil", action="store_true", help="grava perfil.json na pasta do corpus")
+    parser.add_argument("--lentos", type=int, default=LENTOS_PADRAO)
+    parser.add_argument("--lexico", help="léxico persistente de silabação (SQLite), compartilhado entre execuções")
+    args = parser.parse_args(argv)
+
+    if not args.corpora:
+        parser.error("informe ao menos um corpus (--xml, --json, --txt ou --pacote)")
+    if args.formato == "parquet" and saida_documentos.pyarrow is None:
+        parser.error("--formato parquet precisa do pyarrow instalado")
+    adaptadores = dict(ADAPTADORES, json=replace(ADAPTADORES["json"],
+                                                 fonte=partial(fonte_pasta_json, campo=args.campo)))
+
+    os.makedirs(args.saida, exist_ok=True)
+    with ExitStack() as pilha:
+        if args.lexico:
+            pilha.enter_context(lexicon_enabled(args.lexico))
+        executor = pilha.enter_context(abrir_pool(args.workers, args.lentos if args.perfil else None))
+        vocabulario = Vocabulario()
+        nomes = nomes_de_saida([os.path.splitext(p)[0] if tipo == "pacote" else p for tipo, p in args.corpora])
+        for (tipo, pasta), nome in zip(args.corpora, nomes):
+            pasta_saida = os.path.join(args.saida, nome)
+            os.makedirs(pasta_saida, exist_ok=True)
+            print(f"\n##### {nome} ({tipo}): {pasta}")
+            if tipo == "pacote":
+                adaptador = adaptador_do_pacote(pasta, adaptadores)
+            else:
+                adaptador = adaptadores[tipo]
+                if args.empacotar:
+                    caminho_pacote = os.path.join(args.saida, f"{nome}.pack")
+                    empacotar(adaptador.fonte(pasta, leitores=args.leitores), caminho_pacote, tipo,
+                              os.path.abspath(pasta))
+                    adaptador, pasta = replace(adaptador, fonte=fonte_pacote), caminho_pacote
+            analisar(adaptador, pasta, args.workers,
+                     os.path.join(pasta_saida, "checkpoint.sqlite") if args.checkpoint else None,
+                     args.erro_diversidade,
+                     os.path.join(pasta_saida, "perfil.json") if args.perfil else None,
+                     args.lentos, args.chunksize, executor,
+                     os.path.join(pasta_saida, f"documentos.{args.formato}") if args.formato else None,
+                     args.leitores, vocabulario, pasta_saida if args.texto else None,
+                     guardar_resultados=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+"""
+Métricas por documento: diversidade léxica, complexidade lexical e análise silábica.
+Todas as métricas saem de uma única passada por texto (analisar_texto).
+"""
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Collection, Dict, List, Mapping, Optional, Sequence
+
+try:
+    from . import perfil
+    from .diversidade import mattr, mtld
+    from .syllable import word2syllables
+    from .tokenizador import extrair_palavras
+    from .vocabulario import TIPO_ID, Vocabulario
+except ImportError:
+    import perfil
+    from diversidade import mattr, mtld
+    from syllable import word2syllables
+    from tokenizador import extrair_palavras
+    from vocabulario import TIPO_ID, Vocabulario
+
+
+def analise_silabica_unifica(palavras):
+
+    if not palavras:
+        return 0, set(), 0, 0, 0
+
+    total_silabas = 0
+    silabas_unicas = set()
+    palavras_3silabas = 0
+    palavras_4silabas = 0
+    palavras_5silabas = 0
+
+    for palavra in palavras:
+        try:
+            silabas = word2syllables(palavra)
+            num_silabas = len(silabas)
+            total_silabas += num_silabas
+            silabas_unicas.update(silabas)
+
+            if num_silabas >= 3:
+                palavras_3silabas += 1
+            if num_silabas >= 4:
+                palavras_4silabas += 1
+            if num_silabas >= 5:
+                palavras_5silabas += 1
+
+        except Exception:
+            continue
+
+    return total_silabas, silabas_unicas, palavras_3silabas, palavras_4silabas, palavras_5silabas
+
+
+def analise_silabica_frequencias(frequencias: Mapping, silabar=word2syllables):
+    """Como analise_silabica_unifica, a partir de ``{palavra: ocorrências}``.
+
+    Cada tipo é silabado uma vez e pesa pelo número de ocorrências; as
+    contagens são inteiras, então o resultado é idêntico ao token a token.
+    ``silabar`` troca word2syllables (ex.: pelas sílabas de cada id de um pacote).
+    """
+    total_silabas = 0
+    silabas_unicas = set()
+    palavras_3silabas = 0
+    palavras_4silabas = 0
+    palavras_5silabas = 0
+
+    for palavra, ocorrencias in frequencias.items():
+        try:
+            silabas = silabar(palavra)
+        except Exception:
+            continue
+        num_silabas = len(silabas)
+        total_silabas += num_silabas * ocorrencias
+        silabas_unicas.update(silabas)
+
+        if num_silabas >= 3:
+            palavras_3silabas += ocorrencias
+            if num_silabas >= 4:
+                palavras_4silabas += ocorrencias
+                if num_silabas >= 5:
+                    palavras_5silabas += ocorrencias
+
+    return total_silabas, silabas_unicas, palavras_3silabas, palavras_4silabas, palavras_5silabas
+
+
+@dataclass
+class AnaliseTexto:
+    """Resultado de analisar_texto: todas as métricas de um documento."""
+    total_palavras: int = 0
+    # set de str, ou array de ids quando a análise recebe um Vocabulario (ver analisar_ids)
+    palavras_unicas: Collection = field(default_factory=set)
+    # base da diversidade silábica do corpus inteiro (ver corpus.EstatisticasCorpus)
+    total_silabas: int = 0
+    silabas_unicas: Collection = field(default_factory=set)
+    diversidade_lexica: float = 0
+    complexidade_lexica: float = 0
+    proporcao_palavras_longas: float = 0
+    proporcao_muito_longas: float = 0
+    diversidade_silabica: float = 0
+    proporcao_complexas: float = 0
+    silabas_por_palavra: float = 0
+    # diversidade independente do tamanho do texto (ver diversidade.py)
+    mattr: float = 0
+    mtld: float = 0
+
+    def como_dict(self) -> Dict[str, float]:
+        """Formato usado em ``resultados_individual`` pelos scripts."""
+        return {
+            'diversidade_lexica': self.diversidade_lexica,
+            'complexidade_lexica': self.complexidade_lexica,
+            'proporcao_palavras_longas': self.proporcao_palavras_longas,
+            'diversidade_silabica': self.diversidade_silabica,
+            'proporcao_complexas': self.proporcao_complexas,
+            'silabas_por_palavra': self.silabas_por_palavra
+        }
+
+
+def analisar_palavras(palavras: List[str]) -> AnaliseTexto:
+    """Calcula todas as métricas a partir da lista de palavras já extraída."""
+    if not palavras:
+        return AnaliseTexto()
+    r = _metricas(len(palavras), set(palavras), analise_silabica_unifica(palavras))
+    r.mattr, r.mtld = mattr(palavras), mtld(palavras)
+    return r
+
+
+def analisar_frequencias(frequencias: Mapping[str, int], silabar=word2syllables) -> AnaliseTexto:
+    """Como analisar_palavras, a partir da contagem de cada tipo (ex.: um Counter).
+
+    Sem a ordem dos tokens, MATTR e MTLD ficam em 0. ``silabar`` é o de
+    analise_silabica_frequencias.
+    """
+    if not frequencias:
+        return AnaliseTexto()
+    return _metricas(sum(frequencias.values()), set(frequencias),
+                     analise_silabica_frequencias(frequencias, silabar))
+
+
+def _metricas(n, unicas, silabica) -> AnaliseTexto:
+    total_silabas, silabas_unicas, palavras_3silabas, palavras_4silabas, palavras_5silabas = silabica
+
+    proporcao_longas = palavras_4silabas / n
+    proporcao_muito_longas = palavras_5silabas / n
+    silabas_por_palavra = total_silabas / n
+    indice_complexidade = (proporcao_longas * 0.4 +
+                          proporcao_muito_longas * 0.3 +
+                          min(silabas_por_palavra / 8, 1) * 0.3)
+
+    if total_silabas == 0:
+        diversidade_silabica, proporcao_complexas, silabas_por_palavra = 0, 0, 0
+    else:
+        diversidade_silabica = len(silabas_unicas) / total_silabas
+        proporcao_complexas = palavras_3silabas / n
+
+    return AnaliseTexto(
+        total_palavras=n,
+        palavras_unicas=unicas,
+        total_silabas=total_silabas,
+        silabas_unicas=silabas_unicas,
+        diversidade_lexica=len(unicas) / n,
+        complexidade_lexica=indice_complexidade,
+        proporcao_palavras_longas=proporcao_longas,
+        proporcao_muito_longas=proporcao_muito_longas,
+        diversidade_silabica=diversidade_silabica,
+        proporcao_complexas=proporcao_complexas,
+        silabas_por_palavra=silabas_por_palavra
+    )
+
+
+def analisar_texto(texto, por_tipo: bool = True, vocabulario: Optional[Vocabulario] = None) -> AnaliseTexto:
+    """Tokeniza e silaba o texto uma única vez e devolve todas as métricas.
+
+    Por padrão conta os tokens e silaba cada tipo distinto uma só vez
+    (analisar_frequencias); com ``por_tipo=False`` percorre token a token.
+    O resultado é o mesmo nos dois modos. Com um ``vocabulario`` os tokens
+    viram ids dele na tokenização e a análise segue por analisar_ids: as
+    palavras e sílabas distintas saem como ids, sem sets de str.
+    """
+    if vocabulario is not None:
+        with perfil.etapa("tokenizacao"):
+            ids = vocabulario.ids(extrair_palavras(texto))
+        return analisar_ids(ids, vocabulario.itens, vocabulario=vocabulario)
+    with perfil.etapa("tokenizacao"):
+        palavras = extrair_palavras(texto)
+        frequencias = Counter(palavras) if por_tipo else None
+    with perfil.etapa("silabacao"):
+        r = analisar_frequencias(frequencias) if por_tipo else analisar_palavras(palavras)
+    if por_tipo and palavras:
+        with perfil.etapa("diversidade"):
+            r.mattr, r.mtld = mattr(palavras), mtld(palavras)
+    _contar_perfil(r)
+    return r
+
+
+def analisar_ids(ids: Sequence[int], itens: Sequence[str], silabar=None,
+                 vocabulario: Optional[Vocabulario] = None) -> AnaliseTexto:
+    """Como analisar_texto, a partir dos ids dos tokens e da tabela ``itens`` (id -> palavra).
+
+    É a análise de um corpus empacotado (pacote.py), sem texto nem tokenização.
+    ``silabar(id)`` dá as sílabas de um id (padrão: word2syllables da palavra).
+    MATTR e MTLD olham só a igualdade dos tokens, então saem direto dos ids.
+
+    Com um ``vocabulario``, palavras_unicas e silabas_unicas saem como arrays
+    de ids dele, sem montar sets de str: os tipos de ``itens`` são internados
+    (se ``itens`` não for o próprio vocabulario.itens) e as sílabas vêm de
+    vocabulario.partes, no lugar de ``silabar``.
+    """
+    with perfil.etapa("contagem"):
+        frequencias = Counter(ids)
+    if not frequencias:
+        r = AnaliseTexto()
+    elif vocabulario is None:
+        with perfil.etapa("silabacao"):
+            silabica = analise_silabica_frequencias(
+                frequencias, silabar or (lambda i: word2syllables(itens[i])))
+            r = _metricas(len(ids), {itens[i] for i in frequencias}, silabica)
+    else:
+        with perfil.etapa("silabacao"):
+            if itens is not vocabulario.itens:
+                tipos = vocabulario.ids([itens[i] for i in frequencias])
+                frequencias = dict(zip(tipos, frequencias.values()))
+            total_silabas, silabas_unicas, *palavras_nsilabas = analise_silabica_frequencias(
+                frequencias, partial(vocabulario.partes, dividir=word2syllables))
+            silabica = (total_silabas, array(TIPO_ID, silabas_unicas), *palavras_nsilabas)
+            r = _metricas(len(ids), array(TIPO_ID, frequencias), silabica)
+    if frequencias:
+        with perfil.etapa("diversidade"):
+            r.mattr, r.mtld = mattr(ids), mtld(ids)
+    _contar_perfil(r)
+    return r
+
+
+def _contar_perfil(r: AnaliseTexto) -> None:
+    if perfil.ativo is not None:
+        perfil.ativo.contar("tokens", r.total_palavras)
+        perfil.ativo.contar("tipos", len(r.palavras_unicas))
+        perfil.ativo.contar("silabas", r.total_silabas)
+
+
+def diversidade_lexica(texto):
+    return analisar_texto(texto).diversidade_lexica
+
+
+def analise_silabica(texto):
+    r = analisar_texto(texto)
+    return r.diversidade_silabica, r.proporcao_complexas, r.silabas_por_palavra
+
+
+def complexidade_lexica(texto):
+    r = analisar_texto(texto)
+    return r.complexidade_lexica, r.proporcao_palavras_longas, r.proporcao_muito_longas, r.silabas_por_palavra
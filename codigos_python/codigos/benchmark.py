@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark local de syllable.py, do tokenizador, das métricas por documento e
+do laço de corpus, sobre um corpus sintético reprodutível (corpus_sintetico.py).
+
+    python benchmark.py --saida atual.json
+    python benchmark.py --comparar base.json      # marca regressões
+
+Cada etapa é medida ``--repeticoes`` vezes e vale o menor tempo. O JSON traz
+os parâmetros do corpus, o ambiente e, por etapa, segundos, itens e itens/s;
+com ``--comparar`` as etapas mais lentas que a base além de ``--tolerancia``
+são listadas e o processo termina com código 1.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+try:
+    from . import syllable
+    from .analise import analisar_texto, analise_silabica_unifica
+    from .corpus import analisar_corpus
+    from .corpus_sintetico import gerar_documentos, gerar_vocabulario, gravar_corpus_json
+    from .diversidade import _mattr_ingenuo, mattr, mtld
+    from .fontes import fonte_pacote, fonte_pasta_json
+    from .lote import analyze_many
+    from .pacote import empacotar
+    from .tokenizador import extrair_palavras
+except ImportError:
+    import syllable
+    from analise import analisar_texto, analise_silabica_unifica
+    from corpus import analisar_corpus
+    from corpus_sintetico import gerar_documentos, gerar_vocabulario, gravar_corpus_json
+    from diversidade import _mattr_ingenuo, mattr, mtld
+    from fontes import fonte_pacote, fonte_pasta_json
+    from lote import analyze_many
+    from pacote import empacotar
+    from tokenizador import extrair_palavras
+
+TOLERANCIA_PADRAO = 0.10
+# Documentos longos para comparar MATTR/MTLD com a razão tipo/token.
+DOCUMENTOS_LONGOS = 10
+PALAVRAS_LONGOS = 20_000
+
+
+def medir(funcao: Callable[[], object], repeticoes: int, preparar: Callable[[], object] = None) -> float:
+    """Menor tempo de ``funcao()`` em ``repeticoes`` execuções; ``preparar`` roda antes de cada uma, fora do tempo."""
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        if preparar is not None:
+            preparar()
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def _resultado(segundos: float, itens: int, unidade: str) -> dict:
+    return {"segundos": segundos, "itens": itens, "unidade": unidade,
+            "por_segundo": itens / segundos if segundos > 0 else float("inf")}
+
+
+def _conferir_pacote(pasta: str, caminho_pacote: str) -> None:
+    """O pacote tem de dar os mesmos resultados do corpus original, nos dois modos de diversidade."""
+    for erro_diversidade in (None, 0.01):
+        with contextlib.redirect_stdout(io.StringIO()):
+            esperado = analisar_corpus(fonte_pasta_json(pasta), erro_diversidade=erro_diversidade)
+            obtido = analisar_corpus(fonte_pacote(caminho_pacote), erro_diversidade=erro_diversidade)
+        diferentes = [nome for nome in esperado if nome != "estatisticas" and esperado[nome] != obtido[nome]]
+        if diferentes:
+            raise AssertionError(f"pacote diferente do corpus original (erro_diversidade={erro_diversidade}): "
+                                 + ", ".join(diferentes))
+
+
+def executar(documentos: int = 200, palavras: int = 300, vocabulario: int = 20_000,
+             expoente: float = 1.1, semente: int = 42, repeticoes: int = 3) -> dict:
+    """Roda todas as etapas e devolve o relatório (o mesmo gravado em JSON)."""
+    parametros = dict(n_documentos=documentos, palavras_por_documento=palavras,
+                      vocabulario=vocabulario, expoente=expoente, semente=semente)
+    textos = list(gerar_documentos(**parametros))
+    tokens = [extrair_palavras(t) for t in textos]
+    n_tokens = sum(map(len, tokens))
+    tipos = {p for doc in tokens for p in doc}
+    # palavras do vocabulário (>= 3 letras) sem repetição, para medir a silabação pura
+    vocab = [p for p in gerar_vocabulario(vocabulario, semente) if len(p) >= 3]
+
+    etapas: Dict[str, dict] = {}
+
+    def sem_cache():
+        syllable.cache_clear()
+
+    def silabar_todas(funcao, palavras_: List[str]):
+        def rodar():
+            for p in palavras_:
+                try:
+                    funcao(p)
+                except Exception:
+                    pass
+        return rodar
+
+    etapas["word2syllables_frio"] = _resultado(
+        medir(silabar_todas(syllable.word2syllables, vocab), repeticoes, sem_cache), len(vocab), "palavras")
+    etapas["word2syllables_tokens"] = _resultado(
+        medir(silabar_todas(syllable.word2syllables, [p for doc in tokens for p in doc]), repeticoes),
+        n_tokens, "palavras")
+    etapas["stressed_syllable_frio"] = _resultado(
+        medir(silabar_todas(syllable.stressed_syllable, vocab), repeticoes, sem_cache), len(vocab), "palavras")
+    etapas["extrair_palavras"] = _resultado(
+        medir(lambda: [extrair_palavras(t) for t in textos], repeticoes), n_tokens, "palavras")
+    etapas["analise_silabica_unifica"] = _resultado(
+        medir(lambda: [analise_silabica_unifica(doc) for doc in tokens], repeticoes), n_tokens, "palavras")
+    etapas["analisar_texto"] = _resultado(
+        medir(lambda: [analisar_texto(t) for t in textos], repeticoes), len(textos), "documentos")
+    etapas["analisar_texto_frio"] = _resultado(
+        medir(lambda: [analisar_texto(t) for t in textos], repeticoes, sem_cache), len(textos), "documentos")
+    etapas["analyze_many"] = _resultado(medir(lambda: analyze_many(textos), repeticoes), len(textos), "documentos")
+
+    longos = [extrair_palavras(t) for t in gerar_documentos(DOCUMENTOS_LONGOS, PALAVRAS_LONGOS, vocabulario,
+                                                            expoente, semente)]
+    n_longos = sum(map(len, longos))
+    etapas["ttr_longos"] = _resultado(
+        medir(lambda: [len(set(doc)) / len(doc) for doc in longos], repeticoes), n_longos, "palavras")
+    etapas["mattr_longos"] = _resultado(medir(lambda: [mattr(doc) for doc in longos], repeticoes), n_longos, "palavras")
+    etapas["mattr_ingenuo_longos"] = _resultado(
+        medir(lambda: [_mattr_ingenuo(doc) for doc in longos], repeticoes), n_longos, "palavras")
+    etapas["mtld_longos"] = _resultado(medir(lambda: [mtld(doc) for doc in longos], repeticoes), n_longos, "palavras")
+
+    with tempfile.TemporaryDirectory() as pasta:
+        gravar_corpus_json(pasta, **parametros)
+
+        def laco_corpus():
+            # o mesmo que buscar_pasta faz, sem a impressão das estatísticas
+            with contextlib.redirect_stdout(io.StringIO()):
+                analisar_corpus(fonte_pasta_json(pasta))
+
+        etapas["buscar_pasta"] = _resultado(medir(laco_corpus, repeticoes, sem_cache), len(textos), "documentos")
+
+        caminho_pacote = os.path.join(pasta, "corpus.pack")
+        with contextlib.redirect_stdout(io.StringIO()):
+            empacotar(fonte_pasta_json(pasta), caminho_pacote, "json")
+        _conferir_pacote(pasta, caminho_pacote)
+        etapas["buscar_pasta_pacote"] = _resultado(
+            medir(lambda: analisar_corpus(fonte_pacote(caminho_pacote)), repeticoes, sem_cache),
+            len(textos), "documentos")
+
+    return {
+        "data": datetime.datetime.now().isoformat(timespec="seconds"),
+        "ambiente": {"python": platform.python_version(), "plataforma": platform.platform(),
+                     "processador": platform.processor() or platform.machine()},
+        "corpus": dict(parametros, tokens=n_tokens, tipos=len(tipos)),
+        "repeticoes": repeticoes,
+        "etapas": etapas,
+    }
+
+
+def comparar(atual: dict, base: dict, tolerancia: float = TOLERANCIA_PADRAO) -> List[str]:
+    """Etapas em que ``atual`` ficou mais de ``tolerancia`` mais lento que ``base``."""
+    regressoes = []
+    for nome, medida in atual["etapas"].items():
+        anterior = base.get("etapas", {}).get(nome)
+        if anterior is None:
+            continue
+        razao = anterior["por_segundo"] / medida["por_segundo"]
+        if razao > 1 + tolerancia:
+            regressoes.append(f"{nome}: {medida['por_segundo']:.0f} {medida['unidade']}/s "
+                              f"(base {anterior['por_segundo']:.0f}, {razao - 1:+.0%} mais lento)")
+    return regressoes
+
+
+def imprimir(relatorio: dict) -> None:
+    c = relatorio["corpus"]
+    print(f"Corpus: {c['n_documentos']} documentos, {c['tokens']} tokens, {c['tipos']} tipos "
+          f"(semente {c['semente']}, zipf {c['expoente']})")
+    for nome, medida in relatorio["etapas"].items():
+        print(f"  {nome:26s} {medida['segundos'] * 1e3:10.1f} ms  "
+              f"{medida['por_segundo']:12.0f} {medida['unidade']}/s")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark da silabação e das métricas")
+    parser.add_argument("--documentos", type=int, default=200)
+    parser.add_argument("--palavras", type=int, default=300, help="palavras por documento (média)")
+    parser.add_argument("--vocabulario", type=int, default=20_000)
+    parser.add_argument("--expoente", type=float, default=1.1, help="expoente da lei de Zipf")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--saida", help="grava o relatório neste arquivo JSON")
+    parser.add_argument("--comparar", help="relatório JSON de base para detectar regressões")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA_PADRAO)
+    args = parser.parse_args(argv)
+
+    relatorio = executar(args.documentos, args.palavras, args.vocabulario, args.expoente,
+                         args.semente, args.repeticoes)
+    imprimir(relatorio)
+
+    if args.saida:
+        os.makedirs(os.path.dirname(os.path.abspath(args.saida)), exist_ok=True)
+        with open(args.saida, "w", encoding="utf-8") as arqui:
+            json.dump(relatorio, arqui, ensure_ascii=False, indent=2)
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as arqui:
+            base = json.load(arqui)
+        if relatorio["corpus"] != base.get("corpus"):
+            print("Aviso: corpus diferente do da base; a comparação não é direta")
+        regressoes = comparar(relatorio, base, args.tolerancia)
+        for linha in regressoes:
+            print("REGRESSÃO " + linha)
+        if regressoes:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+Checkpoint de execuções longas (SQLite): resultado por documento, gravado
+periodicamente e indexado por caminho, tamanho e mtime do arquivo e pela
+leitura usada (a função e suas opções, como o campo dos .json).
+
+Ao retomar, arquivos que não mudaram não são lidos nem analisados: o
+resultado gravado entra no lugar do texto (ver fontes.fonte_arquivos) e só a
+agregação é refeita. A chave de versão cobre o código que produz o resultado
+gravado: a extração do texto (fontes.py, json_seletivo.py), a tokenização
+(tokenizador.py), a análise (syllable.py, analise.py, diversidade.py) e o
+próprio formato de gravação (checkpoint.py); se qualquer um mudar, o
+checkpoint é descartado.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+from array import array
+from contextlib import contextmanager
+from dataclasses import fields
+from functools import partial
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+try:
+    from . import analise, diversidade, fontes, json_seletivo, syllable, tokenizador
+    from .analise import AnaliseTexto
+except ImportError:
+    import analise
+    import diversidade
+    import fontes
+    import json_seletivo
+    import syllable
+    import tokenizador
+    from analise import AnaliseTexto
+
+DEFAULT_INTERVALO = 500
+_SEP = "\x1f"
+
+_INVALIDO, _VAZIO, _ANALISADO = 0, 1, 2
+# Colunas de métricas sem tipo declarado: o SQLite guarda int e float como
+# vieram, e o 0 inteiro de AnaliseTexto volta como 0 (não 0.0).
+_CONJUNTOS = ("palavras_unicas", "silabas_unicas")
+_CAMPOS = [f.name for f in fields(AnaliseTexto) if f.name not in _CONJUNTOS]
+
+Chave = Tuple[str, int, int, str]
+
+
+def versao_analise() -> str:
+    """Hash do código-fonte da extração, tokenização, análise e gravação (independente de fim de linha)."""
+    h = hashlib.sha256()
+    modulos = (fontes, json_seletivo, tokenizador, syllable, analise, diversidade)
+    for caminho in [m.__file__ for m in modulos] + [__file__]:
+        with open(caminho, "rb") as f:
+            h.update(f.read().replace(b"\r\n", b"\n"))
+    return h.hexdigest()
+
+
+def descrever_leitor(ler) -> str:
+    """Função de leitura e suas opções, como texto estável para a chave de cada arquivo."""
+    if isinstance(ler, partial):
+        opcoes = [_opcao(v) for v in ler.args] + [f"{k}={_opcao(v)}" for k, v in sorted(ler.keywords.items())]
+        return f"{descrever_leitor(ler.func)}({', '.join(opcoes)})"
+    return f"{getattr(ler, '__module__', '')}.{getattr(ler, '__qualname__', repr(ler))}"
+
+
+def _opcao(valor) -> str:
+    # o backend de um CampoJSON não muda o texto extraído, só as chaves do caminho
+    if isinstance(valor, json_seletivo.CampoJSON):
+        return f"CampoJSON({valor.chaves!r})"
+    return repr(valor)
+
+
+def chave_arquivo(caminho, leitor: str = "") -> Chave:
+    st = os.stat(caminho)
+    return os.path.abspath(caminho), st.st_size, st.st_mtime_ns, leitor
+
+
+def _palavras(conjunto, vocabulario) -> Iterable[str]:
+    # ids (ver analise.analisar_ids) vão para o disco como palavras
+    if isinstance(conjunto, array):
+        return map(vocabulario.itens.__getitem__, conjunto)
+    return conjunto
+
+
+def _codificar(texto, vocabulario=None) -> tuple:
+    if texto is None:
+        return (_INVALIDO, None, None) + (None,) * len(_CAMPOS)
+    if not isinstance(texto, AnaliseTexto):
+        return (_VAZIO, None, None) + (None,) * len(_CAMPOS)
+    return ((_ANALISADO,) + tuple(_SEP.join(_palavras(getattr(texto, c), vocabulario)) for c in _CONJUNTOS)
+            + tuple(getattr(texto, c) for c in _CAMPOS))
+
+
+def _decodificar(linha: tuple):
+    estado, palavras_unicas, silabas_unicas, *valores = linha
+    if estado == _INVALIDO:
+        return None
+    if estado == _VAZIO:
+        return ""
+    return AnaliseTexto(palavras_unicas=set(palavras_unicas.split(_SEP)) if palavras_unicas else set(),
+                        silabas_unicas=set(silabas_unicas.split(_SEP)) if silabas_unicas else set(),
+                        **dict(zip(_CAMPOS, valores)))
+
+
+class Checkpoint:
+    """Resultados por arquivo de uma execução, para retomá-la depois.
+
+    ``envolver`` troca o leitor de uma fonte de arquivos por um que consulta o
+    checkpoint antes de abrir o arquivo; analisar_corpus chama ``registrar``
+    com o resultado de cada documento novo. A cada ``intervalo`` documentos
+    registrados a transação é gravada em disco.
+    """
+
+    def __init__(self, path, intervalo: int = DEFAULT_INTERVALO):
+        self.path = os.fspath(path)
+        self.intervalo = intervalo
+        self.retomados = 0
+        self.novos = 0
+        self._chaves: Dict[str, Chave] = {}
+        self._pendentes = 0
+        self.version = versao_analise()
+
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != self.version:
+            # a tabela é recriada: as colunas de métricas podem ter mudado junto com o código
+            self._conn.execute("DROP TABLE IF EXISTS docs")
+            self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (self.version,))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS docs (caminho TEXT PRIMARY KEY, tamanho INTEGER, mtime INTEGER, leitor TEXT, "
+            "estado INTEGER, palavras_unicas TEXT, silabas_unicas TEXT, " + ", ".join(_CAMPOS) + ")"
+        )
+        self._conn.commit()
+        self._insert = "INSERT OR REPLACE INTO docs VALUES (" + ", ".join("?" * (len(_CAMPOS) + 7)) + ")"
+
+    def consultar(self, chave: Chave) -> Tuple[bool, object]:
+        """``(True, resultado)`` se o arquivo já foi processado com esta chave."""
+        row = self._conn.execute(
+            "SELECT estado, palavras_unicas, silabas_unicas, " + ", ".join(_CAMPOS) +
+            " FROM docs WHERE caminho = ? AND tamanho = ? AND mtime = ? AND leitor = ?", chave
+        ).fetchone()
+        if row is None:
+            return False, None
+        return True, _decodificar(row)
+
+    def retomar(self, doc_id: str, caminho, leitor: str = "") -> Tuple[bool, object]:
+        """Como consultar, pelo caminho; se o arquivo for novo, guarda a chave para ``registrar``."""
+        chave = chave_arquivo(caminho, leitor)
+        encontrado, resultado = self.consultar(chave)
+        if encontrado:
+            self.retomados += 1
+        else:
+            self._chaves[doc_id] = chave
+        return encontrado, resultado
+
+    def retomador(self, ler: Callable[[str, str], Optional[str]]) -> Callable[[str, str], Tuple[bool, object]]:
+        """``retomar`` dos arquivos lidos com ``ler``: resultados de outra leitura não servem."""
+        return partial(self.retomar, leitor=descrever_leitor(ler))
+
+    def envolver(self, ler: Callable[[str, str], Optional[str]]) -> Callable[[str, str], object]:
+        retomar = self.retomador(ler)
+
+        def ler_ou_retomar(doc_id, caminho):
+            encontrado, resultado = retomar(doc_id, caminho)
+            return resultado if encontrado else ler(doc_id, caminho)
+        return ler_ou_retomar
+
+    def registrar(self, doc_id: str, resultado, vocabulario=None) -> None:
+        """Grava o resultado (``AnaliseTexto``, ``""`` ou ``None``) de um documento novo.
+
+        ``vocabulario`` é o da análise, se o resultado traz ids em vez de palavras.
+        """
+        chave = self._chaves.pop(doc_id, None)
+        if chave is None:
+            return
+        self._conn.execute(self._insert, chave + _codificar(resultado, vocabulario))
+        self.novos += 1
+        self._pendentes += 1
+        if self._pendentes >= self.intervalo:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pendentes:
+            self._conn.commit()
+            self._pendentes = 0
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+    def __enter__(self) -> "Checkpoint":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+@contextmanager
+def abrir_checkpoint(path, intervalo: int = DEFAULT_INTERVALO) -> Iterator[Optional[Checkpoint]]:
+    """Abre o checkpoint durante o bloco ``with``; com ``path=None`` devolve None."""
+    if path is None:
+        yield None
+        return
+    with Checkpoint(path, intervalo) as checkpoint:
+        yield checkpoint
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+"""
+Agregação de um corpus: consome uma fonte ``(doc_id, texto)`` (ver fontes.py)
+como gerador, analisa os documentos (em paralelo se pedido) e calcula as
+estatísticas gerais que os scripts imprimem e gravam.
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Iterable, Optional
+
+try:
+    from . import perfil
+    from .acumuladores import Acumulador, AcumuladorCorrelacao, AcumuladorPositivos
+    from .analise import AnaliseTexto
+    from .fontes import Documento
+    from .hyperloglog import HyperLogLog
+    from .paralelo import CHUNKSIZE_PADRAO, analisar_documentos
+    from .vocabulario import ConjuntoIds, Vocabulario
+except ImportError:
+    import perfil
+    from acumuladores import Acumulador, AcumuladorCorrelacao, AcumuladorPositivos
+    from analise import AnaliseTexto
+    from fontes import Documento
+    from hyperloglog import HyperLogLog
+    from paralelo import CHUNKSIZE_PADRAO, analisar_documentos
+    from vocabulario import ConjuntoIds, Vocabulario
+
+
+def classificar_complexidade(valor):
+    if valor < 0.2:
+        return "Baixa"
+    elif valor < 0.35:
+        return "Média"
+    else:
+        return "Alta"
+
+
+_METRICAS = ('diversidade_lexica', 'complexidade_lexica', 'proporcao_palavras_longas',
+             'diversidade_silabica', 'proporcao_complexas', 'silabas_por_palavra', 'mattr', 'mtld')
+
+
+class EstatisticasCorpus:
+    """Estado agregado do corpus, atualizado documento a documento.
+
+    Guarda acumuladores (ver acumuladores.py) e contagens; de valores por
+    documento, só os pares diversidade/complexidade da correlação. Estados de
+    partes diferentes do corpus se juntam com ``combinar``.
+
+    Palavras e sílabas recebem ids de ``vocabulario`` (ver vocabulario.py),
+    que pode ser dividido com outros corpora. As sílabas distintas do corpus
+    e, no modo exato, as palavras distintas ficam em bitmaps de ids; com
+    ``erro_diversidade`` as palavras vão para um esboço HyperLogLog de
+    memória fixa com esse erro padrão relativo. Resultados analisados com o
+    próprio ``vocabulario`` (analisar_corpus) já trazem ids; sets de str
+    (checkpoint, modo HyperLogLog) são internados em ``adicionar``.
+    """
+
+    def __init__(self, erro_diversidade: Optional[float] = None, vocabulario: Optional[Vocabulario] = None):
+        self.arquivos_processados = 0
+        self.arquivos_com_texto = 0
+        self.total_palavras = 0
+        self.total_silabas = 0
+        self.vocabulario = Vocabulario() if vocabulario is None else vocabulario
+        self.palavras_unicas = ConjuntoIds() if erro_diversidade is None else None
+        self.silabas_unicas = ConjuntoIds()
+        self.esboco = None if erro_diversidade is None else HyperLogLog.para_erro(erro_diversidade)
+        self.metricas = {nome: AcumuladorPositivos() for nome in _METRICAS}
+        self.scores = Acumulador()
+        self.classificacoes = {"Baixa": 0, "Média": 0, "Alta": 0}
+        self.div_comp = AcumuladorCorrelacao()
+
+    def adicionar_linha(self, dados) -> None:
+        """Parte do dataset (score, classificação, correlação) de uma linha de resultados."""
+        if dados['diversidade_lexica'] > 0:
+            score = (dados['complexidade_lexica'] * 0.4 +
+                    dados['proporcao_palavras_longas'] * 0.3 +
+                    min(dados['silabas_por_palavra'] / 4, 1) * 0.2 +
+                    dados['proporcao_complexas'] * 0.1)
+            self.scores.adicionar(score)
+            self.classificacoes[classificar_complexidade(dados['complexidade_lexica'])] += 1
+            self.div_comp.adicionar(dados['diversidade_lexica'], dados['complexidade_lexica'])
+
+    def adicionar(self, analise: AnaliseTexto) -> dict:
+        """Incorpora um documento analisado e devolve sua linha de resultados."""
+        dados = analise.como_dict()
+        for nome, acumulador in self.metricas.items():
+            acumulador.adicionar(getattr(analise, nome))
+        self.adicionar_linha(dados)
+        if analise.total_palavras:
+            self.total_palavras += analise.total_palavras
+            if self.esboco is None:
+                self.palavras_unicas.adicionar(self._em_ids(analise.palavras_unicas))
+            else:
+                self.esboco.atualizar(analise.palavras_unicas)
+            self.total_silabas += analise.total_silabas
+            self.silabas_unicas.adicionar(self._em_ids(analise.silabas_unicas))
+        return dados
+
+    def _em_ids(self, conjunto) -> array:
+        # um array já tem ids de self.vocabulario (ver analisar_corpus)
+        if isinstance(conjunto, array):
+            return conjunto
+        return self.vocabulario.ids(conjunto)
+
+    def _ids_traduzidos(self, outro: "EstatisticasCorpus", conjunto: ConjuntoIds) -> ConjuntoIds:
+        if outro.vocabulario is self.vocabulario:
+            return conjunto
+        return ConjuntoIds(self.vocabulario.ids(outro.vocabulario[i] for i in conjunto))
+
+    def combinar(self, outro: "EstatisticasCorpus") -> "EstatisticasCorpus":
+        self.arquivos_processados += outro.arquivos_processados
+        self.arquivos_com_texto += outro.arquivos_com_texto
+        self.total_palavras += outro.total_palavras
+        self.total_silabas += outro.total_silabas
+        if self.esboco is None:
+            self.palavras_unicas.combinar(self._ids_traduzidos(outro, outro.palavras_unicas))
+        else:
+            self.esboco.combinar(outro.esboco)
+        self.silabas_unicas.combinar(self._ids_traduzidos(outro, outro.silabas_unicas))
+        for nome, acumulador in self.metricas.items():
+            acumulador.combinar(outro.metricas[nome])
+        self.scores.combinar(outro.scores)
+        for classe, quantidade in outro.classificacoes.items():
+            self.classificacoes[classe] += quantidade
+        self.div_comp.combinar(outro.div_comp)
+        return self
+
+    def complexidade_dataset(self) -> dict:
+        complexidade_media = self.scores.media if self.scores.n else 0
+        return {
+            'complexidade_media': complexidade_media,
+            'classificacao_geral': classificar_complexidade(complexidade_media),
+            'distribuicao_classificacoes': dict(self.classificacoes),
+            'total_avaliados': self.scores.n
+        }
+
+    def palavras_distintas(self) -> float:
+        if self.esboco is None:
+            return len(self.palavras_unicas)
+        return self.esboco.estimativa()
+
+    def diversidade_geral(self) -> float:
+        return self.palavras_distintas() / self.total_palavras if self.total_palavras > 0 else 0
+
+    def diversidade_silabica_geral(self) -> float:
+        """Sílabas distintas do corpus inteiro sobre o total de sílabas."""
+        return len(self.silabas_unicas) / self.total_silabas if self.total_silabas > 0 else 0
+
+    def modo_diversidade(self) -> str:
+        """Descrição, para os relatórios, do modo de cálculo das palavras distintas."""
+        if self.esboco is None:
+            return "exata"
+        return f"HyperLogLog (erro padrão ~{self.esboco.erro_padrao:.2%})"
+
+
+def complexidade_geral_dataset(resultados):
+    estatisticas = EstatisticasCorpus()
+    for dados in resultados.values():
+        estatisticas.adicionar_linha(dados)
+    return estatisticas.complexidade_dataset()
+
+
+def calcular_correlacao(resultados):
+    """Calcula correlação entre diversidade e complexidade"""
+    estatisticas = EstatisticasCorpus()
+    for dados in resultados.values():
+        estatisticas.adicionar_linha(dados)
+    return estatisticas.div_comp.correlacao()
+
+
+def calcular_estatisticas(valores):
+    acumulador = AcumuladorPositivos()
+    for v in valores:
+        acumulador.adicionar(v)
+    return acumulador.resumo()
+
+
+def analisar_corpus(fonte: Iterable[Documento], workers: Optional[int] = 1,
+                    chunksize: int = CHUNKSIZE_PADRAO, checkpoint=None,
+                    erro_diversidade: Optional[float] = None, executor=None,
+                    saida_documentos=None, vocabulario: Optional[Vocabulario] = None,
+                    guardar_resultados: bool = True) -> dict:
+    """Analisa todos os documentos da fonte e agrega os resultados.
+
+    A fonte é consumida sob demanda: só os lotes em análise ficam em memória,
+    nunca o corpus inteiro. Com um ``checkpoint`` (o mesmo passado à fonte),
+    o resultado de cada documento novo é gravado nele. Com ``erro_diversidade``
+    a diversidade geral é estimada por HyperLogLog (ver EstatisticasCorpus) e
+    ``modo_diversidade`` diz qual modo produziu o número. ``executor`` é um
+    pool de paralelo.abrir_pool, reaproveitado entre corpora. Cada documento
+    analisado também vai para ``saida_documentos`` (um escritor de
+    saida_documentos.py, relatorio.RelatorioIndividual ou uma lista deles), se
+    houver. Um ``vocabulario`` passado de fora é dividido com outros corpora.
+    No modo exato os documentos já são analisados com ids desse vocabulário;
+    com HyperLogLog as palavras ficam em str, para não guardar o vocabulário.
+
+    A linha de cada documento só fica em ``resultados_individual`` com
+    ``guardar_resultados``; sem ela o dicionário vem None e a memória não
+    cresce com o corpus (as linhas vão só para ``saida_documentos``).
+    """
+    resultados_individual = {} if guardar_resultados else None
+    if saida_documentos is None:
+        saidas = []
+    elif isinstance(saida_documentos, (list, tuple)):
+        saidas = list(saida_documentos)
+    else:
+        saidas = [saida_documentos]
+    documentos_analisados = 0
+    estatisticas = EstatisticasCorpus(erro_diversidade, vocabulario)
+    vocabulario_analise = estatisticas.vocabulario if erro_diversidade is None else None
+
+    def documentos():
+        for doc_id, texto in fonte:
+            estatisticas.arquivos_processados += 1
+            if texto is None:
+                if checkpoint is not None:
+                    checkpoint.registrar(doc_id, None)
+                continue
+            if texto:
+                estatisticas.arquivos_com_texto += 1
+            yield doc_id, texto
+
+    for doc_id, analise in analisar_documentos(documentos(), workers, chunksize, executor, vocabulario_analise):
+        if checkpoint is not None:
+            with perfil.etapa("checkpoint"):
+                checkpoint.registrar(doc_id, analise if analise is not None else "", estatisticas.vocabulario)
+        if saidas:
+            with perfil.etapa("saida"):
+                for saida in saidas:
+                    saida.escrever(doc_id, analise)
+        documentos_analisados += 1
+        if analise is None:
+            if resultados_individual is not None:
+                resultados_individual[doc_id] = AnaliseTexto().como_dict()
+            continue
+        with perfil.etapa("estatisticas"):
+            dados = estatisticas.adicionar(analise)
+        if resultados_individual is not None:
+            resultados_individual[doc_id] = dados
+
+    metricas = estatisticas.metricas
+    media_lexica, desvio_lexica, arquivos_validos_lexica = metricas['diversidade_lexica'].resumo()
+
+    return {
+        'resultados_individual': resultados_individual,
+        'documentos_analisados': documentos_analisados,
+        'arquivos_processados': estatisticas.arquivos_processados,
+        'arquivos_com_texto': estatisticas.arquivos_com_texto,
+        'diversidade_geral': estatisticas.diversidade_geral(),
+        'modo_diversidade': estatisticas.modo_diversidade(),
+        'media_lexica': media_lexica,
+        'desvio_lexica': desvio_lexica,
+        'arquivos_validos_lexica': arquivos_validos_lexica,
+        'media_complexidade': metricas['complexidade_lexica'].resumo()[0],
+        'media_prop_longas': metricas['proporcao_palavras_longas'].resumo()[0],
+        'media_silabica': metricas['diversidade_silabica'].resumo()[0],
+        'media_silabas_palavra': metricas['silabas_por_palavra'].resumo()[0],
+        'media_complexas': metricas['proporcao_complexas'].resumo()[0],
+        'diversidade_silabica_geral': estatisticas.diversidade_silabica_geral(),
+        'media_mattr': metricas['mattr'].resumo()[0],
+        'media_mtld': metricas['mtld'].resumo()[0],
+        'complexidade_dataset': estatisticas.complexidade_dataset(),
+        'correlacao_div_comp': estatisticas.div_comp.correlacao(),
+        'estatisticas': estatisticas
+    }
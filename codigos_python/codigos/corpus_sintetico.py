@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Gerador reprodutível de corpus sintético em português, para benchmarks.
+
+O vocabulário é montado a partir de sílabas (ataque + núcleo + coda) com
+uma mistura de tamanhos próxima à do português escrito; as palavras dos
+documentos são sorteadas com frequência zipfiana (a palavra de posto ``r``
+tem peso ``1 / r**expoente``). A mesma semente gera sempre o mesmo corpus.
+"""
+from __future__ import annotations
+
+import json
+import os
+import random
+from itertools import accumulate
+from typing import Iterator, List
+
+# Palavras gramaticais frequentes ocupam os primeiros postos, como num corpus real.
+PALAVRAS_FUNCIONAIS = [
+    "que", "não", "uma", "para", "com", "por", "mais", "como", "mas", "foi", "ele", "das",
+    "tem", "seu", "sua", "ser", "quando", "muito", "nos", "está", "também", "pelo", "pela",
+    "até", "isso", "ela", "entre", "depois", "sem", "mesmo", "aos", "seus", "quem", "nas",
+    "esse", "eles", "você", "essa", "num", "nem", "suas", "meu", "minha", "numa", "pelos",
+    "elas", "qual", "nós", "lhe", "deles", "essas", "esses", "pelas", "este", "dele",
+]
+
+ATAQUES = (["b", "c", "d", "f", "g", "l", "m", "n", "p", "r", "s", "t", "v"] * 4
+           + ["ch", "lh", "nh", "rr", "ss", "qu", "gu", "br", "cr", "pr", "tr", "gr", "pl", "cl", "fl", "j", "x", "z"]
+           + [""] * 6)
+# "rr", "ss", "lh" e "nh" não começam palavras.
+ATAQUES_INICIAIS = [a for a in ATAQUES if a not in ("rr", "ss", "lh", "nh")]
+NUCLEOS = ["a"] * 8 + ["e"] * 7 + ["o"] * 6 + ["i"] * 4 + ["u"] * 2 + ["ão", "ei", "ai", "ou", "ui"]
+CODAS = [""] * 14 + ["s", "r", "l", "m", "n"]
+ACENTOS = {"a": "á", "e": "é", "i": "í", "o": "ó", "u": "ú"}
+# Distribuição aproximada do número de sílabas por palavra de conteúdo.
+SILABAS_POR_PALAVRA = {2: 0.30, 3: 0.34, 4: 0.22, 5: 0.10, 6: 0.04}
+
+
+def _gerar_palavra(rng: random.Random) -> str:
+    n = rng.choices(list(SILABAS_POR_PALAVRA), weights=list(SILABAS_POR_PALAVRA.values()))[0]
+    silabas = [rng.choice(ATAQUES if i else ATAQUES_INICIAIS) + rng.choice(NUCLEOS) + rng.choice(CODAS)
+               for i in range(n)]
+    palavra = "".join(silabas)
+    if rng.random() < 0.12:
+        # acento gráfico numa vogal simples da palavra
+        posicoes = [i for i, c in enumerate(palavra) if c in ACENTOS]
+        if posicoes:
+            i = rng.choice(posicoes)
+            palavra = palavra[:i] + ACENTOS[palavra[i]] + palavra[i + 1:]
+    return palavra
+
+
+def gerar_vocabulario(tamanho: int = 20_000, semente: int = 42) -> List[str]:
+    """Lista de ``tamanho`` palavras distintas, da mais para a menos frequente."""
+    rng = random.Random(semente)
+    vocabulario = PALAVRAS_FUNCIONAIS[:tamanho]
+    vistas = set(vocabulario)
+    while len(vocabulario) < tamanho:
+        palavra = _gerar_palavra(rng)
+        if len(palavra) >= 3 and palavra not in vistas:
+            vistas.add(palavra)
+            vocabulario.append(palavra)
+    return vocabulario
+
+
+def gerar_documentos(n_documentos: int = 200, palavras_por_documento: int = 300,
+                     vocabulario: int = 20_000, expoente: float = 1.1,
+                     semente: int = 42) -> Iterator[str]:
+    """Textos com tamanho em torno de ``palavras_por_documento`` (±50%), em frases."""
+    palavras = gerar_vocabulario(vocabulario, semente)
+    pesos = list(accumulate(1 / r ** expoente for r in range(1, len(palavras) + 1)))
+    rng = random.Random(semente + 1)
+    for _ in range(n_documentos):
+        n = max(1, round(palavras_por_documento * rng.uniform(0.5, 1.5)))
+        tokens = rng.choices(palavras, cum_weights=pesos, k=n)
+        frases = []
+        inicio = 0
+        while inicio < n:
+            fim = min(n, inicio + rng.randint(6, 20))
+            frase = " ".join(tokens[inicio:fim])
+            frases.append(frase[:1].upper() + frase[1:] + rng.choice([".", ".", ".", ",", "!", "?"]))
+            inicio = fim
+        yield " ".join(frases)
+
+
+def gravar_corpus_json(pasta, campo: str = "comando_tematico", **opcoes) -> int:
+    """Grava os documentos como ``doc_00000.json`` no formato lido por fonte_pasta_json.
+
+    ``opcoes`` são repassadas a gerar_documentos. Devolve o número de arquivos.
+    """
+    os.makedirs(pasta, exist_ok=True)
+    n = 0
+    for n, texto in enumerate(gerar_documentos(**opcoes), 1):
+        with open(os.path.join(pasta, f"doc_{n:05d}.json"), "w", encoding="utf-8") as arqui:
+            json.dump({campo: {"texto": texto}}, arqui, ensure_ascii=False)
+    return n
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Medidas de diversidade léxica que não caem com o tamanho do texto.
+
+A razão tipo/token (diversidade_lexica) diminui à medida que o texto cresce,
+então textos de tamanhos diferentes não se comparam. As duas medidas daqui
+olham para a sequência de tokens:
+
+  - MATTR (Covington & McFall, 2010): média da razão tipo/token de todas as
+    janelas de ``janela`` tokens consecutivos;
+  - MTLD (McCarthy & Jarvis, 2010): tamanho médio dos trechos em que a razão
+    tipo/token acumulada se mantém acima de ``limiar``, média da leitura
+    para a frente e para trás.
+
+As duas são O(n): a janela do MATTR anda com um contador incremental (entra
+um token, sai outro) em vez de recontar cada janela, e o MTLD só mantém os
+tipos do trecho atual.
+"""
+from __future__ import annotations
+
+from typing import Dict, Sequence
+
+JANELA_MATTR = 50
+LIMIAR_MTLD = 0.72
+
+
+def mattr(palavras: Sequence[str], janela: int = JANELA_MATTR) -> float:
+    """MATTR dos tokens; com menos de ``janela`` tokens é a razão tipo/token do texto."""
+    n = len(palavras)
+    if n == 0:
+        return 0
+    if n <= janela:
+        return len(set(palavras)) / n
+
+    contagem: Dict[str, int] = {}
+    for palavra in palavras[:janela]:
+        contagem[palavra] = contagem.get(palavra, 0) + 1
+    distintos = len(contagem)
+    soma = distintos
+    for sai, entra in zip(palavras, palavras[janela:]):
+        if sai != entra:
+            c = contagem[sai]
+            if c == 1:
+                del contagem[sai]
+                distintos -= 1
+            else:
+                contagem[sai] = c - 1
+            c = contagem.get(entra, 0)
+            if c == 0:
+                distintos += 1
+            contagem[entra] = c + 1
+        soma += distintos
+    return soma / ((n - janela + 1) * janela)
+
+
+def _fatores_mtld(palavras, limiar: float) -> float:
+    fatores = 0.0
+    tipos = set()
+    adicionar, limpar = tipos.add, tipos.clear
+    tokens = 0
+    for palavra in palavras:
+        adicionar(palavra)
+        tokens += 1
+        if len(tipos) / tokens <= limiar:
+            fatores += 1
+            limpar()
+            tokens = 0
+    if tokens:
+        # trecho final incompleto conta a fração do caminho até o limiar
+        fatores += (1 - len(tipos) / tokens) / (1 - limiar)
+    return fatores
+
+
+def mtld(palavras: Sequence[str], limiar: float = LIMIAR_MTLD) -> float:
+    """MTLD dos tokens; se a razão tipo/token nunca cai (nem em parte) até o limiar, vale ``n``."""
+    n = len(palavras)
+    if n == 0:
+        return 0
+    medidas = []
+    for sequencia in (palavras, reversed(palavras)):
+        fatores = _fatores_mtld(sequencia, limiar)
+        medidas.append(n / fatores if fatores > 0 else n)
+    return (medidas[0] + medidas[1]) / 2
+
+
+def _mattr_ingenuo(palavras: Sequence[str], janela: int = JANELA_MATTR) -> float:
+    # recontagem de cada janela, O(n * janela); só como referência do benchmark
+    n = len(palavras)
+    if n == 0:
+        return 0
+    if n <= janela:
+        return len(set(palavras)) / n
+    return sum(len(set(palavras[i:i + janela])) for i in range(n - janela + 1)) / ((n - janela + 1) * janela)
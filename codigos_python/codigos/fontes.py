@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+"""
+Fontes de corpus: geradores que produzem ``(doc_id, texto)`` sob demanda.
+
+Convenção do texto produzido:
+  - ``str`` não vazia: documento a analisar;
+  - ``""``: documento lido, mas sem texto (entra no relatório com zeros);
+  - ``None``: documento lido, mas inválido (só conta como processado);
+  - ``AnaliseTexto``: documento já analisado, retomado de um checkpoint;
+  - ``DocumentoPacote``: tokens de um corpus empacotado (ver pacote.py).
+Arquivos que nem puderam ser lidos não são produzidos.
+
+As fontes de arquivos separam a listagem (``listar_*``: pares
+``(doc_id, caminho)``) da leitura (``ler_*``), e fonte_arquivos junta as duas.
+"""
+from __future__ import annotations
+
+import os
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+try:
+    from . import perfil
+    from .json_seletivo import CampoJSON, compilar_campo
+    from .pacote import Pacote
+except ImportError:
+    import perfil
+    from json_seletivo import CampoJSON, compilar_campo
+    from pacote import Pacote
+
+Documento = Tuple[str, Optional[str]]
+Arquivo = Tuple[str, str]
+
+# Tamanho da lista de partes do XML a partir do qual os trechos completos são unidos.
+_LIMITE_PARTES = 4096
+# Leituras antecipadas (prontas ou em andamento) por thread leitora, se a capacidade não for dada.
+LEITURAS_POR_LEITOR = 4
+
+
+def extrair_texto_json(dados, campo="comando_tematico"):
+    """Junta os valores string de ``dados[campo]``; None se o campo for inválido."""
+    if campo in dados and isinstance(dados[campo], dict):
+        textos = []
+        for valor in dados[campo].values():
+            if isinstance(valor, str):
+                textos.append(valor)
+        return " ".join(textos).strip()
+    return None
+
+
+def _contar_arquivo(arqui) -> None:
+    if perfil.ativo is not None:
+        perfil.ativo.contar("arquivos")
+        perfil.ativo.contar("bytes", os.fstat(arqui.fileno()).st_size)
+
+
+def extrair_texto_prompt_xml(caminho_arquivo):
+    """Texto do ``<body>`` de um prompt.xml; "" (com aviso impresso) se o XML for inválido."""
+    try:
+        with open(caminho_arquivo, "rb") as arqui:
+            _contar_arquivo(arqui)
+            with perfil.etapa("parse"):
+                return texto_body(arqui)
+
+    except Exception as e:
+        print(f"Erro ao ler {caminho_arquivo}: {e}")
+        return ""
+
+
+def _compactar(partes: list, posicao: dict) -> list:
+    # une os trechos já completos entre as posições ainda pendentes
+    novas = []
+    inicio = 0
+    for i, elem in sorted(((i, elem) for elem, i in posicao.items()), key=lambda par: par[0]):
+        novas.append("".join(partes[inicio:i]))
+        posicao[elem] = len(novas)
+        novas += partes[i:i + 2]
+        inicio = i + 2
+    novas.append("".join(partes[inicio:]))
+    return novas
+
+
+def texto_body(origem) -> str:
+    """Junta o texto do primeiro ``<body>`` filho da raiz, lendo o XML com iterparse.
+
+    A ordem é a da extração original (que percorria ``body.iter()``): o texto
+    do body e, para cada elemento em pré-ordem, o texto (exceto o do próprio
+    body) e a cauda, se não for só espaço. Cada elemento reserva duas posições
+    numa lista de partes, unida no final; os elementos são descartados assim
+    que sua cauda é lida e os trechos completos da lista são unidos de tempos
+    em tempos, então a memória não cresce com a árvore. O documento é lido até
+    o fim, para que XML malformado continue dando erro.
+    """
+    partes = []
+    posicao = {}  # elemento do body ainda pendente -> índice do seu texto em partes
+    limite = _LIMITE_PARTES
+    abertos = []
+    terminado = None
+    achou_corpo = dentro = False
+    for evento, elem in ET.iterparse(origem, events=("start", "end")):
+        if terminado is not None:
+            # a cauda de um elemento só está completa no evento seguinte ao seu fim
+            i = posicao.pop(terminado, None)
+            if i is not None:
+                cauda = terminado.tail
+                if cauda and cauda.strip():
+                    partes[i + 1] = " " + cauda
+            terminado.clear()
+            abertos[-1].remove(terminado)
+            terminado = None
+
+        if evento == "start":
+            if dentro or (not achou_corpo and len(abertos) == 1 and elem.tag == 'body'):
+                achou_corpo = dentro = True
+                posicao[elem] = len(partes)
+                partes += ("", "")
+                if len(partes) > limite:
+                    partes = _compactar(partes, posicao)
+                    limite = max(_LIMITE_PARTES, 2 * len(partes))
+            abertos.append(elem)
+            continue
+
+        abertos.pop()
+        i = posicao.get(elem)
+        if i is not None:
+            corpo_terminou = len(abertos) == 1
+            if elem.text:
+                partes[i] = elem.text if corpo_terminou else " " + elem.text
+            if corpo_terminou:
+                dentro = False
+        if abertos:
+            terminado = elem
+
+    return "".join(partes).strip()
+
+
+def _resolvido(resultado=None, erro: Optional[BaseException] = None) -> Future:
+    futuro = Future()
+    if erro is None:
+        futuro.set_result(resultado)
+    else:
+        futuro.set_exception(erro)
+    return futuro
+
+
+def _ler_antecipado(arquivos: Iterable[Arquivo], ler: Callable[[str, str], Optional[str]], checkpoint,
+                    leitores: int, capacidade: int) -> Iterator[Tuple[str, Future]]:
+    # O checkpoint (SQLite, preso à thread que o abriu) é consultado aqui; só
+    # os arquivos novos vão para as threads. A fila guarda no máximo
+    # ``capacidade`` documentos à frente do consumidor.
+    retomar = checkpoint.retomador(ler) if checkpoint is not None else None
+    executor = ThreadPoolExecutor(max_workers=leitores, thread_name_prefix="leitor")
+    try:
+        pendentes = deque()
+        for doc_id, caminho in arquivos:
+            try:
+                encontrado, resultado = retomar(doc_id, caminho) if retomar is not None else (False, None)
+            except Exception as e:
+                futuro = _resolvido(erro=e)
+            else:
+                futuro = _resolvido(resultado) if encontrado else executor.submit(ler, doc_id, caminho)
+            pendentes.append((doc_id, futuro))
+            if len(pendentes) >= capacidade:
+                yield pendentes.popleft()
+        while pendentes:
+            yield pendentes.popleft()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def fonte_arquivos(arquivos: Iterable[Arquivo], ler: Callable[[str, str], Optional[str]],
+                   checkpoint=None, leitores: int = 0, capacidade: Optional[int] = None) -> Iterator[Documento]:
+    """Lê cada ``(doc_id, caminho)`` com ``ler``; arquivos ilegíveis são pulados.
+
+    Com um ``checkpoint`` (ver checkpoint.py), arquivos que não mudaram desde a
+    última execução não são lidos: o resultado gravado é devolvido no lugar do texto.
+
+    Com ``leitores > 0`` os arquivos são lidos antecipadamente por esse número
+    de threads, até ``capacidade`` documentos (padrão LEITURAS_POR_LEITOR por
+    leitor) à frente de quem consome a fonte: o disco trabalha enquanto o
+    documento anterior é analisado, e a memória fica limitada. A ordem dos
+    documentos não muda; só os avisos impressos pelos leitores podem sair
+    fora de ordem.
+    """
+    if perfil.ativo is not None:
+        arquivos = perfil.ativo.iterar(arquivos, "listagem")
+    if leitores > 0:
+        for doc_id, futuro in _ler_antecipado(arquivos, ler, checkpoint, leitores,
+                                              capacidade or LEITURAS_POR_LEITOR * leitores):
+            try:
+                texto = futuro.result()
+            except Exception as e:
+                print(f"Erro ao ler {doc_id}: {e}")
+                continue
+            yield doc_id, texto
+        return
+
+    if checkpoint is not None:
+        ler = checkpoint.envolver(ler)
+    for doc_id, caminho in arquivos:
+        try:
+            texto = ler(doc_id, caminho)
+        except Exception as e:
+            print(f"Erro ao ler {doc_id}: {e}")
+            continue
+        yield doc_id, texto
+
+
+def listar_pasta(pasta, extensao) -> Iterator[Arquivo]:
+    """Arquivos de ``pasta`` terminados em ``extensao``; o id é o nome do arquivo."""
+    with os.scandir(pasta) as entradas:
+        for entrada in entradas:
+            if entrada.name.lower().endswith(extensao):
+                yield entrada.name, entrada.path
+
+
+def listar_pastas_xml(pasta_data, nome_arquivo="prompt.xml") -> Iterator[Arquivo]:
+    """Subpastas de ``pasta_data`` que contêm ``nome_arquivo``; o id é o nome da subpasta."""
+    with os.scandir(pasta_data) as entradas:
+        for entrada in entradas:
+            if not entrada.is_dir():
+                continue
+            caminho_prompt = os.path.join(entrada.path, nome_arquivo)
+            if os.path.isfile(caminho_prompt):
+                yield entrada.name, caminho_prompt
+
+
+def ler_json(arquivo, caminho, campo="comando_tematico") -> Optional[str]:
+    """Texto de ``campo`` (caminho ``"a.b"`` ou CampoJSON), lendo o arquivo só até ele."""
+    if not isinstance(campo, CampoJSON):
+        campo = compilar_campo(campo)
+    with open(caminho, "rb") as arqui:
+        _contar_arquivo(arqui)
+        # leitura e parse andam juntos: o arquivo é lido em blocos até o fim do campo
+        with perfil.etapa("parse"):
+            texto = campo.ler(arqui)
+
+    if texto is None:
+        print(f"Aviso: Campo '{campo}' não encontrado ou inválido em {arquivo}")
+    elif not texto:
+        print(f"Aviso: Texto vazio em {arquivo}")
+    return texto
+
+
+def ler_prompt_xml(pasta, caminho_prompt) -> str:
+    texto = extrair_texto_prompt_xml(caminho_prompt)
+    if not texto:
+        print(f"Aviso: Texto vazio em {caminho_prompt}")
+    return texto
+
+
+def ler_texto(arquivo, caminho) -> str:
+    with perfil.etapa("leitura"):
+        with open(caminho, "r", encoding="utf-8") as arqui:
+            _contar_arquivo(arqui)
+            texto = arqui.read().strip()
+    if not texto:
+        print(f"Aviso: Texto vazio em {arquivo}")
+    return texto
+
+
+def fonte_pasta_json(pasta, campo="comando_tematico", checkpoint=None, leitores: int = 0) -> Iterator[Documento]:
+    """Arquivos ``*.json`` de ``pasta``; o texto vem dos valores de ``campo`` (ver ler_json)."""
+    ler = partial(ler_json, campo=campo if isinstance(campo, CampoJSON) else CampoJSON(campo))
+    return fonte_arquivos(listar_pasta(pasta, ".json"), ler, checkpoint, leitores)
+
+
+def fonte_pastas_xml(pasta_data, nome_arquivo="prompt.xml", checkpoint=None, leitores: int = 0) -> Iterator[Documento]:
+    """Subpastas de ``pasta_data`` que contêm ``prompt.xml``; o id é o nome da subpasta."""
+    return fonte_arquivos(listar_pastas_xml(pasta_data, nome_arquivo), ler_prompt_xml, checkpoint, leitores)
+
+
+def fonte_pasta_texto(pasta, extensao=".txt", checkpoint=None, leitores: int = 0) -> Iterator[Documento]:
+    """Arquivos de texto puro de ``pasta``, um documento por arquivo."""
+    return fonte_arquivos(listar_pasta(pasta, extensao), ler_texto, checkpoint, leitores)
+
+
+def fonte_pacote(caminho, checkpoint=None, leitores: int = 0) -> Iterator[Documento]:
+    """Documentos de um corpus empacotado (pacote.empacotar), sem abrir os arquivos originais.
+
+    ``checkpoint`` e ``leitores`` são aceitos pela mesma assinatura das outras
+    fontes e ignorados: não há arquivo por documento a retomar nem a ler.
+    """
+    with Pacote(caminho) as pacote:
+        yield from pacote.documentos()
+
+
+def fonte_linhas(caminho) -> Iterator[Documento]:
+    """Um documento por linha não vazia de um arquivo texto (``nome:linha``)."""
+    nome = os.path.basename(caminho)
+    with open(caminho, "r", encoding="utf-8") as arqui:
+        for numero, linha in enumerate(arqui, 1):
+            texto = linha.strip()
+            if texto:
+                yield f"{nome}:{numero}", texto
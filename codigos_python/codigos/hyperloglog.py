@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+HyperLogLog: estimativa do número de palavras distintas em memória fixa.
+
+Substitui o set de todas as palavras do corpus quando ele não cabe em
+memória. Com ``2**p`` registradores de um byte o erro padrão relativo é
+cerca de ``1.04 / sqrt(2**p)``; esboços com a mesma precisão se combinam
+(máximo registrador a registrador), então partes do corpus processadas
+separadamente dão a mesma estimativa que o corpus inteiro.
+"""
+from __future__ import annotations
+
+import math
+from hashlib import blake2b
+from typing import Iterable
+
+PRECISAO_MIN = 4
+PRECISAO_MAX = 18
+
+
+def precisao_para_erro(erro: float) -> int:
+    """Menor precisão ``p`` cujo erro padrão não passa de ``erro`` (limitada a 4..18)."""
+    if erro <= 0:
+        raise ValueError("erro deve ser positivo")
+    p = math.ceil(math.log2((1.04 / erro) ** 2))
+    return min(max(p, PRECISAO_MIN), PRECISAO_MAX)
+
+
+def _hash64(palavra: str) -> int:
+    # hash estável entre processos (o hash() de str muda a cada execução)
+    return int.from_bytes(blake2b(palavra.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HyperLogLog:
+    """Esboço HyperLogLog de 64 bits com correção de intervalo pequeno."""
+
+    __slots__ = ("p", "m", "registradores")
+
+    def __init__(self, p: int = 14):
+        if not PRECISAO_MIN <= p <= PRECISAO_MAX:
+            raise ValueError(f"precisão deve estar entre {PRECISAO_MIN} e {PRECISAO_MAX}")
+        self.p = p
+        self.m = 1 << p
+        self.registradores = bytearray(self.m)
+
+    @classmethod
+    def para_erro(cls, erro: float) -> "HyperLogLog":
+        return cls(precisao_para_erro(erro))
+
+    @property
+    def erro_padrao(self) -> float:
+        return 1.04 / math.sqrt(self.m)
+
+    def adicionar(self, palavra: str) -> None:
+        h = _hash64(palavra)
+        indice = h >> (64 - self.p)
+        resto = h & ((1 << (64 - self.p)) - 1)
+        posto = (64 - self.p) - resto.bit_length() + 1
+        if posto > self.registradores[indice]:
+            self.registradores[indice] = posto
+
+    def atualizar(self, palavras: Iterable[str]) -> None:
+        for palavra in palavras:
+            self.adicionar(palavra)
+
+    def combinar(self, outro: "HyperLogLog") -> "HyperLogLog":
+        """Incorpora ``outro`` (mesma precisão) a este esboço e devolve ``self``."""
+        if outro.p != self.p:
+            raise ValueError("só é possível combinar esboços com a mesma precisão")
+        self.registradores = bytearray(map(max, self.registradores, outro.registradores))
+        return self
+
+    def __len__(self) -> int:
+        return round(self.estimativa())
+
+    def estimativa(self) -> float:
+        m = self.m
+        if m >= 128:
+            alfa = 0.7213 / (1 + 1.079 / m)
+        else:
+            alfa = {16: 0.673, 32: 0.697, 64: 0.709}[m]
+        registradores = self.registradores
+        soma = sum(registradores.count(v) * 2.0 ** -v for v in set(registradores))
+        estimativa = alfa * m * m / soma
+        vazios = registradores.count(0)
+        if estimativa <= 2.5 * m and vazios:
+            # contagem linear: mais precisa com poucos elementos
+            return m * math.log(m / vazios)
+        return estimativa
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+Leitura seletiva de um campo de arquivos JSON.
+
+Os arquivos ``*_saida.json`` trazem, depois do prompt, a saída gerada, bem
+maior e que a análise nunca usa. Em vez de ``json.load`` no arquivo inteiro,
+CampoJSON lê o arquivo em blocos só até o fim do campo pedido e decodifica
+apenas o valor dele:
+
+  - ``stdlib``: percorre as chaves do objeto de topo com o decodificador do
+    módulo json; valores de outras chaves que vierem antes são pulados;
+  - ``ijson`` (se instalado): o mesmo, com o parser em fluxo do ijson; é o
+    padrão quando o ijson usa o backend em C (yajl2_c);
+  - ``orjson`` (se instalado): decodifica o arquivo inteiro, mas em C. Nos
+    ``_saida.json`` (strings longas cheias de ``\\uXXXX``) fica mais lento
+    que a leitura seletiva, por isso só é usado se pedido.
+
+O texto é o mesmo de ``extrair_texto_json(json.load(arqui), campo)`` para
+JSON válido, inclusive com a chave repetida no objeto, em que vale a última
+ocorrência: a leitura segue até o fim do objeto de topo, mas as strings das
+outras chaves são só puladas, sem decodificar os escapes. Por isso um erro
+dentro delas não é detectado; se o campo não puder ser extraído (JSON
+inválido, topo que não é objeto), o arquivo é lido inteiro e passa por
+``json.loads``, que dá o resultado ou o erro de sempre.
+"""
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from functools import lru_cache
+from typing import BinaryIO, Optional, Sequence, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+BACKENDS = ("auto", "stdlib", "ijson", "orjson")
+
+# Primeiro bloco lido de cada arquivo; os seguintes dobram de tamanho.
+BLOCO_INICIAL = 8 * 1024
+
+_espacos = re.compile(r'[ \t\n\r]*').match
+_decodificar = json.JSONDecoder().raw_decode
+_scanstring = json.decoder.scanstring
+
+
+class _NaoEncontrado(Exception):
+    """O trecho lido não basta para extrair o campo (incompleto ou fora do formato esperado)."""
+
+
+def _pular_valor(s: str, pos: int) -> int:
+    """Posição logo depois do valor JSON que começa em ``pos``; strings não são decodificadas."""
+    if s[pos] != '"':
+        return _decodificar(s, pos)[1]
+    fim = s.find('"', pos + 1)
+    while fim >= 0:
+        # a aspa fecha a string se não for escapada (número par de barras antes dela)
+        barra = fim - 1
+        while s[barra] == "\\":
+            barra -= 1
+        if (fim - barra) % 2:
+            return fim + 1
+        fim = s.find('"', fim + 1)
+    raise _NaoEncontrado
+
+
+def _valor_da_chave(s: str, chave: str) -> Tuple[bool, object]:
+    """``(True, valor)`` da última ocorrência de ``chave`` no objeto de topo de ``s``, como em json.load.
+
+    ``(False, None)`` se o objeto não tem a chave; _NaoEncontrado se ``s``
+    acaba antes do fim do objeto ou não começa com um objeto.
+    """
+    achou, valor = False, None
+    try:
+        pos = _espacos(s).end()
+        if s[pos] != "{":
+            raise _NaoEncontrado
+        pos = _espacos(s, pos + 1).end()
+        if s[pos] == "}":
+            return False, None
+        while True:
+            if s[pos] != '"':
+                raise _NaoEncontrado
+            nome, pos = _scanstring(s, pos + 1)
+            pos = _espacos(s, pos).end()
+            if s[pos] != ":":
+                raise _NaoEncontrado
+            pos = _espacos(s, pos + 1).end()
+            if nome == chave:
+                valor, pos = _decodificar(s, pos)
+                achou = True
+            else:
+                pos = _pular_valor(s, pos)
+            pos = _espacos(s, pos).end()
+            if s[pos] == "}":
+                return achou, valor
+            if s[pos] != ",":
+                raise _NaoEncontrado
+            pos = _espacos(s, pos + 1).end()
+    except (IndexError, ValueError):
+        # ValueError inclui json.JSONDecodeError: valor cortado no fim do bloco ou inválido
+        raise _NaoEncontrado from None
+
+
+def _texto(valor) -> Optional[str]:
+    if isinstance(valor, dict):
+        return " ".join(v for v in valor.values() if isinstance(v, str)).strip()
+    return None
+
+
+class CampoJSON:
+    """Caminho compilado de um campo: ``"a"``, ``"a.b"`` ou uma sequência de chaves.
+
+    ``ler(arqui)`` (arquivo binário) e ``extrair(conteudo)`` devolvem os
+    valores string do objeto no caminho, unidos por espaço como em
+    extrair_texto_json, ou None se o caminho não existir ou não levar a um objeto.
+    """
+
+    def __init__(self, caminho: Union[str, Sequence[str]], backend: str = "auto"):
+        if backend not in BACKENDS:
+            raise ValueError(f"backend deve ser um de {BACKENDS}")
+        if backend == "ijson" and ijson is None or backend == "orjson" and orjson is None:
+            raise ImportError(f"backend '{backend}' não está instalado")
+        self.chaves: Tuple[str, ...] = tuple(caminho.split(".")) if isinstance(caminho, str) else tuple(caminho)
+        if not self.chaves or not all(self.chaves):
+            raise ValueError(f"caminho de campo inválido: {caminho!r}")
+        self.caminho = ".".join(self.chaves)
+        if backend == "auto":
+            backend = "ijson" if ijson is not None and ijson.backend == "yajl2_c" else "stdlib"
+        self.backend = backend
+
+    def __str__(self) -> str:
+        return self.caminho
+
+    def __repr__(self) -> str:
+        return f"CampoJSON({self.caminho!r}, backend={self.backend!r})"
+
+    def _percorrer(self, valor, chaves) -> Optional[str]:
+        for chave in chaves:
+            if not isinstance(valor, dict) or chave not in valor:
+                return None
+            valor = valor[chave]
+        return _texto(valor)
+
+    def _completo(self, dados) -> Optional[str]:
+        # o mesmo teste de extrair_texto_json, inclusive para topo que não é objeto
+        if self.chaves[0] not in dados:
+            return None
+        return self._percorrer(dados[self.chaves[0]], self.chaves[1:])
+
+    def _procurar(self, s: str) -> Optional[str]:
+        achou, valor = _valor_da_chave(s, self.chaves[0])
+        return self._percorrer(valor, self.chaves[1:]) if achou else None
+
+    def extrair(self, conteudo: Union[str, bytes]) -> Optional[str]:
+        """Como ``ler``, mas sobre o conteúdo já em memória."""
+        if isinstance(conteudo, bytes):
+            conteudo = conteudo.decode("utf-8")
+        try:
+            return self._procurar(conteudo)
+        except _NaoEncontrado:
+            return self._completo(json.loads(conteudo))
+
+    def ler(self, arqui: BinaryIO) -> Optional[str]:
+        if self.backend == "orjson":
+            conteudo = arqui.read()
+            try:
+                return self._completo(orjson.loads(conteudo))
+            except orjson.JSONDecodeError:
+                return self._completo(json.loads(conteudo.decode("utf-8")))
+        if self.backend == "ijson":
+            try:
+                # a chave de topo pode se repetir: vale a última, como em json.load
+                achou, valor = False, None
+                for valor in ijson.items(arqui, self.chaves[0], use_float=True):
+                    achou = True
+                return self._percorrer(valor, self.chaves[1:]) if achou else None
+            except ijson.JSONError:
+                arqui.seek(0)
+                return self._completo(json.loads(arqui.read().decode("utf-8")))
+
+        decodificador = codecs.getincrementaldecoder("utf-8")()
+        s = ""
+        tamanho = BLOCO_INICIAL
+        while True:
+            bloco = arqui.read(tamanho)
+            s += decodificador.decode(bloco, final=not bloco)
+            if not bloco:
+                return self.extrair(s)
+            try:
+                return self._procurar(s)
+            except _NaoEncontrado:
+                tamanho *= 2
+
+
+@lru_cache(maxsize=None)
+def compilar_campo(caminho: Union[str, Tuple[str, ...]], backend: str = "auto") -> CampoJSON:
+    """CampoJSON compilado uma vez por caminho e backend."""
+    return CampoJSON(caminho, backend)
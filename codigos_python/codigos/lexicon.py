@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+Léxico persistente de silabação (SQLite): palavra -> (tônica, sílabas).
+
+O léxico fica atrás do cache LRU de syllable.py e é compartilhado entre
+execuções. A chave de versão é o hash do código de syllable.py: qualquer
+mudança nas regras invalida o conteúdo gravado.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from . import syllable
+except ImportError:
+    import syllable
+
+Entry = Tuple[str, int, Tuple[str, ...]]
+
+DEFAULT_BATCH_SIZE = 1000
+_SEP = "\x1f"
+
+
+def _encode(syllables: Tuple[str, ...]) -> Optional[str]:
+    return _SEP.join(syllables) if syllables else None
+
+
+def _decode(value: Optional[str]) -> Tuple[str, ...]:
+    return () if value is None else tuple(value.split(_SEP))
+
+
+def ruleset_version() -> str:
+    """Hash do código-fonte de syllable.py (independente de fim de linha)."""
+    with open(syllable.__file__, "rb") as f:
+        code = f.read().replace(b"\r\n", b"\n")
+    return hashlib.sha256(code).hexdigest()
+
+
+class SyllableLexicon:
+    """Léxico em disco consultado por word2syllables nas faltas do cache.
+
+    Com ``read_only=True`` (uso nos workers) nada é gravado: as palavras novas
+    ficam em memória até serem recolhidas com ``drain_new`` e repassadas ao
+    processo que tem o léxico aberto para escrita. Com ``preload=True`` a
+    tabela inteira é lida para um dict na abertura e as consultas não tocam
+    o disco; para léxicos muito grandes use ``preload=False``.
+    """
+
+    def __init__(self, path, read_only: bool = False, batch_size: int = DEFAULT_BATCH_SIZE,
+                 preload: bool = True):
+        self.path = os.fspath(path)
+        self.read_only = read_only
+        self.batch_size = batch_size
+        self.hits = 0
+        self.misses = 0
+        self._pending: List[Entry] = []
+        self.version = ruleset_version()
+
+        if read_only:
+            uri = "file:" + self.path.replace("\\", "/") + "?mode=ro"
+            self._conn = sqlite3.connect(uri, uri=True)
+            self.valid = self._stored_version() == self.version
+        else:
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS words (word TEXT PRIMARY KEY, stressed INTEGER, syllables TEXT)"
+            )
+            if self._stored_version() != self.version:
+                self._conn.execute("DELETE FROM words")
+                self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (self.version,))
+            self._conn.commit()
+            self.valid = True
+
+        self._memory = None
+        if preload and self.valid:
+            self._memory = {
+                word: (stressed, _decode(syllables))
+                for word, stressed, syllables in self._conn.execute("SELECT * FROM words")
+            }
+
+    def _stored_version(self) -> Optional[str]:
+        try:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        except sqlite3.DatabaseError:
+            return None
+        return row[0] if row else None
+
+    def lookup(self, word: str) -> Optional[Tuple[int, Tuple[str, ...]]]:
+        if not self.valid:
+            return None
+        if self._memory is not None:
+            found = self._memory.get(word)
+        else:
+            row = self._conn.execute(
+                "SELECT stressed, syllables FROM words WHERE word = ?", (word,)
+            ).fetchone()
+            found = None if row is None else (row[0], _decode(row[1]))
+        if found is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return found
+
+    def add(self, word: str, stressed: int, syllables: Tuple[str, ...]) -> None:
+        self._pending.append((word, stressed, syllables))
+        if self._memory is not None:
+            self._memory[word] = (stressed, syllables)
+        if not self.read_only and len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def add_many(self, entries: Iterable[Entry]) -> None:
+        entries = list(entries)
+        self._pending.extend(entries)
+        if self._memory is not None:
+            self._memory.update((word, (stressed, syllables)) for word, stressed, syllables in entries)
+        if not self.read_only and len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def drain_new(self) -> List[Entry]:
+        """Devolve e esquece as palavras novas ainda não gravadas."""
+        pending, self._pending = self._pending, []
+        return pending
+
+    def flush(self) -> None:
+        if self.read_only or not self._pending:
+            return
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO words VALUES (?, ?, ?)",
+            [(w, s, _encode(syl)) for w, s, syl in self.drain_new()],
+        )
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        if not self.valid:
+            return 0
+        return self._conn.execute("SELECT COUNT(*) FROM words").fetchone()[0]
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+    def __enter__(self) -> "SyllableLexicon":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+@contextmanager
+def lexicon_enabled(path, read_only: bool = False) -> Iterator[SyllableLexicon]:
+    """Abre o léxico e o liga em word2syllables durante o bloco ``with``."""
+    previous = syllable.get_lexicon()
+    lexicon = SyllableLexicon(path, read_only=read_only)
+    syllable.set_lexicon(lexicon)
+    try:
+        yield lexicon
+    finally:
+        syllable.set_lexicon(previous)
+        lexicon.close()
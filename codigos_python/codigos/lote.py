@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+API em lote: as métricas de muitos textos de uma vez, em colunas.
+
+    from codigos import analyze_many
+    colunas = analyze_many(textos)              # dict de arrays NumPy (ou listas)
+    colunas["diversidade_lexica"][i]            # métrica do i-ésimo texto
+
+Cada palavra distinta do lote é silabada uma vez só e as contagens de cada
+texto saem da frequência de cada tipo (analise.analisar_frequencias); com
+NumPy as somas e as métricas por documento saem de vetorizado.metricas_lote
+sobre os pares (documento, tipo). Os valores são os mesmos de analisar_texto.
+Com ``workers > 1`` o lote é dividido em pedaços analisados num pool de
+processos (ver paralelo.py), cada um com a sua tabela.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from functools import partial
+from typing import Dict, Iterable, List, Optional
+
+try:
+    from .analise import analisar_frequencias
+    from .diversidade import mattr, mtld
+    from .paralelo import mapear_em_ordem, resolver_workers, retorno_lote
+    from .syllable import word2syllables
+    from .tokenizador import extrair_palavras
+except ImportError:
+    from analise import analisar_frequencias
+    from diversidade import mattr, mtld
+    from paralelo import mapear_em_ordem, resolver_workers, retorno_lote
+    from syllable import word2syllables
+    from tokenizador import extrair_palavras
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+else:
+    try:
+        from .vetorizado import metricas_lote
+    except ImportError:
+        from vetorizado import metricas_lote
+
+# Textos por pedaço enviado a um worker.
+CHUNKSIZE_LOTE = 512
+
+_FALTA = object()
+
+COLUNAS = ("total_palavras", "palavras_distintas", "diversidade_lexica", "complexidade_lexica",
+           "proporcao_palavras_longas", "proporcao_muito_longas", "diversidade_silabica",
+           "proporcao_complexas", "silabas_por_palavra", "mattr", "mtld")
+# colunas que são campos de AnaliseTexto
+_CAMPOS = tuple(nome for nome in COLUNAS if nome != "palavras_distintas")
+
+
+def _colunas_vazias() -> Dict[str, list]:
+    return {nome: [] for nome in COLUNAS}
+
+
+def _silabador_do_lote():
+    """word2syllables com uma tabela própria do lote, que guarda também as falhas."""
+    tabela = {}
+
+    def silabar(palavra: str):
+        silabas = tabela.get(palavra, _FALTA)
+        if silabas is _FALTA:
+            try:
+                silabas = tuple(word2syllables(palavra))
+            except Exception:
+                silabas = None
+            tabela[palavra] = silabas
+        if silabas is None:
+            raise ValueError(f"não foi possível silabar '{palavra}'")
+        return silabas
+
+    return silabar
+
+
+def _analisar_em_colunas(textos: Iterable[str], colunas: Dict[str, list]) -> Dict[str, list]:
+    silabar = _silabador_do_lote()
+    for texto in textos:
+        palavras = extrair_palavras(texto)
+        r = analisar_frequencias(Counter(palavras), silabar)
+        if palavras:
+            r.mattr, r.mtld = mattr(palavras), mtld(palavras)
+        colunas["palavras_distintas"].append(len(r.palavras_unicas))
+        for nome in _CAMPOS:
+            colunas[nome].append(getattr(r, nome))
+    return colunas
+
+
+def _silabas_do_tipo(tipos: List[str]):
+    """Para os tipos do lote: sílabas de cada um (None se a silabação falhar) e ids das sílabas."""
+    por_tipo = []
+    id_silaba: Dict[str, int] = {}
+    for palavra in tipos:
+        try:
+            silabas = word2syllables(palavra)
+        except Exception:
+            por_tipo.append(None)
+            continue
+        por_tipo.append([id_silaba.setdefault(s, len(id_silaba)) for s in silabas])
+    return por_tipo, len(id_silaba)
+
+
+def _analisar_em_colunas_numpy(textos: Iterable[str]) -> Dict[str, object]:
+    # Versão vetorizada de _analisar_em_colunas: o laço em Python fica só na
+    # tokenização e nos tipos distintos do lote; as métricas saem de
+    # metricas_lote, com os pares (documento, tipo) pesados pelas ocorrências.
+    # MATTR e MTLD dependem da ordem dos tokens e saem por documento, na
+    # mesma passada da tokenização.
+    tipos_por_doc, pares = [], []
+    contagens: List[int] = []
+    valores_mattr: List[float] = []
+    valores_mtld: List[float] = []
+    for texto in textos:
+        palavras = extrair_palavras(texto)
+        frequencias = Counter(palavras)
+        valores_mattr.append(mattr(palavras))
+        valores_mtld.append(mtld(palavras))
+        tipos_por_doc.append(len(frequencias))
+        pares.extend(frequencias)
+        contagens.extend(frequencias.values())
+
+    id_tipo = {palavra: i for i, palavra in enumerate(dict.fromkeys(pares))}
+    silabas, n_silabas_distintas = _silabas_do_tipo(list(id_tipo))
+    valido = np.fromiter((s is not None for s in silabas), dtype=bool, count=len(silabas))
+    n_silabas = np.fromiter((len(s) if s is not None else 0 for s in silabas), dtype=np.int64, count=len(silabas))
+
+    n_docs = len(tipos_por_doc)
+    tipos = np.asarray(tipos_por_doc, dtype=np.int64)
+    tipo = np.fromiter(map(id_tipo.__getitem__, pares), dtype=np.int64, count=len(pares))
+    ocorrencias = np.asarray(contagens, dtype=np.int64)
+    doc = np.repeat(np.arange(n_docs), tipos)
+
+    # sílabas distintas por documento: pares (documento, sílaba) únicos
+    inicio_tipo = np.concatenate(([0], np.cumsum(n_silabas)))
+    ids_silabas = np.fromiter((i for s in silabas if s is not None for i in s), dtype=np.int64,
+                              count=int(n_silabas.sum()))
+    validos = valido[tipo]
+    doc_v, tipo_v = doc[validos], tipo[validos]
+    repeticoes = n_silabas[tipo_v]
+    deslocamento = np.arange(int(repeticoes.sum())) - np.repeat(np.cumsum(repeticoes) - repeticoes, repeticoes)
+    silaba = ids_silabas[np.repeat(inicio_tipo[tipo_v], repeticoes) + deslocamento]
+    largura = max(n_silabas_distintas, 1)
+    chaves = np.sort(np.repeat(doc_v, repeticoes) * largura + silaba)
+    distintas = np.ones(len(chaves), dtype=bool)
+    distintas[1:] = chaves[1:] != chaves[:-1]
+    silabas_unicas = np.bincount(chaves[distintas] // largura, minlength=n_docs)
+
+    metricas = metricas_lote(n_silabas[tipo], tipos, tipos, silabas_unicas, ocorrencias)
+    colunas = {nome: np.ascontiguousarray(metricas[nome]) for nome in metricas.dtype.names}
+    colunas["palavras_distintas"] = tipos
+    colunas["mattr"] = np.asarray(valores_mattr, dtype=np.float64)
+    colunas["mtld"] = np.asarray(valores_mtld, dtype=np.float64)
+    return {nome: colunas[nome] for nome in COLUNAS}
+
+
+def _analisar_pedaco(textos: List[str], as_numpy: bool) -> tuple:
+    if as_numpy:
+        return retorno_lote([_analisar_em_colunas_numpy(textos)])
+    return retorno_lote([_analisar_em_colunas(textos, _colunas_vazias())])
+
+
+def analyze_many(texts: Iterable[str], workers: Optional[int] = 1, chunksize: int = CHUNKSIZE_LOTE,
+                 as_numpy: Optional[bool] = None) -> Dict[str, object]:
+    """Métricas de cada texto, por coluna (ver COLUNAS), na ordem de ``texts``.
+
+    Devolve arrays NumPy (int64 para as contagens, float64 para o resto) se
+    o NumPy estiver instalado, ou listas; ``as_numpy`` força uma das duas.
+    ``workers`` segue paralelo.resolver_workers (``None``/``0``: todos os núcleos).
+    """
+    if as_numpy is None:
+        as_numpy = np is not None
+    elif as_numpy and np is None:
+        raise ImportError("as_numpy=True precisa do NumPy")
+
+    workers = resolver_workers(workers)
+    if workers == 1:
+        if as_numpy:
+            return _analisar_em_colunas_numpy(texts)
+        return _analisar_em_colunas(texts, _colunas_vazias())
+
+    pedacos = list(mapear_em_ordem(partial(_analisar_pedaco, as_numpy=as_numpy), texts, workers, chunksize))
+    if as_numpy:
+        if not pedacos:
+            return _analisar_em_colunas_numpy([])
+        return {nome: np.concatenate([p[nome] for p in pedacos]) for nome in COLUNAS}
+    colunas = _colunas_vazias()
+    for pedaco in pedacos:
+        for nome, valores in pedaco.items():
+            colunas[nome].extend(valores)
+    return colunas
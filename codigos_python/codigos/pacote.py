@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+Corpus empacotado: os tokens de todos os documentos num único arquivo
+binário, lido por mmap.
+
+    empacotar(fonte_pasta_json(pasta), "corpus.pack", tipo="json")
+    analisar_corpus(fonte_pacote("corpus.pack"))      # ver fontes.py
+
+O empacotamento lê e tokeniza o corpus uma vez; as análises seguintes não
+abrem nem interpretam mais nenhum arquivo do corpus: cada documento é uma
+fatia (memoryview, sem cópia) do array de ids de tokens, e as métricas saem
+direto dos ids (analise.analisar_ids). Os resultados são os mesmos da
+análise do corpus original.
+
+Formato (inteiros little-endian):
+  - cabeçalho (_CABECALHO), com a versão do tokenizador que gerou o pacote;
+  - ids dos tokens, uint32, documento após documento;
+  - fim de cada documento no array de ids, uint64 (``n_documentos + 1``, começando em 0);
+  - estado de cada documento, um byte (inválido, vazio, com texto);
+  - ids dos documentos e vocabulário (id -> palavra), utf-8 separados por ``\\x1f``;
+  - metadados em JSON (tipo do corpus, pasta de origem).
+Um pacote gerado com outro tokenizador é recusado.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from . import perfil, tokenizador
+    from .analise import AnaliseTexto, analisar_ids
+    from .syllable import word2syllables
+    from .tokenizador import extrair_palavras
+    from .vocabulario import TIPO_ID, Vocabulario
+except ImportError:
+    import perfil
+    import tokenizador
+    from analise import AnaliseTexto, analisar_ids
+    from syllable import word2syllables
+    from tokenizador import extrair_palavras
+    from vocabulario import TIPO_ID, Vocabulario
+
+MAGICO = b"DCLPACK1"
+_SEP = "\x1f"
+_INVALIDO, _VAZIO, _TEXTO = 0, 1, 2
+# mágico, versão do tokenizador, documentos, tokens, e (posição, tamanho) de
+# fins, estados, ids dos documentos, vocabulário e metadados
+_CABECALHO = struct.Struct("<8s32sQQ" + "QQ" * 5)
+_INICIO_TOKENS = (_CABECALHO.size + 7) // 8 * 8
+_FALHA = ()
+
+
+def versao_tokenizador() -> bytes:
+    """Hash do código-fonte de tokenizador.py (independente de fim de linha)."""
+    with open(tokenizador.__file__, "rb") as f:
+        return hashlib.sha256(f.read().replace(b"\r\n", b"\n")).digest()
+
+
+def _alinhar(arqui, multiplo: int = 8) -> int:
+    posicao = arqui.tell()
+    resto = -posicao % multiplo
+    arqui.write(bytes(resto))
+    return posicao + resto
+
+
+def _little_endian(valores: array) -> bytes:
+    if sys.byteorder == "big":
+        valores = array(valores.typecode, valores)
+        valores.byteswap()
+    return valores.tobytes()
+
+
+def empacotar(fonte: Iterable[Tuple[str, object]], caminho, tipo: Optional[str] = None,
+              origem: Optional[str] = None) -> int:
+    """Tokeniza os documentos da fonte e grava o pacote em ``caminho``; devolve o número de documentos.
+
+    Os ids dos tokens vão para o disco à medida que a fonte é lida; só o
+    vocabulário e o índice dos documentos ficam em memória. ``tipo`` (o
+    adaptador de analisar_corpora.py) e ``origem`` vão para os metadados.
+    """
+    caminho = os.fspath(caminho)
+    vocabulario = Vocabulario()
+    fins = array("Q", [0])
+    estados = bytearray()
+    doc_ids: List[str] = []
+    temporario = caminho + ".tmp"
+    with open(temporario, "wb") as arqui:
+        arqui.write(bytes(_INICIO_TOKENS))
+        for doc_id, texto in fonte:
+            if isinstance(texto, AnaliseTexto):
+                raise ValueError("o empacotamento precisa dos textos: use a fonte sem checkpoint")
+            if texto is None:
+                estados.append(_INVALIDO)
+            elif not texto:
+                estados.append(_VAZIO)
+            else:
+                with perfil.etapa("tokenizacao"):
+                    ids = vocabulario.ids(extrair_palavras(texto))
+                arqui.write(_little_endian(ids))
+                estados.append(_TEXTO)
+                fins.append(fins[-1] + len(ids))
+                doc_ids.append(doc_id)
+                continue
+            fins.append(fins[-1])
+            doc_ids.append(doc_id)
+
+        secoes = []
+        for dados in (_little_endian(fins), bytes(estados), _SEP.join(doc_ids).encode("utf-8"),
+                      _SEP.join(vocabulario.itens).encode("utf-8"),
+                      json.dumps({"tipo": tipo, "origem": origem}, ensure_ascii=False).encode("utf-8")):
+            secoes += (_alinhar(arqui), len(dados))
+            arqui.write(dados)
+        arqui.seek(0)
+        arqui.write(_CABECALHO.pack(MAGICO, versao_tokenizador(), len(doc_ids), fins[-1], *secoes))
+    os.replace(temporario, caminho)
+    return len(doc_ids)
+
+
+class Pacote:
+    """Pacote aberto para leitura; ``tokens(i)`` é a fatia de ids do i-ésimo documento."""
+
+    def __init__(self, caminho):
+        self.caminho = os.path.abspath(caminho)
+        with open(self.caminho, "rb") as arqui:
+            self._mmap = mmap.mmap(arqui.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._abrir()
+        except Exception:
+            self._mmap.close()
+            raise
+
+    def _abrir(self) -> None:
+        if len(self._mmap) < _CABECALHO.size or self._mmap[:len(MAGICO)] != MAGICO:
+            raise ValueError(f"{self.caminho} não é um corpus empacotado")
+        if sys.byteorder == "big":
+            raise ValueError("pacotes só podem ser lidos em máquinas little-endian")
+        (_, versao, n_documentos, n_tokens, pos_fins, tam_fins, pos_estados, tam_estados,
+         pos_doc_ids, tam_doc_ids, pos_vocabulario, tam_vocabulario, pos_meta, tam_meta) = \
+            _CABECALHO.unpack_from(self._mmap)
+        if versao != versao_tokenizador():
+            raise ValueError(f"{self.caminho} foi gerado com outro tokenizador; empacote o corpus de novo")
+
+        buf = memoryview(self._mmap)
+        self._tokens = buf[_INICIO_TOKENS:_INICIO_TOKENS + 4 * n_tokens].cast(TIPO_ID)
+        self._fins = buf[pos_fins:pos_fins + tam_fins].cast("Q")
+        self._estados = buf[pos_estados:pos_estados + tam_estados]
+        buf.release()
+        doc_ids = self._mmap[pos_doc_ids:pos_doc_ids + tam_doc_ids].decode("utf-8")
+        self.doc_ids: List[str] = doc_ids.split(_SEP) if n_documentos else []
+        vocabulario = self._mmap[pos_vocabulario:pos_vocabulario + tam_vocabulario].decode("utf-8")
+        self.itens: List[str] = vocabulario.split(_SEP) if vocabulario else []
+        self.meta: Dict[str, Optional[str]] = json.loads(self._mmap[pos_meta:pos_meta + tam_meta])
+        self.n_tokens = n_tokens
+        self._silabas: List[Optional[list]] = [None] * len(self.itens)
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def tokens(self, indice: int) -> memoryview:
+        return self._tokens[self._fins[indice]:self._fins[indice + 1]]
+
+    def silabas(self, i: int) -> list:
+        """word2syllables da palavra de id ``i``, guardado por id (ValueError se a silabação falhar)."""
+        silabas = self._silabas[i]
+        if silabas is None:
+            try:
+                silabas = word2syllables(self.itens[i])
+            except Exception:
+                silabas = _FALHA
+            self._silabas[i] = silabas
+        if silabas is _FALHA:
+            raise ValueError(f"não foi possível silabar '{self.itens[i]}'")
+        return silabas
+
+    def documentos(self) -> Iterator[Tuple[str, object]]:
+        """``(doc_id, texto)`` na convenção de fontes.py, com DocumentoPacote no lugar do texto."""
+        for indice, doc_id in enumerate(self.doc_ids):
+            estado = self._estados[indice]
+            if estado == _INVALIDO:
+                yield doc_id, None
+            elif estado == _VAZIO:
+                yield doc_id, ""
+            else:
+                yield doc_id, DocumentoPacote(self, indice)
+
+    def close(self) -> None:
+        for visao in (self._tokens, self._fins, self._estados):
+            visao.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# Pacotes abertos por este processo para os documentos recebidos de outro (ver DocumentoPacote).
+_abertos: Dict[str, Pacote] = {}
+
+
+def _documento(caminho: str, indice: int) -> "DocumentoPacote":
+    pacote = _abertos.get(caminho)
+    if pacote is None:
+        pacote = _abertos[caminho] = Pacote(caminho)
+    return DocumentoPacote(pacote, indice)
+
+
+class DocumentoPacote:
+    """Um documento de um pacote; vai para os workers só como ``(caminho, índice)``."""
+
+    __slots__ = ("pacote", "indice")
+
+    def __init__(self, pacote: Pacote, indice: int):
+        self.pacote = pacote
+        self.indice = indice
+
+    def __reduce__(self):
+        return _documento, (self.pacote.caminho, self.indice)
+
+    def analisar(self, vocabulario: Optional[Vocabulario] = None) -> AnaliseTexto:
+        """analisar_ids do documento; com ``vocabulario``, os distintos saem como ids dele."""
+        ids = self.pacote.tokens(self.indice)
+        try:
+            return analisar_ids(ids, self.pacote.itens, self.pacote.silabas, vocabulario)
+        finally:
+            ids.release()
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+Execução paralela de analisar_texto sobre muitos documentos.
+Os textos são enviados em lotes a um pool de processos e os resultados
+voltam na mesma ordem de entrada, então a agregação é idêntica à serial.
+"""
+from __future__ import annotations
+
+import os
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from itertools import count, islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from . import perfil, syllable
+    from .analise import AnaliseTexto, analisar_texto
+    from .lexicon import SyllableLexicon
+    from .pacote import DocumentoPacote
+    from .vocabulario import TIPO_ID, Vocabulario
+except ImportError:
+    import perfil
+    import syllable
+    from analise import AnaliseTexto, analisar_texto
+    from lexicon import SyllableLexicon
+    from pacote import DocumentoPacote
+    from vocabulario import TIPO_ID, Vocabulario
+
+CHUNKSIZE_PADRAO = 16
+# Lotes em voo por worker: mantém o pool ocupado sem ler o corpus inteiro.
+LOTES_POR_WORKER = 2
+
+# Vocabulário do worker em analisar_documentos com ``vocabulario``: a geração
+# da chamada que o criou e quantos itens dele já foram para o processo principal.
+_vocabulario_worker: Optional[Vocabulario] = None
+_geracao_worker = None
+_enviados_worker = 0
+_geracoes = count()
+
+
+def _iniciar_worker(caminho_lexico: Optional[str], lentos: Optional[int]) -> None:
+    # Os workers só leem o léxico; as palavras novas (e o perfil parcial, se
+    # houver) voltam ao processo principal junto com os resultados de cada lote.
+    if caminho_lexico is None:
+        syllable.set_lexicon(None)
+    else:
+        syllable.set_lexicon(SyllableLexicon(caminho_lexico, read_only=True))
+    if lentos is not None:
+        perfil.ativar(lentos)
+
+
+def retorno_lote(resultados: list) -> tuple:
+    """O que um lote devolve ao processo principal: os resultados, as palavras
+    novas do léxico e o perfil parcial do worker (ver mapear_em_ordem)."""
+    lexico = syllable.get_lexicon()
+    novas = lexico.drain_new() if lexico is not None else []
+    parcial = perfil.ativo.drenar() if perfil.ativo is not None else None
+    return resultados, novas, parcial
+
+
+def _analisar_lote(textos: List[str]) -> tuple:
+    return retorno_lote([analisar_texto(texto) for texto in textos])
+
+
+def _analisar(texto, vocabulario: Optional[Vocabulario] = None) -> AnaliseTexto:
+    if isinstance(texto, DocumentoPacote):
+        return texto.analisar(vocabulario)
+    return analisar_texto(texto, vocabulario=vocabulario)
+
+
+def _analisar_documento(doc_id: str, texto, vocabulario: Optional[Vocabulario] = None) -> Optional[AnaliseTexto]:
+    if isinstance(texto, AnaliseTexto):
+        # já analisado numa execução anterior (checkpoint)
+        return texto
+    if not texto:
+        return None
+    if perfil.ativo is None:
+        return _analisar(texto, vocabulario)
+    inicio = time.perf_counter()
+    resultado = _analisar(texto, vocabulario)
+    perfil.ativo.documento(doc_id, time.perf_counter() - inicio)
+    return resultado
+
+
+def _analisar_lote_documentos(documentos: List[Tuple[str, str]], geracao=None) -> tuple:
+    if geracao is None:
+        return retorno_lote([(doc_id, _analisar_documento(doc_id, texto)) for doc_id, texto in documentos])
+    # Com ids: o lote volta como um item só, (pid, itens novos do vocabulário, pares),
+    # e _traduzir_lotes passa os ids para o vocabulário do processo principal.
+    global _vocabulario_worker, _geracao_worker, _enviados_worker
+    if _geracao_worker != geracao:
+        _vocabulario_worker, _geracao_worker, _enviados_worker = Vocabulario(), geracao, 0
+    pares = [(doc_id, _analisar_documento(doc_id, texto, _vocabulario_worker)) for doc_id, texto in documentos]
+    novos = _vocabulario_worker.itens[_enviados_worker:]
+    _enviados_worker = len(_vocabulario_worker)
+    return retorno_lote([(os.getpid(), novos, pares)])
+
+
+def _traduzir_lotes(lotes: Iterable[tuple], vocabulario: Vocabulario) -> Iterator[Tuple[str, Optional[AnaliseTexto]]]:
+    # Cada worker analisa os seus lotes na ordem em que eles foram enviados, e
+    # os lotes voltam nessa ordem: os itens novos de um lote completam a tabela
+    # (id do worker -> id de ``vocabulario``) de que os seus resultados precisam.
+    tabelas: Dict[int, array] = {}
+    for pid, novos, pares in lotes:
+        tabela = tabelas.get(pid)
+        if tabela is None:
+            tabela = tabelas[pid] = array(TIPO_ID)
+        tabela.extend(vocabulario.ids(novos))
+        for doc_id, analise in pares:
+            if analise is not None and isinstance(analise.palavras_unicas, array):
+                analise.palavras_unicas = array(TIPO_ID, map(tabela.__getitem__, analise.palavras_unicas))
+                analise.silabas_unicas = array(TIPO_ID, map(tabela.__getitem__, analise.silabas_unicas))
+            yield doc_id, analise
+
+
+def _em_lotes(itens: Iterable, tamanho: int) -> Iterator[list]:
+    it = iter(itens)
+    while True:
+        lote = list(islice(it, tamanho))
+        if not lote:
+            return
+        yield lote
+
+
+def resolver_workers(workers: Optional[int]) -> int:
+    """``None`` ou ``0`` usam todos os núcleos disponíveis."""
+    if not workers:
+        return os.cpu_count() or 1
+    return max(1, workers)
+
+
+def _criar_executor(workers: int, lentos: Optional[int]) -> ProcessPoolExecutor:
+    lexico = syllable.get_lexicon()
+    return ProcessPoolExecutor(max_workers=workers, initializer=_iniciar_worker,
+                               initargs=(lexico.path if lexico is not None else None, lentos))
+
+
+@contextmanager
+def abrir_pool(workers: Optional[int], lentos: Optional[int] = None) -> Iterator[Optional[ProcessPoolExecutor]]:
+    """Pool de workers reaproveitado entre várias análises (None com um worker só).
+
+    Os processos (e o cache de silabação de cada um) sobrevivem de um corpus
+    para o outro. ``lentos`` liga o perfil nos workers; use-o se algum perfil
+    for ativado enquanto o pool existir.
+    """
+    workers = resolver_workers(workers)
+    if workers == 1:
+        yield None
+        return
+    with _criar_executor(workers, lentos) as executor:
+        yield executor
+
+
+def mapear_em_ordem(funcao_lote: Callable[[list], tuple], itens: Iterable,
+                    workers: int, chunksize: int, executor: Optional[ProcessPoolExecutor] = None) -> Iterator:
+    """Aplica ``funcao_lote`` a lotes de ``chunksize`` itens no pool e devolve os resultados na ordem.
+
+    ``funcao_lote`` roda nos workers e devolve retorno_lote(resultados); as
+    palavras novas vão para o léxico e o perfil parcial para o perfil ativo
+    deste processo. Sem ``executor``, um pool de ``workers`` é criado e
+    fechado ao fim.
+    """
+    perfil_ativo = perfil.ativo
+    if executor is None:
+        with _criar_executor(workers, perfil_ativo.lentos if perfil_ativo is not None else None) as executor:
+            yield from mapear_em_ordem(funcao_lote, itens, workers, chunksize, executor)
+        return
+
+    lexico = syllable.get_lexicon()
+    gravar = lexico is not None and not lexico.read_only
+
+    def receber(futuro):
+        resultados, novas, parcial = futuro.result()
+        if gravar and novas:
+            lexico.add_many(novas)
+        if parcial is not None and perfil_ativo is not None:
+            perfil_ativo.combinar(parcial)
+        return resultados
+
+    pendentes = deque()
+    for lote in _em_lotes(itens, chunksize):
+        pendentes.append(executor.submit(funcao_lote, lote))
+        if len(pendentes) >= workers * LOTES_POR_WORKER:
+            yield from receber(pendentes.popleft())
+    while pendentes:
+        yield from receber(pendentes.popleft())
+
+
+def analisar_textos(textos: Iterable[str], workers: Optional[int] = 1,
+                    chunksize: int = CHUNKSIZE_PADRAO,
+                    executor: Optional[ProcessPoolExecutor] = None) -> Iterator[AnaliseTexto]:
+    """Aplica analisar_texto a cada texto, preservando a ordem de entrada.
+
+    Com ``workers > 1`` os textos são distribuídos em lotes de ``chunksize``
+    por um ProcessPoolExecutor; no máximo ``workers * LOTES_POR_WORKER``
+    lotes ficam pendentes ao mesmo tempo. Um ``executor`` de abrir_pool é
+    usado no lugar de um pool novo.
+    """
+    workers = resolver_workers(workers)
+    if workers == 1:
+        return map(analisar_texto, textos)
+    return mapear_em_ordem(_analisar_lote, textos, workers, chunksize, executor)
+
+
+def analisar_documentos(documentos: Iterable[Tuple[str, str]], workers: Optional[int] = 1,
+                        chunksize: int = CHUNKSIZE_PADRAO,
+                        executor: Optional[ProcessPoolExecutor] = None,
+                        vocabulario: Optional[Vocabulario] = None
+                        ) -> Iterator[Tuple[str, Optional[AnaliseTexto]]]:
+    """Como analisar_textos, mas para pares ``(doc_id, texto)``.
+
+    Devolve ``(doc_id, AnaliseTexto)`` na ordem de entrada; documentos com
+    texto vazio não são analisados e voltam como ``(doc_id, None)``; um
+    ``AnaliseTexto`` no lugar do texto (retomado de um checkpoint) volta como
+    está, e um pacote.DocumentoPacote é analisado pelos ids dos tokens.
+
+    Com um ``vocabulario``, as palavras e sílabas distintas de cada documento
+    analisado voltam como ids dele (ver analise.analisar_ids). Os workers
+    usam um vocabulário próprio e mandam só os itens novos de cada lote; os
+    ids são traduzidos aqui.
+    """
+    workers = resolver_workers(workers)
+    if workers == 1:
+        return ((doc_id, _analisar_documento(doc_id, texto, vocabulario)) for doc_id, texto in documentos)
+    if vocabulario is None:
+        return mapear_em_ordem(_analisar_lote_documentos, documentos, workers, chunksize, executor)
+    lotes = mapear_em_ordem(partial(_analisar_lote_documentos, geracao=(os.getpid(), next(_geracoes))),
+                            documentos, workers, chunksize, executor)
+    return _traduzir_lotes(lotes, vocabulario)
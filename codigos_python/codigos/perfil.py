@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+Perfil por etapa do processamento de um corpus: tempo gasto em cada etapa,
+contadores (arquivos, bytes, tokens, sílabas, acertos de cache) e os
+documentos mais lentos.
+
+A instrumentação fica nos pontos por arquivo e por documento (nunca por
+palavra) e só mede quando há um perfil ativo; desligada, cada ponto custa
+um teste de ``None``. Com workers, cada processo mede os próprios lotes e
+as parciais são somadas no processo principal, então os tempos das etapas
+de análise são tempo de CPU somado entre processos.
+
+    with perfilando("perfil.json", lentos=20) as p:
+        analisar_corpus(...)
+"""
+from __future__ import annotations
+
+import heapq
+import json
+import os
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from . import syllable
+except ImportError:
+    import syllable
+
+LENTOS_PADRAO = 10
+
+ativo: Optional["Perfil"] = None
+
+
+class _Etapa:
+    __slots__ = ("perfil", "nome", "inicio")
+
+    def __init__(self, perfil: "Perfil", nome: str):
+        self.perfil = perfil
+        self.nome = nome
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.perfil.somar(self.nome, time.perf_counter() - self.inicio)
+
+
+class _EtapaNula:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return None
+
+
+_NULA = _EtapaNula()
+
+
+def _estado_cache() -> Tuple[int, int, int, int]:
+    info = syllable.cache_info()
+    lexico = syllable.get_lexicon()
+    if lexico is None:
+        return info.hits, info.misses, 0, 0
+    return info.hits, info.misses, lexico.hits, lexico.misses
+
+
+class Perfil:
+    """Tempos por etapa, contadores e os ``lentos`` documentos mais demorados."""
+
+    def __init__(self, lentos: int = LENTOS_PADRAO):
+        self.lentos = lentos
+        self.tempos: Dict[str, float] = defaultdict(float)
+        self.chamadas: Dict[str, int] = defaultdict(int)
+        self.contadores: Dict[str, int] = defaultdict(int)
+        self._mais_lentos: List[Tuple[float, str]] = []
+        self._cache = _estado_cache()
+        self._inicio = time.perf_counter()
+
+    def etapa(self, nome: str) -> _Etapa:
+        return _Etapa(self, nome)
+
+    def somar(self, nome: str, segundos: float) -> None:
+        self.tempos[nome] += segundos
+        self.chamadas[nome] += 1
+
+    def contar(self, nome: str, quantidade: int = 1) -> None:
+        self.contadores[nome] += quantidade
+
+    def documento(self, doc_id: str, segundos: float) -> None:
+        if self.lentos <= 0:
+            return
+        if len(self._mais_lentos) < self.lentos:
+            heapq.heappush(self._mais_lentos, (segundos, doc_id))
+        elif segundos > self._mais_lentos[0][0]:
+            heapq.heapreplace(self._mais_lentos, (segundos, doc_id))
+
+    def iterar(self, itens: Iterable, nome: str) -> Iterator:
+        """Repassa ``itens`` contando o tempo gasto em produzir cada um."""
+        it = iter(itens)
+        while True:
+            inicio = time.perf_counter()
+            try:
+                item = next(it)
+            except StopIteration:
+                self.somar(nome, time.perf_counter() - inicio)
+                return
+            self.somar(nome, time.perf_counter() - inicio)
+            yield item
+
+    def capturar_cache(self) -> None:
+        """Soma aos contadores os acertos/faltas de cache desde a última captura."""
+        agora = _estado_cache()
+        for nome, antes, depois in zip(("cache_acertos", "cache_faltas", "lexico_acertos", "lexico_faltas"),
+                                       self._cache, agora):
+            if depois >= antes:
+                self.contadores[nome] += depois - antes
+        self._cache = agora
+
+    def combinar(self, outro: "Perfil") -> "Perfil":
+        for nome, segundos in outro.tempos.items():
+            self.tempos[nome] += segundos
+            self.chamadas[nome] += outro.chamadas[nome]
+        for nome, quantidade in outro.contadores.items():
+            self.contadores[nome] += quantidade
+        for segundos, doc_id in outro._mais_lentos:
+            self.documento(doc_id, segundos)
+        return self
+
+    def drenar(self) -> "Perfil":
+        """Devolve o que foi medido até aqui e recomeça do zero (uso nos workers)."""
+        self.capturar_cache()
+        parcial = Perfil(self.lentos)
+        parcial.tempos, parcial.chamadas, parcial.contadores = self.tempos, self.chamadas, self.contadores
+        parcial._mais_lentos = self._mais_lentos
+        self.tempos, self.chamadas, self.contadores = defaultdict(float), defaultdict(int), defaultdict(int)
+        self._mais_lentos = []
+        return parcial
+
+    def mais_lentos(self) -> List[Tuple[str, float]]:
+        return [(doc_id, segundos) for segundos, doc_id in sorted(self._mais_lentos, reverse=True)]
+
+    def como_dict(self) -> dict:
+        self.capturar_cache()
+        return {
+            "total_segundos": time.perf_counter() - self._inicio,
+            "etapas": {nome: {"segundos": self.tempos[nome], "chamadas": self.chamadas[nome]}
+                       for nome in sorted(self.tempos, key=self.tempos.get, reverse=True)},
+            "contadores": dict(sorted(self.contadores.items())),
+            "mais_lentos": [{"doc_id": doc_id, "segundos": segundos} for doc_id, segundos in self.mais_lentos()],
+        }
+
+    def gravar(self, caminho) -> None:
+        pasta = os.path.dirname(os.path.abspath(caminho))
+        os.makedirs(pasta, exist_ok=True)
+        with open(caminho, "w", encoding="utf-8") as arqui:
+            json.dump(self.como_dict(), arqui, ensure_ascii=False, indent=2)
+
+
+def etapa(nome: str):
+    """``with perfil.etapa("leitura"):`` mede o bloco se houver perfil ativo."""
+    return _NULA if ativo is None else ativo.etapa(nome)
+
+
+def contar(nome: str, quantidade: int = 1) -> None:
+    if ativo is not None:
+        ativo.contar(nome, quantidade)
+
+
+def ativar(lentos: int = LENTOS_PADRAO) -> Perfil:
+    global ativo
+    ativo = Perfil(lentos)
+    return ativo
+
+
+def desativar() -> Optional[Perfil]:
+    global ativo
+    perfil, ativo = ativo, None
+    return perfil
+
+
+@contextmanager
+def abrir_perfil(saida, lentos: int = LENTOS_PADRAO) -> Iterator[Optional[Perfil]]:
+    """Como perfilando, mas não faz nada (e devolve None) se ``saida`` for None."""
+    if saida is None:
+        yield None
+        return
+    with perfilando(saida, lentos) as perfil:
+        yield perfil
+
+
+@contextmanager
+def perfilando(saida=None, lentos: int = LENTOS_PADRAO) -> Iterator[Perfil]:
+    """Ativa um perfil durante o bloco ``with`` e grava-o em ``saida`` (JSON) ao final."""
+    global ativo
+    anterior = ativo
+    perfil = ativar(lentos)
+    try:
+        yield perfil
+    finally:
+        ativo = anterior
+        if saida is not None:
+            perfil.gravar(saida)
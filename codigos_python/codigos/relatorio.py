@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+Relatórios de um corpus analisado: o resumo impresso na tela e os dois
+arquivos de texto (resultados individuais e resultado do dataset).
+
+Tudo sai do dicionário devolvido por corpus.analisar_corpus, ou, com
+RelatorioIndividual, dos documentos à medida que são analisados; o que muda
+de um tipo de corpus para outro (títulos, "pastas" ou "arquivos") vem de Rotulos.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+try:
+    from .corpus import classificar_complexidade
+    from .diversidade import JANELA_MATTR
+except ImportError:
+    from corpus import classificar_complexidade
+    from diversidade import JANELA_MATTR
+
+
+@dataclass(frozen=True)
+class Rotulos:
+    titulo: str             # cabeçalho das estatísticas impressas
+    titulo_relatorio: str   # cabeçalho do resultado do dataset
+    unidade: str            # o que é um documento: "pastas", "arquivos"
+    processados: str        # particípio concordando com a unidade
+    validos: str            # "Pastas Válidas", "Arquivos Válidos"
+
+
+def imprimir_estatisticas(corpus: dict, rotulos: Rotulos) -> None:
+    diversidade_geral = corpus['diversidade_geral']
+    media_lexica = corpus['media_lexica']
+    media_complexidade = corpus['media_complexidade']
+    media_prop_longas = corpus['media_prop_longas']
+    media_silabica = corpus['media_silabica']
+    media_complexas = corpus['media_complexas']
+    complexidade_dataset = corpus['complexidade_dataset']
+    unidade = rotulos.unidade.capitalize()
+
+    print(f"\n=== ESTATÍSTICAS GERAIS ({rotulos.titulo}) ===")
+    print(f"Total de {rotulos.unidade} {rotulos.processados}: {corpus['arquivos_processados']}")
+    print(f"{unidade} com texto válido: {corpus['arquivos_com_texto']}")
+    print(f"{unidade} com diversidade > 0: {corpus['arquivos_validos_lexica']}")
+
+    print(f"\n--- DIVERSIDADE LÉXICA ---")
+    print(f"Diversidade léxica geral: {diversidade_geral:.3f} ({diversidade_geral*100:.1f}%)")
+    print(f"  (contagem de palavras distintas: {corpus['modo_diversidade']})")
+    print(f"Média das diversidades individuais: {media_lexica:.3f} ({media_lexica*100:.1f}%)")
+    print(f"Desvio padrão: {corpus['desvio_lexica']:.3f}")
+    print(f"MATTR médio (janela {JANELA_MATTR}): {corpus['media_mattr']:.3f} ({corpus['media_mattr']*100:.1f}%)")
+    print(f"MTLD médio: {corpus['media_mtld']:.1f}")
+
+    print(f"\n--- COMPLEXIDADE LEXICAL ---")
+    print(f"Complexidade lexical média: {media_complexidade:.3f} ({media_complexidade*100:.1f}%)")
+    print(f"Proporção de palavras longas (4+ sílabas): {media_prop_longas:.3f} ({media_prop_longas*100:.1f}%)")
+
+    print(f"\n--- COMPLEXIDADE SILÁBICA ---")
+    print(f"Diversidade silábica média: {media_silabica:.3f} ({media_silabica*100:.1f}%)")
+    print(f"Diversidade silábica geral: {corpus['diversidade_silabica_geral']:.3f} "
+          f"({corpus['diversidade_silabica_geral']*100:.1f}%)")
+    print(f"Proporção de palavras complexas (3+ sílabas): {media_complexas:.3f} ({media_complexas*100:.1f}%)")
+    print(f"Média de sílabas por palavra: {corpus['media_silabas_palavra']:.2f}")
+
+    print(f"\n--- ANÁLISE AVANÇADA DO DATASET ---")
+    print(f"Complexidade geral do dataset: {complexidade_dataset['complexidade_media']*100:.1f}%")
+    print(f"Classificação geral: {complexidade_dataset['classificacao_geral']}")
+    print(f"Distribuição de complexidade: {complexidade_dataset['distribuicao_classificacoes']}")
+    print(f"Correlação Diversidade-Complexidade: {corpus['correlacao_div_comp']:.3f}")
+
+
+def _escrever_medias(arqui, corpus: dict) -> None:
+    arqui.write(f"Diversidade Léxica Média: {corpus['media_lexica']*100:.1f}%\n")
+    arqui.write(f"Desvio Padrão: {corpus['desvio_lexica']*100:.1f}%\n")
+    arqui.write(f"MATTR Médio (janela {JANELA_MATTR}): {corpus['media_mattr']*100:.1f}%\n")
+    arqui.write(f"MTLD Médio: {corpus['media_mtld']:.1f}\n")
+    arqui.write(f"Complexidade Léxica Média: {corpus['media_complexidade']*100:.1f}%\n")
+    arqui.write(f"Proporção de palavras longas (4+ sílabas): {corpus['media_prop_longas']*100:.1f}%\n")
+    arqui.write(f"Diversidade silábica média: {corpus['media_silabica']*100:.1f}%\n")
+    arqui.write(f"Proporção de palavras complexas (3+ sílabas): {corpus['media_complexas']*100:.1f}%\n")
+    arqui.write(f"Média de sílabas por palavra: {corpus['media_silabas_palavra']:.2f}\n")
+    arqui.write(f"Diversidade de todo dataset: {corpus['diversidade_geral']*100:.1f}%\n")
+    arqui.write(f"  (contagem de palavras distintas: {corpus['modo_diversidade']})\n")
+    arqui.write(f"Diversidade silábica de todo dataset: {corpus['diversidade_silabica_geral']*100:.1f}%\n")
+
+
+_CABECALHO_INDIVIDUAIS = ("DIVERSIDADE LÉXICA, COMPLEXIDADE LEXICAL E ANÁLISE SILÁBICA - RESULTADOS INDIVIDUAIS\n"
+                          + "=" * 90 + "\n")
+
+
+def _escrever_documento(arqui, nome, valores: dict) -> None:
+    if valores['diversidade_lexica'] > 0:
+        classificacao = classificar_complexidade(valores['complexidade_lexica'])
+        arqui.write(f"{nome}:\n")
+        arqui.write(f"  Diversidade Léxica: {valores['diversidade_lexica']:.3f} ({valores['diversidade_lexica']*100:.1f}%)\n")
+        arqui.write(f"  Complexidade Lexical: {valores['complexidade_lexica']:.3f} ({valores['complexidade_lexica']*100:.1f}%) - {classificacao}\n")
+        arqui.write(f"  Palavras Longas (4+ sílabas): {valores['proporcao_palavras_longas']:.3f} ({valores['proporcao_palavras_longas']*100:.1f}%)\n")
+        arqui.write(f"  Diversidade Silábica: {valores['diversidade_silabica']:.3f} ({valores['diversidade_silabica']*100:.1f}%)\n")
+        arqui.write(f"  Palavras Complexas (3+ sílabas): {valores['proporcao_complexas']:.3f} ({valores['proporcao_complexas']*100:.1f}%)\n")
+        arqui.write(f"  Sílabas por Palavra: {valores['silabas_por_palavra']:.2f}\n")
+        arqui.write("\n")
+
+
+def _escrever_gerais_individuais(arqui, corpus: dict) -> None:
+    complexidade_dataset = corpus['complexidade_dataset']
+    arqui.write("=" * 90 + "\n")
+    arqui.write(f"ESTATÍSTICAS GERAIS:\n")
+    _escrever_medias(arqui, corpus)
+    arqui.write(f"Arquivos válidos: {corpus['arquivos_validos_lexica']}\n")
+
+    arqui.write(f"\n--- ANÁLISE AVANÇADA ---\n")
+    arqui.write(f"Complexidade geral do dataset: {complexidade_dataset['complexidade_media']*100:.1f}%\n")
+    arqui.write(f"Classificação geral: {complexidade_dataset['classificacao_geral']}\n")
+    arqui.write(f"Distribuição de complexidade: {complexidade_dataset['distribuicao_classificacoes']}\n")
+    arqui.write(f"Correlação Diversidade-Complexidade: {corpus['correlacao_div_comp']:.3f}\n")
+
+
+def gravar_resultados_individuais(caminho, corpus: dict) -> None:
+    with open(caminho, "w", encoding="utf-8") as arqui:
+        arqui.write(_CABECALHO_INDIVIDUAIS)
+        for nome, valores in corpus['resultados_individual'].items():
+            _escrever_documento(arqui, nome, valores)
+        _escrever_gerais_individuais(arqui, corpus)
+
+
+class RelatorioIndividual:
+    """Resultados individuais gravados durante a análise, sem guardar as linhas.
+
+    Recebe os documentos em ``escrever``, como os escritores de
+    saida_documentos.py, e as estatísticas do corpus em ``finalizar``; o
+    arquivo sai igual ao de gravar_resultados_individuais.
+    """
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self._arqui = open(caminho, "w", encoding="utf-8")
+        self._arqui.write(_CABECALHO_INDIVIDUAIS)
+
+    def escrever(self, doc_id: str, analise) -> None:
+        if analise is not None:
+            _escrever_documento(self._arqui, doc_id, analise.como_dict())
+
+    def finalizar(self, corpus: dict) -> None:
+        _escrever_gerais_individuais(self._arqui, corpus)
+
+    def close(self) -> None:
+        self._arqui.close()
+
+    def __enter__(self) -> "RelatorioIndividual":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def gravar_resultado_dataset(caminho, corpus: dict, rotulos: Rotulos) -> None:
+    complexidade_dataset = corpus['complexidade_dataset']
+    with open(caminho, "w", encoding="utf-8") as arqui:
+        arqui.write(f"DIVERSIDADE LÉXICA, COMPLEXIDADE LEXICAL E COMPLEXIDADE SILÁBICA - {rotulos.titulo_relatorio}\n")
+        arqui.write("=" * 80 + "\n")
+        _escrever_medias(arqui, corpus)
+        arqui.write(f"Total de {rotulos.unidade.capitalize()}: {corpus['documentos_analisados']}\n")
+        arqui.write(f"{rotulos.validos}: {corpus['arquivos_validos_lexica']}\n")
+
+        arqui.write(f"\n--- COMPLEXIDADE GERAL ---\n")
+        arqui.write(f"Score de Complexidade: {complexidade_dataset['complexidade_media']:.3f}\n")
+        arqui.write(f"Classificação: {complexidade_dataset['classificacao_geral']}\n")
+        arqui.write(f"Correlação Diver-Complex: {corpus['correlacao_div_comp']:.3f}\n")
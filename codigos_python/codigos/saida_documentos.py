@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Resultados por documento em formato tabular: CSV, JSONL ou Parquet (este só
+com pyarrow instalado).
+
+Uma linha por documento com todas as métricas de AnaliseTexto e a
+classificação, para carregar direto em pandas & cia, sem reinterpretar o
+relatório em texto. As linhas são acumuladas e gravadas em lotes de
+``TAMANHO_LOTE``.
+
+    with abrir_saida_documentos("documentos.csv") as saida:
+        analisar_corpus(fonte, saida_documentos=saida)
+"""
+from __future__ import annotations
+
+import abc
+import csv
+import json
+import os
+from contextlib import contextmanager
+from dataclasses import fields
+from typing import Iterator, List, Optional
+
+try:
+    from .analise import AnaliseTexto
+    from .corpus import classificar_complexidade
+except ImportError:
+    from analise import AnaliseTexto
+    from corpus import classificar_complexidade
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+TAMANHO_LOTE = 1000
+
+_METRICAS = [f.name for f in fields(AnaliseTexto)
+             if f.name not in ("total_palavras", "palavras_unicas", "total_silabas", "silabas_unicas")]
+COLUNAS = ["doc_id", "total_palavras", "palavras_distintas"] + _METRICAS + ["classificacao"]
+FORMATOS = {".csv": "csv", ".jsonl": "jsonl", ".parquet": "parquet"}
+
+
+def linha_documento(doc_id: str, analise: Optional[AnaliseTexto]) -> list:
+    """Valores de COLUNAS para um documento; ``None`` (sem texto) vira zeros.
+
+    A classificação fica vazia (None) nos documentos sem diversidade, que o
+    relatório em texto também não classifica.
+    """
+    if analise is None:
+        analise = AnaliseTexto()
+    classificacao = (classificar_complexidade(analise.complexidade_lexica)
+                     if analise.diversidade_lexica > 0 else None)
+    return ([doc_id, analise.total_palavras, len(analise.palavras_unicas)]
+            + [float(getattr(analise, nome)) for nome in _METRICAS] + [classificacao])
+
+
+class _Escritor(abc.ABC):
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self.linhas: List[list] = []
+        self.total = 0
+
+    def escrever(self, doc_id: str, analise: Optional[AnaliseTexto]) -> None:
+        self.linhas.append(linha_documento(doc_id, analise))
+        if len(self.linhas) >= TAMANHO_LOTE:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.linhas:
+            self._gravar(self.linhas)
+            self.total += len(self.linhas)
+            self.linhas = []
+
+    @abc.abstractmethod
+    def _gravar(self, linhas: List[list]) -> None:
+        """Grava um lote de linhas (uma por documento) no arquivo."""
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class EscritorCSV(_Escritor):
+    def __init__(self, caminho):
+        super().__init__(caminho)
+        self._arqui = open(caminho, "w", encoding="utf-8", newline="")
+        self._csv = csv.writer(self._arqui)
+        self._csv.writerow(COLUNAS)
+
+    def _gravar(self, linhas: List[list]) -> None:
+        self._csv.writerows(linhas)
+
+    def close(self) -> None:
+        super().close()
+        self._arqui.close()
+
+
+class EscritorJSONL(_Escritor):
+    def __init__(self, caminho):
+        super().__init__(caminho)
+        self._arqui = open(caminho, "w", encoding="utf-8")
+
+    def _gravar(self, linhas: List[list]) -> None:
+        self._arqui.write("".join(json.dumps(dict(zip(COLUNAS, linha)), ensure_ascii=False) + "\n"
+                                  for linha in linhas))
+
+    def close(self) -> None:
+        super().close()
+        self._arqui.close()
+
+
+class EscritorParquet(_Escritor):
+    """Cada lote vira um row group do arquivo Parquet."""
+
+    def __init__(self, caminho):
+        if pyarrow is None:
+            raise ImportError("a saída em Parquet precisa do pyarrow")
+        super().__init__(caminho)
+        self._esquema = pyarrow.schema(
+            [("doc_id", pyarrow.string()), ("total_palavras", pyarrow.int64()),
+             ("palavras_distintas", pyarrow.int64())]
+            + [(nome, pyarrow.float64()) for nome in _METRICAS]
+            + [("classificacao", pyarrow.string())])
+        self._escritor = pyarrow.parquet.ParquetWriter(caminho, self._esquema)
+
+    def _gravar(self, linhas: List[list]) -> None:
+        colunas = [list(coluna) for coluna in zip(*linhas)]
+        self._escritor.write_table(pyarrow.Table.from_arrays(colunas, schema=self._esquema))
+
+    def close(self) -> None:
+        super().close()
+        self._escritor.close()
+
+
+_ESCRITORES = {"csv": EscritorCSV, "jsonl": EscritorJSONL, "parquet": EscritorParquet}
+
+
+def formato_do_caminho(caminho) -> str:
+    extensao = os.path.splitext(str(caminho))[1].lower()
+    if extensao not in FORMATOS:
+        raise ValueError(f"extensão desconhecida '{extensao}': use uma de {sorted(FORMATOS)}")
+    return FORMATOS[extensao]
+
+
+@contextmanager
+def abrir_saida_documentos(caminho, formato: Optional[str] = None) -> Iterator[Optional[_Escritor]]:
+    """Escritor do formato pedido (ou deduzido da extensão); None se ``caminho`` for None."""
+    if caminho is None:
+        yield None
+        return
+    escritor = _ESCRITORES[formato or formato_do_caminho(caminho)](caminho)
+    with escritor:
+        yield escritor
@@ -5,7 +5,9 @@ Port Python baseado em src/main/java/Syllable.java
 """
 from __future__ import annotations
 
-from typing import List
+import re
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional
 
 # --- Sets de grafemas ---
 VOWELS = set("aeoáéóíúãõâêôàü")
@@ -62,94 +64,94 @@ def _is_semi(w: str, i: int) -> bool:
     return _is_semi_char(w[i])
 
 
-def _is_digraph(w: str, i: int) -> bool:
-    if i + 1 >= len(w):
-        return False
-    return w[i : i + 2] in DIGR
-
-
-def _is_digraph_sep(w: str, i: int) -> bool:
-    if i + 1 >= len(w):
-        return False
-    return w[i : i + 2] in DIGR_SEP
-
-
-def _is_occlusive(w: str, i: int) -> bool:
-    tail = w[i:]
-    for s in OCC | OCC_BIG:
-        if len(s) == 1:
-            if tail.startswith(s):
-                return True
-        elif len(s) == 2:
-            if len(tail) >= 2 and tail.startswith(s):
-                return True
-        else:  # 3
-            if len(tail) >= 3 and tail.startswith(s):
-                return True
-    return False
-
-
-def _is_fricative(w: str, i: int) -> bool:
-    tail = w[i:]
-    if tail and tail[0] in FRIC:
-        return True
-    for s in FRIC_BIG:
-        if tail.startswith(s):
-            return True
-    return False
-
-
-def _is_mute_consonant(w: str, i: int) -> bool:
-    if i + 1 >= len(w):
-        return False
-    if w[i] in MUTE:
-        if w[i + 1] in VOWELS:
-            return False
-        if w[i + 1] in ("l", "r") or _is_vowel(w, i + 1) or _is_semi(w, i + 1):
-            return False
-        return True
-    return False
-
-
-def _is_liquid(w: str, i: int) -> bool:
-    if w[i] == "l":
-        return not (i < len(w) - 1 and w[i + 1] == "h")
-    return w[i] == "r"
-
-
-def _is_nasal(w: str, i: int) -> bool:
-    return w[i] in NASAL
-
-
-def _is_consonant(w: str, i: int) -> bool:
-    if _is_digraph(w, i):
-        return True
-    if _is_occlusive(w, i):
-        return True
-    if _is_fricative(w, i):
-        return True
-    if _is_liquid(w, i):
-        return True
-    if _is_nasal(w, i):
-        return True
-    if w[i] in ("g", "c"):
-        return True
-    return False
+# --- Classes de caractere por posição ---
+# word2syllables classifica a palavra uma única vez; as regras leem as
+# flags de ``cls[i]`` em vez de refazer testes de conjunto e fatias a cada passo.
+_V = 1 << 0    # núcleo vocálico (_is_vowel)
+_S = 1 << 1    # i/u
+_N = 1 << 2    # nasal: m, n
+_L = 1 << 3    # líquida: r, l (exceto em 'lh')
+_O = 1 << 4    # oclusiva: p t b d, ca co cu ga go gu gú, que qui gue gui
+_F = 1 << 5    # fricativa: f v s ç z j x, ce ci ss ch ge gi
+_D = 1 << 6    # dígrafo lh/nh
+_DS = 1 << 7   # dígrafo separável: rr ss sc xc xs
+_C = 1 << 8    # consoante: _D | _O | _F | _L | _N, g, c
+_M = 1 << 9    # consoante muda seguida de consoante (não l/r)
+_Q = 1 << 10   # 'u' depois de q/g
+
+# Flags que dependem só do caractere, ou do par/trio que começa na posição.
+_CHAR_FLAGS = {}
+_PAIR_FLAGS = {}
+_TRIPLE_FLAGS = {}
+for _c in SEMI:
+    _CHAR_FLAGS[_c] = _CHAR_FLAGS.get(_c, 0) | _S
+for _c in NASAL:
+    _CHAR_FLAGS[_c] = _CHAR_FLAGS.get(_c, 0) | _N | _C
+for _c in OCC:
+    _CHAR_FLAGS[_c] = _CHAR_FLAGS.get(_c, 0) | _O | _C
+for _c in FRIC:
+    _CHAR_FLAGS[_c] = _CHAR_FLAGS.get(_c, 0) | _F | _C
+for _c in ("r", "g", "c", "l"):
+    _CHAR_FLAGS[_c] = _CHAR_FLAGS.get(_c, 0) | _C
+_CHAR_FLAGS["r"] |= _L
+for _p in DIGR:
+    _PAIR_FLAGS[_p] = _PAIR_FLAGS.get(_p, 0) | _D
+for _p in DIGR_SEP:
+    _PAIR_FLAGS[_p] = _PAIR_FLAGS.get(_p, 0) | _DS
+for _p in FRIC_BIG:
+    _PAIR_FLAGS[_p] = _PAIR_FLAGS.get(_p, 0) | _F
+for _p in OCC_BIG:
+    if len(_p) == 2:
+        _PAIR_FLAGS[_p] = _PAIR_FLAGS.get(_p, 0) | _O
+    else:
+        _TRIPLE_FLAGS[_p] = _O
+del _c, _p
 
 
-def _rule12_part1(w: str, nucleo: int) -> bool:
+def _classify(w: str) -> List[int]:
+    """Flags de classe de cada posição de ``w``."""
+    wlen = len(w)
+    cls = [_V if _is_vowel(w, i) else 0 for i in range(wlen)]
+    char_flags = _CHAR_FLAGS
+    pair_flags = _PAIR_FLAGS
+    last = wlen - 1
+    for i in range(wlen):
+        c = w[i]
+        f = cls[i] | char_flags.get(c, 0)
+        if i < last:
+            nxt = w[i + 1]
+            f |= pair_flags.get(c + nxt, 0)
+            if c == "q":
+                f |= _TRIPLE_FLAGS.get(w[i : i + 3], 0)
+            elif c == "l":
+                if nxt != "h":
+                    f |= _L
+            elif c in MUTE and nxt not in VOWELS and nxt != "l" and nxt != "r" \
+                    and nxt not in SEMI and not cls[i + 1] & _V:
+                f |= _M
+        elif c == "l":
+            f |= _L
+        if c == "u" and i > 0 and w[i - 1] in ("q", "g"):
+            f |= _Q
+        if f & (_D | _O | _F):
+            f |= _C
+        cls[i] = f
+    return cls
+
+
+def _rule12_part1(w: str, cls: List[int], nucleo: int) -> bool:
     wlen = len(w)
-    if _is_consonant(w, nucleo - 1):
+    if cls[nucleo - 1] & _C:
         if (
             nucleo + 1 < wlen
             and (
-                _is_liquid(w, nucleo + 1)
-                or _is_nasal(w, nucleo + 1)
+                cls[nucleo + 1] & _L
+                or cls[nucleo + 1] & _N
                 or w[nucleo + 1] in ("c", "x")
             )
             and nucleo + 3 < wlen
             and (
-                _is_vowel(w, nucleo + 3)
+                cls[nucleo + 3] & _V
                 or w[nucleo + 3] in ("h", "l", "r")
             )
         ):
@@ -159,13 +161,13 @@ def _rule12_part1(w: str, nucleo: int) -> bool:
             if (
                 nucleo + 1 < wlen
                 and (
-                    _is_liquid(w, nucleo + 1)
-                    or _is_nasal(w, nucleo + 1)
+                    cls[nucleo + 1] & _L
+                    or cls[nucleo + 1] & _N
                     or w[nucleo + 1] in ("c", "x")
                 )
                 and nucleo + 3 < wlen
                 and (
-                    _is_vowel(w, nucleo + 3)
+                    cls[nucleo + 3] & _V
                     or w[nucleo + 3] in ("h", "l", "r")
                 )
             ):
@@ -173,18 +175,24 @@ def _rule12_part1(w: str, nucleo: int) -> bool:
     return False
 
 
-def _q_or_g_before_u(w: str, i: int) -> bool:
-    return w[i] == "u" and i - 1 >= 0 and w[i - 1] in ("q", "g")
+def _next_vowels(cls: List[int]) -> List[int]:
+    """Para cada posição i, o índice do primeiro núcleo vocálico em [i, fim) ou -1."""
+    nxt = [-1] * len(cls)
+    k = -1
+    for i in range(len(cls) - 1, -1, -1):
+        if cls[i] & _V:
+            k = i
+        nxt[i] = k
+    return nxt
 
 
-def _find_vowel(w: str, i: int, stressed_graph: int) -> int:
-    for k in range(i, len(w)):
-        if _is_vowel(w, k):
-            if stressed_graph < k and stressed_graph >= i:
-                return stressed_graph
-            else:
-                return k
-    return -1
+def _find_vowel(next_vowel: List[int], i: int, stressed_graph: int) -> int:
+    k = next_vowel[i]
+    if k == -1:
+        return -1
+    if stressed_graph < k and stressed_graph >= i:
+        return stressed_graph
+    return k
 
 
 def _is_vowel_or_semi_char(c: str) -> bool:
@@ -201,204 +209,172 @@ def _find_second_last_vowel(w: str) -> int:
     return -1
 
 
-def stressed_syllable(w: str) -> int:
-    stressedlevel = 100
-    stressedpos = 0
-    pos_penult = _find_second_last_vowel(w)
-    lenw = len(w)
-
-    for i in range(lenw - 1, -1, -1):
-        if i == lenw - 1:
-            if pos_penult != -1 and stressedlevel > 19:
-                stressedlevel = 19
-                stressedpos = pos_penult
-            if (
-                lenw >= 4
-                and w[i] == "m"
-                and w[i - 1] == "e"
-                and w[i - 2] == "u"
-                and w[i - 3] == "q"
-                and stressedlevel > 18
-            ):
-                stressedlevel = 18
-                stressedpos = i - 1
-            if pos_penult != -1 and stressedlevel > 17:
-                if w[pos_penult] in ("i", "u"):
-                    if (
-                        pos_penult - 1 >= 0
-                        and _is_vowel_or_semi_char(w[pos_penult - 1])
-                        and pos_penult + 1 < lenw
-                        and not _is_vowel_or_semi_char(w[pos_penult + 1])
-                    ):
-                        if pos_penult - 2 >= 0:
-                            if w[pos_penult - 2] not in ("q", "g"):
-                                stressedlevel = 17
-                                stressedpos = pos_penult - 1
-                        else:
-                            stressedlevel = 17
-                            stressedpos = pos_penult - 1
-            if (
-                lenw > 4
-                and w[i] in ("a", "e", "o")
-                and _is_consonant(w, i - 1)
-                and w[i - 2] == "n"
-                and w[i - 3] in ("i", "u")
-                and _is_vowel_or_semi_char(w[i - 4])
-                and stressedlevel > 16
-            ):
-                stressedpos = i - 3
-                stressedlevel = 16
-            if (
-                lenw >= 6
-                and w[i] == "s"
-                and _is_vowel(w, i - 1)
-                and _is_vowel(w, i - 4)
-                and w[i - 3] in ("i", "u")
-                and not _is_vowel(w, i - 2)
-                and w[i - 5] not in ("q", "g")
-                and stressedlevel > 15
-            ):
-                stressedpos = i - 4
-                stressedlevel = 15
-            if (
-                lenw >= 5
-                and _is_vowel(w, i)
-                and _is_vowel(w, i - 3)
-                and w[i - 2] in ("i", "u")
-                and not _is_vowel(w, i - 1)
-                and w[i - 4] not in ("q", "g")
-                and stressedlevel > 14
-            ):
-                stressedpos = i - 3
-                stressedlevel = 14
-            if (
-                lenw >= 3
-                and _is_vowel(w, i)
-                and w[i - 1] in ("i", "u")
-                and _is_vowel(w, i - 2)
-                and stressedlevel > 13
-            ):
-                stressedpos = i - 2
-                stressedlevel = 13
-            if (
-                lenw >= 5
-                and w[i] == "s"
-                and w[i - 1] == "e"
-                and w[i - 2] == "u"
-                and w[i - 3] in ("q", "g")
-                and stressedlevel > 12
-            ):
-                stressedpos = i - 4 if _is_vowel_or_semi_char(w[i - 4]) else i - 5
-                stressedlevel = 12
-            if (
-                lenw >= 4
-                and w[i] == "e"
-                and w[i - 1] == "u"
-                and w[i - 2] in ("q", "g")
-                and stressedlevel > 11
-            ):
-                stressedpos = i - 3 if _is_vowel_or_semi_char(w[i - 3]) else i - 4
-                stressedlevel = 11
-            if (
-                lenw > 5
-                and i >= 5
-                and w[i] == "e"
-                and w[i - 1] == "u"
-                and w[i - 2] == "q"
-                and w[i - 3] == "r"
-                and w[i - 4] == "o"
-                and w[i - 5] == "p"
-                and stressedlevel > 10
-            ):
-                stressedlevel = 10
-                stressedpos = i
-            if (
-                i - 2 >= 0
-                and w[i] == "s"
-                and w[i - 1] in ("i", "u")
-                and not _is_vowel(w, i - 2)
-                and stressedlevel > 9
-            ):
-                stressedlevel = 9
-                stressedpos = i - 1
-            if (
-                i - 1 >= 0
-                and i - 2 >= 0
-                and w[i] == "s"
-                and w[i - 1] in ("i", "u")
-                and _is_vowel_or_semi_char(w[i - 2])
-                and stressedlevel > 8
-            ):
-                stressedlevel = 8
-                stressedpos = i - 2
-            if (w[i] in ("i", "u") and stressedlevel > 7):
-                if i - 1 >= 0 and _is_vowel_or_semi_char(w[i - 1]) and w[i - 1] != "u":
-                    stressedpos = i - 1
-                else:
-                    stressedpos = i
-                stressedlevel = 7
-            if (
-                i - 3 >= 0
-                and w[i] == "s"
-                and w[i - 1] == "i"
-                and w[i - 2] in ("u", "ü")
-                and w[i - 3] in ("q", "g")
-                and stressedlevel > 6
-            ):
-                stressedlevel = 6
-                stressedpos = i - 1
-            if (
-                i - 2 >= 0
-                and w[i] == "i"
-                and w[i - 1] in ("u", "ü")
-                and w[i - 2] in ("q", "g")
-                and stressedlevel > 5
-            ):
-                stressedlevel = 5
-                stressedpos = i
-            if (
-                i - 2 >= 0
-                and w[i] == "s"
-                and w[i - 1] == "n"
-                and w[i - 2] in ("i", "o", "u")
-                and stressedlevel > 4
-            ):
-                stressedlevel = 4
-                stressedpos = i - 2
-            if (
-                i - 1 >= 0
-                and w[i] == "m"
-                and w[i - 1] in ("i", "o", "u")
-                and stressedlevel > 3
-            ):
-                stressedlevel = 3
-                stressedpos = i - 1
-            if (
-                w[i] in ("r", "l", "z", "x", "n") and stressedlevel > 2
-            ):
-                stressedlevel = 2
-                stressedpos = i - 1
-        if w[i] in ACUTE_CIRC:
-            stressedlevel = 0
-            stressedpos = i
-        elif w[i] in TIL and stressedlevel > 1:
-            stressedlevel = 1
-            stressedpos = i
-    return stressedpos
+# --- Tonicidade por tabela de sufixos ---
+# Cada regra de fim de palavra é um padrão alinhado ao final: os elementos
+# são strings (conjunto de caracteres aceitos) ou testes de classe. Vale a
+# regra de menor nível que casar; um acento agudo/circunflexo (nível 0) ou
+# til (nível 1) em qualquer posição tem prioridade sobre todas elas.
+
+
+def _vowel_at(w: str, k: int) -> bool:
+    return _is_vowel(w, k)
+
+
+def _not_vowel_at(w: str, k: int) -> bool:
+    return not _is_vowel(w, k)
+
+
+def _consonant_at(w: str, k: int) -> bool:
+    c = w[k]
+    if _CHAR_FLAGS.get(c, 0) & _C:
+        return True
+    return c == "q" and w[k : k + 3] in _TRIPLE_FLAGS
+
+
+def _vowel_or_semi_at(w: str, k: int) -> bool:
+    return _is_vowel_or_semi_char(w[k])
+
+
+def _not_q_or_g_at(w: str, k: int) -> bool:
+    return w[k] not in ("q", "g")
+
+
+def _final_iu(w: str, i: int) -> int:
+    if i - 1 >= 0 and _is_vowel_or_semi_char(w[i - 1]) and w[i - 1] != "u":
+        return i - 1
+    return i
+
+
+def _before_qu(offset: int):
+    # 'que'/'gue'(s): tônica na vogal antes do grupo, ou uma posição antes
+    def pos(w: str, i: int) -> int:
+        return i - offset if _is_vowel_or_semi_char(w[i - offset]) else i - offset - 1
+    return pos
+
+
+# (nível, tamanho mínimo, padrão alinhado ao fim, posição tônica: deslocamento
+# em relação ao último índice ou função (w, i) -> posição)
+_SUFFIX_RULES = [
+    (2, 1, ("rlzxn",), -1),
+    (3, 2, ("iou", "m"), -1),
+    (4, 3, ("iou", "n", "s"), -2),
+    (5, 3, ("qg", "uü", "i"), 0),
+    (6, 4, ("qg", "uü", "i", "s"), -1),
+    (7, 1, ("iu",), _final_iu),
+    (8, 3, (_vowel_or_semi_at, "iu", "s"), -2),
+    (9, 3, (_not_vowel_at, "iu", "s"), -1),
+    (10, 6, ("p", "o", "r", "q", "u", "e"), 0),
+    (11, 4, ("qg", "u", "e"), _before_qu(3)),
+    (12, 5, ("qg", "u", "e", "s"), _before_qu(4)),
+    (13, 3, (_vowel_at, "iu", _vowel_at), -2),
+    (14, 5, (_not_q_or_g_at, _vowel_at, "iu", _not_vowel_at, _vowel_at), -3),
+    (15, 6, (_not_q_or_g_at, _vowel_at, "iu", _not_vowel_at, _vowel_at, "s"), -4),
+    (16, 5, (_vowel_or_semi_at, "iu", "n", _consonant_at, "aeo"), -3),
+    (18, 4, ("q", "u", "e", "m"), -1),
+]
+
+
+def _compile_suffix_rule(min_len: int, pattern: tuple, pos):
+    chars = []
+    tests = []
+    for back, elem in enumerate(reversed(pattern)):
+        if isinstance(elem, str):
+            chars.append((back, frozenset(elem)))
+        else:
+            tests.append((back, elem))
+
+    def match(w: str, i: int) -> Optional[int]:
+        if i + 1 < min_len:
+            return None
+        for back, allowed in chars:
+            if w[i - back] not in allowed:
+                return None
+        for back, test in tests:
+            if not test(w, i - back):
+                return None
+        return i + pos if isinstance(pos, int) else pos(w, i)
+
+    return match
+
+
+def _penult_diphthong(w: str, i: int) -> Optional[int]:
+    # nível 17: penúltima vogal i/u precedida de vogal (ditongo decrescente)
+    pp = _find_second_last_vowel(w)
+    if pp == -1 or w[pp] not in ("i", "u"):
+        return None
+    if (
+        pp - 1 >= 0
+        and _is_vowel_or_semi_char(w[pp - 1])
+        and pp + 1 <= i
+        and not _is_vowel_or_semi_char(w[pp + 1])
+        and (pp - 2 < 0 or w[pp - 2] not in ("q", "g"))
+    ):
+        return pp - 1
+    return None
+
+
+def _penult(w: str, i: int) -> Optional[int]:
+    # nível 19: paroxítona por padrão
+    pp = _find_second_last_vowel(w)
+    return None if pp == -1 else pp
+
+
+def _build_stress_table():
+    """Índice último caractere -> regras candidatas, em ordem de nível."""
+    rules = []
+    last_chars = []
+    for level, min_len, pattern, pos in _SUFFIX_RULES:
+        rules.append((level, _compile_suffix_rule(min_len, pattern, pos)))
+        last = pattern[-1]
+        last_chars.append(set(last) if isinstance(last, str) else VOWELS | SEMI)
+    rules += [(17, _penult_diphthong), (19, _penult)]
+    last_chars += [None, None]
+
+    order = sorted(range(len(rules)), key=lambda k: rules[k][0])
+    keys = set().union(*(c for c in last_chars if c is not None))
+    table = {}
+    for key in keys:
+        table[key] = tuple(rules[k][1] for k in order if last_chars[k] is None or key in last_chars[k])
+    default = tuple(rules[k][1] for k in order if last_chars[k] is None)
+    return table, default
+
+
+_STRESS_TABLE, _STRESS_DEFAULT = _build_stress_table()
+_ACUTE_CIRC_RE = re.compile("[" + "".join(sorted(ACUTE_CIRC)) + "]")
+
+
+def _compute_stressed(w: str) -> int:
+    # acento gráfico: o agudo/circunflexo mais à esquerda, senão o til mais à direita
+    m = _ACUTE_CIRC_RE.search(w)
+    if m is not None:
+        return m.start()
+    til = max(w.rfind("ã"), w.rfind("õ"))
+    if til != -1:
+        return til
+
+    i = len(w) - 1
+    if i < 0:
+        return 0
+    for rule in _STRESS_TABLE.get(w[i], _STRESS_DEFAULT):
+        pos = rule(w, i)
+        if pos is not None:
+            return pos
+    return 0
 
 
 def _get_syllable(w: str, begin: int, end: int) -> str:
     return w[begin : end + 1]
 
 
-def word2syllables(w: str) -> List[str]:
+def _compute_syllables(w: str, stressed_graph: int, cls: List[int]) -> List[str]:
     s: List[str] = []
     wlen = len(w)
-    stressed_graph = stressed_syllable(w)
+
+    next_vowel = _next_vowels(cls)
 
     i = 0
     while i < wlen:
-        nucleo = _find_vowel(w, i, stressed_graph)
+        nucleo = _find_vowel(next_vowel, i, stressed_graph)
         if w[i] in VOWELS or w[i] in ("i", "u"):
             if (
                 i + 1 < wlen
@@ -412,18 +388,18 @@ def word2syllables(w: str) -> List[str]:
             elif (
                 w[i] not in ("ã", "õ")
                 and i + 1 < wlen
-                and _is_vowel(w, i + 1)
-                and not _is_semi(w, i + 1)
+                and cls[i + 1] & _V
+                and not cls[i + 1] & _S
             ):
                 begin = i
                 end = i
             elif (
                 i + 3 < wlen
-                and _is_consonant(w, i + 1)
-                and _is_consonant(w, i + 2)
-                and (_is_occlusive(w, i + 3) or _is_liquid(w, i + 3) or _is_digraph_sep(w, i + 2))
+                and cls[i + 1] & _C
+                and cls[i + 2] & _C
+                and (cls[i + 3] & _O or cls[i + 3] & _L or cls[i + 2] & _DS)
             ):
-                if _is_occlusive(w, i + 3) or _is_digraph_sep(w, i + 2):
+                if cls[i + 3] & _O or cls[i + 2] & _DS:
                     begin = i
                     end = i + 2
                 else:
@@ -431,24 +407,24 @@ def word2syllables(w: str) -> List[str]:
                     end = i + 1
             elif (
                 i + 2 < wlen
-                and (_is_semi(w, i + 1) or _is_nasal(w, i + 1) or w[i + 1] in ("s", "r", "l", "x"))
-                and _is_consonant(w, i + 2)
+                and (cls[i + 1] & _S or cls[i + 1] & _N or w[i + 1] in ("s", "r", "l", "x"))
+                and cls[i + 2] & _C
                 and w[i + 2] not in ("h", "r")
             ):
                 begin = i
                 end = i + 1
-            elif i + 3 < wlen and _is_consonant(w, i + 1) and _is_consonant(w, i + 2) and _is_vowel(w, i + 3):
+            elif i + 3 < wlen and cls[i + 1] & _C and cls[i + 2] & _C and cls[i + 3] & _V:
                 begin = i
                 end = i
-                if _is_mute_consonant(w, i + 1):
+                if cls[i + 1] & _M:
                     end = i + 1
-            elif i + 3 < wlen and _is_digraph(w, i + 1) and (_is_vowel(w, i + 3) or _is_liquid(w, i + 3)):
+            elif i + 3 < wlen and cls[i + 1] & _D and (cls[i + 3] & _V or cls[i + 3] & _L):
                 begin = i
                 end = i
-            elif i + 2 < wlen and _is_consonant(w, i + 1) and (_is_vowel(w, i + 2) or _is_liquid(w, i + 2)):
+            elif i + 2 < wlen and cls[i + 1] & _C and (cls[i + 2] & _V or cls[i + 2] & _L):
                 begin = i
                 end = i
-            elif i + 1 < wlen and _is_occlusive(w, i + 1):
+            elif i + 1 < wlen and cls[i + 1] & _O:
                 begin = i
                 end = i
             else:
@@ -461,44 +437,44 @@ def word2syllables(w: str) -> List[str]:
             if nucleo - 1 >= 0:
                 if (
                     nucleo + 3 < wlen
-                    and _is_consonant(w, nucleo - 1)
-                    and (_is_digraph(w, nucleo + 1) or (w[nucleo + 1] == "c" and w[nucleo + 2] == "h"))
-                    and _is_vowel(w, nucleo + 3)
+                    and cls[nucleo - 1] & _C
+                    and (cls[nucleo + 1] & _D or (w[nucleo + 1] == "c" and w[nucleo + 2] == "h"))
+                    and cls[nucleo + 3] & _V
                 ):
                     begin = i
                     end = nucleo
                 elif (
                     nucleo + 1 < wlen
-                    and _is_consonant(w, nucleo - 1)
+                    and cls[nucleo - 1] & _C
                     and nucleo + 2 < wlen
-                    and _is_consonant(w, nucleo + 1)
-                    and _is_vowel(w, nucleo + 2)
+                    and cls[nucleo + 1] & _C
+                    and cls[nucleo + 2] & _V
                 ):
                     begin = i
                     end = nucleo
                 elif (
                     nucleo + 3 < wlen
-                    and _is_consonant(w, nucleo - 1)
-                    and _is_semi(w, nucleo + 1)
+                    and cls[nucleo - 1] & _C
+                    and cls[nucleo + 1] & _S
                     and w[nucleo + 2] == "s"
-                    and _is_occlusive(w, nucleo + 3)
+                    and cls[nucleo + 3] & _O
                 ):
                     begin = i
                     end = nucleo + 2
                 elif (
                     nucleo + 3 < wlen
-                    and _is_consonant(w, nucleo - 1)
-                    and _is_semi(w, nucleo + 1)
+                    and cls[nucleo - 1] & _C
+                    and cls[nucleo + 1] & _S
                     and w[nucleo + 2] == "r"
-                    and _is_consonant(w, nucleo + 3)
+                    and cls[nucleo + 3] & _C
                 ):
                     begin = i
                     end = nucleo + 2
                 elif (
-                    ( _is_consonant(w, nucleo - 1) or _is_semi(w, nucleo - 1) )
+                    ( cls[nucleo - 1] & _C or cls[nucleo - 1] & _S )
                     and nucleo + 2 < wlen
-                    and _is_semi(w, nucleo + 1)
-                    and _is_consonant(w, nucleo + 2)
+                    and cls[nucleo + 1] & _S
+                    and cls[nucleo + 2] & _C
                     and (
                         (nucleo + 2 == wlen - 1 and w[nucleo + 2] not in ("m", "n", "r", "s"))
                         or (nucleo + 2 != wlen - 1)
@@ -508,81 +484,81 @@ def word2syllables(w: str) -> List[str]:
                     end = nucleo + 1
                 elif (
                     nucleo + 1 < wlen
-                    and _is_consonant(w, nucleo - 1)
-                    and _is_semi(w, nucleo + 1)
-                    and (nucleo + 2 >= wlen or _is_vowel(w, nucleo + 2))
+                    and cls[nucleo - 1] & _C
+                    and cls[nucleo + 1] & _S
+                    and (nucleo + 2 >= wlen or cls[nucleo + 2] & _V)
                 ):
                     begin = i
                     end = nucleo + 1
                 elif (
                     nucleo + 2 < wlen
-                    and _is_semi(w, nucleo - 1)
-                    and _is_consonant(w, nucleo + 1)
-                    and _is_vowel(w, nucleo + 2)
+                    and cls[nucleo - 1] & _S
+                    and cls[nucleo + 1] & _C
+                    and cls[nucleo + 2] & _V
                 ):
                     begin = i
                     end = nucleo - 1
-                    if nucleo - 2 >= 0 and _q_or_g_before_u(w, nucleo - 1):
+                    if nucleo - 2 >= 0 and cls[nucleo - 1] & _Q:
                         end = nucleo
-                elif _rule12_part1(w, nucleo):
+                elif _rule12_part1(w, cls, nucleo):
                     begin = i
                     end = nucleo + 1
                     if (
                         w[nucleo + 2] in ("h", "l", "r")
                         or w[nucleo + 1] == "c"
-                        or (_is_nasal(w, nucleo + 1) and _is_vowel(w, nucleo + 2))
+                        or (cls[nucleo + 1] & _N and cls[nucleo + 2] & _V)
                     ):
-                        if not _is_mute_consonant(w, nucleo + 1) and w[nucleo + 1] != w[nucleo + 2]:
+                        if not cls[nucleo + 1] & _M and w[nucleo + 1] != w[nucleo + 2]:
                             end = nucleo
                 elif (
                     nucleo + 1 < wlen
-                    and _is_consonant(w, nucleo - 1)
-                    and (_is_liquid(w, nucleo + 1) or _is_nasal(w, nucleo + 1) or w[nucleo + 1] == "i")
+                    and cls[nucleo - 1] & _C
+                    and (cls[nucleo + 1] & _L or cls[nucleo + 1] & _N or w[nucleo + 1] == "i")
                 ):
                     begin = i
                     end = nucleo + 2
                     if nucleo + 2 >= wlen:
                         end = wlen - 1
                     else:
-                        if nucleo + 3 < wlen and _q_or_g_before_u(w, nucleo + 3):
+                        if nucleo + 3 < wlen and cls[nucleo + 3] & _Q:
                             end = nucleo + 1
                 elif (
                     (w[nucleo] in ("ã", "õ"))
                     and nucleo - 1 >= 0
-                    and _is_consonant(w, nucleo - 1)
+                    and cls[nucleo - 1] & _C
                     and nucleo + 1 < wlen
                     and w[nucleo + 1] in ("o", "e")
                 ):
                     begin = i
                     end = wlen - 1
                 elif (
-                    (nucleo + 1 < wlen and _is_vowel(w, nucleo + 1))
-                    or (nucleo + 2 < wlen and _is_vowel(w, nucleo + 1) and _is_vowel(w, nucleo + 2))
+                    (nucleo + 1 < wlen and cls[nucleo + 1] & _V)
+                    or (nucleo + 2 < wlen and cls[nucleo + 1] & _V and cls[nucleo + 2] & _V)
                 ):
                     begin = i
                     end = nucleo
                     if (
                         nucleo + 4 < wlen
-                        and _is_vowel(w, nucleo + 1)
-                        and _is_semi(w, nucleo + 2)
+                        and cls[nucleo + 1] & _V
+                        and cls[nucleo + 2] & _S
                         and w[nucleo + 3] == "r"
-                        and _is_vowel(w, nucleo + 4)
+                        and cls[nucleo + 4] & _V
                     ):
                         end = nucleo + 2
                 elif (
                     nucleo + 3 < wlen
-                    and ( _is_occlusive(w, nucleo + 1) or w[nucleo + 1] in ("f", "v", "g") )
-                    and ( _is_occlusive(w, nucleo + 2) or _is_liquid(w, nucleo + 2) )
-                    and _is_vowel(w, nucleo + 3)
+                    and ( cls[nucleo + 1] & _O or w[nucleo + 1] in ("f", "v", "g") )
+                    and ( cls[nucleo + 2] & _O or cls[nucleo + 2] & _L )
+                    and cls[nucleo + 3] & _V
                 ):
                     begin = i
                     end = nucleo
-                    if _is_mute_consonant(w, nucleo + 1):
+                    if cls[nucleo + 1] & _M:
                         end = nucleo + 1
                 elif (
                     nucleo - 1 >= 0
                     and w[nucleo] == "i"
-                    and _is_consonant(w, nucleo - 1)
+                    and cls[nucleo - 1] & _C
                     and nucleo + 1 < wlen
                     and w[nucleo + 1] in ("a", "o")
                     and nucleo + 2 >= wlen
@@ -591,19 +567,19 @@ def word2syllables(w: str) -> List[str]:
                     end = nucleo
                 elif (
                     nucleo - 1 >= 0
-                    and (_is_consonant(w, nucleo - 1) or _q_or_g_before_u(w, nucleo - 1))
+                    and (cls[nucleo - 1] & _C or cls[nucleo - 1] & _Q)
                     and nucleo + 2 < wlen
-                    and _is_consonant(w, nucleo + 1)
-                    and _is_consonant(w, nucleo + 2)
+                    and cls[nucleo + 1] & _C
+                    and cls[nucleo + 2] & _C
                 ):
                     begin = i
                     end = nucleo + 2
                     if w[nucleo + 1] == w[nucleo + 2] or (w[nucleo + 1] == "s" and w[nucleo + 2] != "s"):
                         end = nucleo + 1
-                elif nucleo + 2 < wlen and _is_vowel(w, nucleo + 1) and _is_consonant(w, nucleo + 2):
+                elif nucleo + 2 < wlen and cls[nucleo + 1] & _V and cls[nucleo + 2] & _C:
                     begin = i
                     end = nucleo
-                    if nucleo + 3 < wlen and _is_vowel(w, nucleo + 3):
+                    if nucleo + 3 < wlen and cls[nucleo + 3] & _V:
                         end = nucleo + 1
                 else:
                     begin = i
@@ -613,3 +589,135 @@ def word2syllables(w: str) -> List[str]:
                 s.append(syll)
         i += 1
     return s
+
+
+# --- Cache LRU compartilhado por word2syllables e stressed_syllable ---
+# Cada entrada guarda [tonica, silabas]; ``silabas`` fica None enquanto a
+# palavra só tiver sido consultada via stressed_syllable.
+
+DEFAULT_CACHE_MAXSIZE = 100_000
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+_cache: "OrderedDict[str, list]" = OrderedDict()
+_cache_maxsize: Optional[int] = DEFAULT_CACHE_MAXSIZE
+_cache_hits = 0
+_cache_misses = 0
+_cache_evictions = 0
+
+
+def _cache_store(w: str, entry: list) -> None:
+    global _cache_evictions
+    if _cache_maxsize == 0:
+        return
+    _cache[w] = entry
+    if _cache_maxsize is not None:
+        while len(_cache) > _cache_maxsize:
+            _cache.popitem(last=False)
+            _cache_evictions += 1
+
+
+def cache_info() -> CacheInfo:
+    """Contadores do cache de silabação (acertos, faltas, remoções)."""
+    return CacheInfo(_cache_hits, _cache_misses, _cache_evictions, _cache_maxsize, len(_cache))
+
+
+def cache_clear() -> None:
+    """Esvazia o cache e zera os contadores."""
+    global _cache_hits, _cache_misses, _cache_evictions
+    _cache.clear()
+    _cache_hits = _cache_misses = _cache_evictions = 0
+
+
+def set_cache_maxsize(maxsize: Optional[int]) -> None:
+    """Define a capacidade do cache: ``None`` = ilimitado, ``0`` = desligado."""
+    global _cache_maxsize, _cache_evictions
+    if maxsize is not None and maxsize < 0:
+        raise ValueError("maxsize deve ser >= 0 ou None")
+    _cache_maxsize = maxsize
+    if maxsize is not None:
+        while len(_cache) > maxsize:
+            _cache.popitem(last=False)
+            _cache_evictions += 1
+
+
+# --- Léxico persistente opcional (ver lexicon.py) ---
+# Consultado nas faltas do cache; palavras novas são entregues a ele com
+# ``add`` para gravação em lote.
+
+_lexicon = None
+
+
+def set_lexicon(lexicon) -> None:
+    """Liga (ou desliga, com None) o léxico persistente de silabação."""
+    global _lexicon
+    _lexicon = lexicon
+
+
+def get_lexicon():
+    return _lexicon
+
+
+def _from_lexicon(w: str, entry: Optional[list]) -> Optional[list]:
+    found = _lexicon.lookup(w)
+    if found is None:
+        return None
+    if entry is None:
+        entry = [found[0], found[1]]
+        _cache_store(w, entry)
+    else:
+        entry[1] = found[1]
+        _cache.move_to_end(w)
+    return entry
+
+
+def stressed_syllable(w: str) -> int:
+    global _cache_hits, _cache_misses
+    entry = _cache.get(w)
+    if entry is not None:
+        _cache_hits += 1
+        _cache.move_to_end(w)
+        return entry[0]
+    _cache_misses += 1
+    if _lexicon is not None:
+        entry = _from_lexicon(w, None)
+        if entry is not None:
+            return entry[0]
+    stressed = _compute_stressed(w)
+    _cache_store(w, [stressed, None])
+    return stressed
+
+
+def word2syllables(w: str) -> List[str]:
+    global _cache_hits, _cache_misses
+    entry = _cache.get(w)
+    if entry is not None and entry[1] is not None:
+        _cache_hits += 1
+        _cache.move_to_end(w)
+        return list(entry[1])
+    _cache_misses += 1
+    if _lexicon is not None:
+        found = _from_lexicon(w, entry)
+        if found is not None:
+            return list(found[1])
+    cls = _classify(w)
+    if entry is None:
+        stressed = _compute_stressed(w)
+    else:
+        stressed = entry[0]
+        _cache.move_to_end(w)
+    syllables = _compute_syllables(w, stressed, cls)
+    if entry is None:
+        _cache_store(w, [stressed, tuple(syllables)])
+    else:
+        entry[1] = tuple(syllables)
+    if _lexicon is not None:
+        _lexicon.add(w, stressed, tuple(syllables))
+    return syllables
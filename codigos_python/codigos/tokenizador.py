@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Tokenizador de palavras: sequências de 3+ letras (ASCII e Latin-1) do texto
+em minúsculas.
+
+O padrão é compilado uma vez. ``iterar_palavras`` produz os tokens sob
+demanda (finditer), sem montar a lista; ``extrair_palavras`` devolve a
+lista. As duas dão exatamente a mesma sequência de tokens.
+
+Rodar como script compara com a implementação anterior em corpora reais:
+    python tokenizador.py --json PASTA --xml PASTA_DATA --txt PASTA
+"""
+from __future__ import annotations
+
+import re
+from typing import Iterator, List
+
+PADRAO_PALAVRA = re.compile(r'\b[a-zA-ZÀ-ÿ]{3,}\b')
+
+_findall = PADRAO_PALAVRA.findall
+_finditer = PADRAO_PALAVRA.finditer
+
+
+def extrair_palavras(texto) -> List[str]:
+    # texto só com espaços não tem palavras: o teste com strip() é desnecessário
+    if not texto:
+        return []
+    return _findall(texto.lower())
+
+
+def iterar_palavras(texto) -> Iterator[str]:
+    """Como extrair_palavras, mas produz um token por vez."""
+    if not texto:
+        return
+    for m in _finditer(texto.lower()):
+        yield m.group()
+
+
+def _extrair_palavras_anterior(texto):
+    # implementação original, mantida só como referência do benchmark
+    if not texto or texto.strip() == "":
+        return []
+    return re.findall(r'\b[a-zA-ZÀ-ÿ]{3,}\b', texto.lower())
+
+
+def _benchmark(textos, repeticoes=5):
+    import time
+
+    def medir(funcao):
+        melhor = float("inf")
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            for texto in textos:
+                funcao(texto)
+            melhor = min(melhor, time.perf_counter() - inicio)
+        return melhor
+
+    for texto in textos:
+        esperado = _extrair_palavras_anterior(texto)
+        if extrair_palavras(texto) != esperado or list(iterar_palavras(texto)) != esperado:
+            raise AssertionError("tokens diferentes da implementação anterior")
+
+    total = sum(len(_extrair_palavras_anterior(t)) for t in textos)
+    print(f"{len(textos)} documentos, {total} tokens (melhor de {repeticoes})")
+    base = medir(_extrair_palavras_anterior)
+    for nome, funcao in [("anterior (re.findall)", _extrair_palavras_anterior),
+                         ("extrair_palavras (lista)", extrair_palavras),
+                         ("iterar_palavras (consumido)", lambda t: sum(1 for _ in iterar_palavras(t)))]:
+        tempo = base if funcao is _extrair_palavras_anterior else medir(funcao)
+        print(f"  {nome:30s} {tempo * 1e3:9.2f} ms  x{base / tempo:.2f}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from fontes import fonte_pasta_json, fonte_pasta_texto, fonte_pastas_xml
+
+    parser = argparse.ArgumentParser(description="Micro-benchmark do tokenizador")
+    parser.add_argument("--json", action="append", default=[], help="pasta com arquivos .json")
+    parser.add_argument("--xml", action="append", default=[], help="pasta com subpastas contendo prompt.xml")
+    parser.add_argument("--txt", action="append", default=[], help="pasta com arquivos .txt")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+
+    fontes = ([fonte_pasta_json(p) for p in args.json] + [fonte_pastas_xml(p) for p in args.xml]
+              + [fonte_pasta_texto(p) for p in args.txt])
+    if not fontes:
+        parser.error("informe ao menos uma pasta")
+    textos = [texto for fonte in fontes for _, texto in fonte if texto]
+    _benchmark(textos, args.repeticoes)
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Cálculo vetorizado (NumPy) das métricas de muitos documentos de uma vez.
+
+Cada documento vira uma fatia de um vetor inteiro com o número de sílabas de
+cada palavra; proporções, sílabas por palavra e índice de complexidade saem de
+operações sobre o lote inteiro, em vez de ``if`` por palavra e aritmética
+escalar por documento. É o cálculo usado por lote.analyze_many com NumPy.
+Requer NumPy.
+"""
+from __future__ import annotations
+
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+try:
+    from .syllable import word2syllables
+    from .tokenizador import extrair_palavras
+except ImportError:
+    from syllable import word2syllables
+    from tokenizador import extrair_palavras
+
+# Mesmos nomes de AnaliseTexto, um campo por métrica.
+DTYPE_METRICAS = np.dtype([
+    ('total_palavras', np.int64),
+    ('diversidade_lexica', np.float64),
+    ('complexidade_lexica', np.float64),
+    ('proporcao_palavras_longas', np.float64),
+    ('proporcao_muito_longas', np.float64),
+    ('diversidade_silabica', np.float64),
+    ('proporcao_complexas', np.float64),
+    ('silabas_por_palavra', np.float64),
+])
+
+
+def contagens_silabicas(palavras: List[str]) -> Tuple[List[int], int]:
+    """Sílabas de cada palavra e número de sílabas distintas do documento.
+
+    Palavras em que word2syllables falha contam 0 sílabas, como em
+    analise_silabica_unifica.
+    """
+    contagens = []
+    silabas_unicas = set()
+    for palavra in palavras:
+        try:
+            silabas = word2syllables(palavra)
+        except Exception:
+            contagens.append(0)
+            continue
+        contagens.append(len(silabas))
+        silabas_unicas.update(silabas)
+    return contagens, len(silabas_unicas)
+
+
+def preparar_lote(textos: Iterable[str]):
+    """Tokeniza e silaba os textos, devolvendo as colunas de entrada do lote.
+
+    Retorna ``(contagens, comprimentos, palavras_unicas, silabas_unicas)``:
+    ``contagens`` concatena as sílabas por palavra de todos os documentos e
+    ``comprimentos`` diz quantas palavras cada documento tem.
+    """
+    contagens = []
+    comprimentos = []
+    palavras_unicas = []
+    silabas_unicas = []
+    for texto in textos:
+        palavras = extrair_palavras(texto)
+        doc_contagens, n_silabas_unicas = contagens_silabicas(palavras)
+        contagens.extend(doc_contagens)
+        comprimentos.append(len(palavras))
+        palavras_unicas.append(len(set(palavras)))
+        silabas_unicas.append(n_silabas_unicas)
+    return (np.asarray(contagens, dtype=np.int32), np.asarray(comprimentos, dtype=np.int64),
+            np.asarray(palavras_unicas, dtype=np.int64), np.asarray(silabas_unicas, dtype=np.int64))
+
+
+def metricas_lote(contagens, comprimentos, palavras_unicas, silabas_unicas, ocorrencias=None) -> np.ndarray:
+    """Métricas de todos os documentos do lote, num array estruturado (DTYPE_METRICAS).
+
+    ``contagens`` tem o número de sílabas de cada entrada, documento após
+    documento, e ``comprimentos`` quantas entradas cada documento tem. Sem
+    ``ocorrencias`` cada entrada é um token (preparar_lote); com elas cada
+    entrada é um tipo, que pesa pelo seu número de ocorrências (lote.py).
+    As contas são as de analise._metricas, sobre inteiros exatos em float64,
+    então os valores são os mesmos.
+    """
+    contagens = np.asarray(contagens)
+    comprimentos = np.asarray(comprimentos, dtype=np.int64)
+    n_docs = len(comprimentos)
+    com_entradas = comprimentos > 0
+    # início de cada documento não vazio: as fatias do reduceat vão de um início ao seguinte
+    inicios = (np.cumsum(comprimentos) - comprimentos)[com_entradas]
+
+    def soma_por_documento(valores):
+        soma = np.zeros(n_docs, dtype=np.int64)
+        if len(inicios):
+            soma[com_entradas] = np.add.reduceat(valores, inicios, dtype=np.int64)
+        return soma
+
+    if ocorrencias is None:
+        comprimento_palavras = comprimentos
+        total_silabas = soma_por_documento(contagens)
+        palavras_3silabas = soma_por_documento(contagens >= 3)
+        palavras_4silabas = soma_por_documento(contagens >= 4)
+        palavras_5silabas = soma_por_documento(contagens >= 5)
+    else:
+        ocorrencias = np.asarray(ocorrencias, dtype=np.int64)
+        comprimento_palavras = soma_por_documento(ocorrencias)
+        total_silabas = soma_por_documento(contagens * ocorrencias)
+        palavras_3silabas = soma_por_documento(np.where(contagens >= 3, ocorrencias, 0))
+        palavras_4silabas = soma_por_documento(np.where(contagens >= 4, ocorrencias, 0))
+        palavras_5silabas = soma_por_documento(np.where(contagens >= 5, ocorrencias, 0))
+
+    n = comprimento_palavras.astype(np.float64)
+    com_palavras = comprimento_palavras > 0
+    com_silabas = total_silabas > 0
+    divisor = np.where(com_palavras, n, 1.0)
+    divisor_silabas = np.where(com_silabas, total_silabas, 1)
+
+    proporcao_longas = palavras_4silabas / divisor
+    proporcao_muito_longas = palavras_5silabas / divisor
+    silabas_por_palavra = total_silabas / divisor
+
+    r = np.zeros(n_docs, dtype=DTYPE_METRICAS)
+    r['total_palavras'] = comprimento_palavras
+    r['diversidade_lexica'] = np.where(com_palavras, np.asarray(palavras_unicas) / divisor, 0.0)
+    r['complexidade_lexica'] = np.where(
+        com_palavras,
+        proporcao_longas * 0.4 + proporcao_muito_longas * 0.3
+        + np.minimum(silabas_por_palavra / 8, 1) * 0.3,
+        0.0,
+    )
+    r['proporcao_palavras_longas'] = proporcao_longas
+    r['proporcao_muito_longas'] = proporcao_muito_longas
+    r['diversidade_silabica'] = np.where(com_silabas, np.asarray(silabas_unicas) / divisor_silabas, 0.0)
+    r['proporcao_complexas'] = np.where(com_silabas, palavras_3silabas / divisor, 0.0)
+    r['silabas_por_palavra'] = np.where(com_silabas, silabas_por_palavra, 0.0)
+    return r
+
+
+def analisar_lote(textos: Iterable[str]) -> np.ndarray:
+    """preparar_lote + metricas_lote: uma linha de DTYPE_METRICAS por texto."""
+    return metricas_lote(*preparar_lote(textos))
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Vocabulário com ids inteiros densos e conjuntos de ids em bitmap.
+
+Cada palavra ou sílaba distinta é guardada uma única vez no Vocabulario e
+recebe um id (0, 1, 2, ...) na ordem em que aparece. Os conjuntos de
+distintos do corpus passam a ser ConjuntoIds, um bit por id num bytearray,
+em vez de sets de str:
+
+    vocabulario = Vocabulario()
+    palavras = ConjuntoIds()
+    analise = analisar_texto(texto, vocabulario=vocabulario)
+    palavras.adicionar(analise.palavras_unicas)     # ids de vocabulario
+    len(palavras)                   # palavras distintas
+
+A análise com um vocabulário (ver analise.analisar_ids) já interna os tokens
+na tokenização, então nenhum set de str é montado por documento; as sílabas
+de cada palavra ficam guardadas no vocabulário como ids (``partes``).
+
+Palavras e sílabas podem dividir o mesmo vocabulário (a string "a" tem um id
+só); cada uma tem o seu ConjuntoIds. Vários corpora analisados no mesmo
+processo também podem dividir um vocabulário (ver analisar_corpora.py).
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Callable, Dict, Iterable, Iterator, List
+
+# typecode de array para os ids (32 bits sem sinal)
+TIPO_ID = "I"
+
+# valores de Vocabulario._inicio_partes além das posições em _partes
+_SEM_PARTES, _FALHA = -1, -2
+
+
+class Vocabulario:
+    """Tabela string -> id denso; ``vocabulario[i]`` devolve a string do id ``i``."""
+
+    __slots__ = ("_ids", "itens", "_partes", "_inicio_partes", "_n_partes")
+
+    def __init__(self, itens: Iterable[str] = ()):
+        self._ids: Dict[str, int] = {}
+        self.itens: List[str] = []
+        # partes de cada id, em fatias de um array só: início e tamanho por id
+        self._partes = array(TIPO_ID)
+        self._inicio_partes = array("q")
+        self._n_partes = array("H")
+        for item in itens:
+            self.id(item)
+
+    def id(self, item: str) -> int:
+        """Id de ``item``, criado se ele ainda não estiver no vocabulário."""
+        i = self._ids.get(item)
+        if i is None:
+            i = self._ids[item] = len(self.itens)
+            self.itens.append(item)
+        return i
+
+    def ids(self, itens: Iterable[str]) -> array:
+        """Ids de ``itens``, na mesma ordem, num array de inteiros."""
+        if not isinstance(itens, (list, tuple)):
+            itens = list(itens)
+        ids = list(map(self._ids.get, itens))
+        if None in ids:
+            ids = [self.id(item) if i is None else i for item, i in zip(itens, ids)]
+        return array(TIPO_ID, ids)
+
+    def partes(self, i: int, dividir: Callable[[str], List[str]]) -> array:
+        """Ids das partes do item ``i`` (ex.: as sílabas de uma palavra).
+
+        ``dividir(item)`` roda uma vez por item e as partes ficam guardadas
+        como ids (alguns bytes por item); se ele falhar, a falha também fica
+        guardada e cada consulta levanta ValueError.
+        """
+        inicio = self._inicio_partes
+        if i >= len(inicio):
+            faltam = len(self.itens) - len(inicio)
+            inicio.extend([_SEM_PARTES] * faltam)
+            self._n_partes.extend([0] * faltam)
+        posicao = inicio[i]
+        if posicao == _SEM_PARTES:
+            try:
+                partes = self.ids(dividir(self.itens[i]))
+            except Exception:
+                inicio[i] = _FALHA
+                raise ValueError(f"não foi possível dividir '{self.itens[i]}'")
+            inicio[i] = len(self._partes)
+            self._n_partes[i] = len(partes)
+            self._partes.extend(partes)
+            return partes
+        if posicao == _FALHA:
+            raise ValueError(f"não foi possível dividir '{self.itens[i]}'")
+        return self._partes[posicao:posicao + self._n_partes[i]]
+
+    def __getitem__(self, i: int) -> str:
+        return self.itens[i]
+
+    def __contains__(self, item: str) -> bool:
+        return item in self._ids
+
+    def __len__(self) -> int:
+        return len(self.itens)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.itens)
+
+
+class ConjuntoIds:
+    """Conjunto de ids não negativos como bitmap; o tamanho é mantido a cada inclusão."""
+
+    __slots__ = ("bits", "n")
+
+    def __init__(self, ids: Iterable[int] = ()):
+        self.bits = bytearray()
+        self.n = 0
+        self.adicionar(ids)
+
+    def adicionar(self, ids: Iterable[int]) -> None:
+        if not isinstance(ids, (array, list, tuple)):
+            ids = list(ids)
+        if not ids:
+            return
+        bits = self.bits
+        tamanho = (max(ids) >> 3) + 1
+        if tamanho > len(bits):
+            bits.extend(bytes(max(tamanho, 2 * len(bits)) - len(bits)))
+        novos = 0
+        for i in ids:
+            byte, mascara = i >> 3, 1 << (i & 7)
+            if not bits[byte] & mascara:
+                bits[byte] |= mascara
+                novos += 1
+        self.n += novos
+
+    def combinar(self, outro: "ConjuntoIds") -> "ConjuntoIds":
+        """União com ``outro`` (ids do mesmo vocabulário); devolve ``self``."""
+        if len(outro.bits) > len(self.bits):
+            self.bits.extend(bytes(len(outro.bits) - len(self.bits)))
+        uniao = int.from_bytes(self.bits, "little") | int.from_bytes(outro.bits, "little")
+        self.bits = bytearray(uniao.to_bytes(len(self.bits), "little"))
+        self.n = bin(uniao).count("1")
+        return self
+
+    def __contains__(self, i: int) -> bool:
+        byte = i >> 3
+        return byte < len(self.bits) and bool(self.bits[byte] & (1 << (i & 7)))
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __iter__(self) -> Iterator[int]:
+        for byte, valor in enumerate(self.bits):
+            if valor:
+                for bit in range(8):
+                    if valor & (1 << bit):
+                        yield byte * 8 + bit